@@ -4,17 +4,34 @@ Professional GUI for monitoring UART communication with data validation and cont
 Version: 3.0 - Updated per feedback
 """
 
+import os
 import sys
+import time
 import serial
 import serial.tools.list_ports
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QComboBox, QPushButton, QTableWidget, QTableWidgetItem, QLabel,
+    QComboBox, QPushButton, QTableView, QLabel,
     QHeaderView, QGroupBox, QMessageBox, QRadioButton, QButtonGroup,
-    QScrollArea,QGridLayout 
+    QScrollArea,QGridLayout, QCheckBox, QFileDialog, QSlider, QDialog, QPlainTextEdit,
+    QDockWidget, QLineEdit
 )
-from PyQt5.QtCore import QTimer, Qt
-from PyQt5.QtGui import QColor, QFont, QPalette
+from PyQt5.QtCore import (
+    QAbstractTableModel, QModelIndex, QObject, QThread, QTimer, Qt, pyqtSignal
+)
+from PyQt5.QtGui import QBrush, QColor, QFont, QPalette
+
+from uartexe import CaptureWriter, FrameQueue, OverflowPolicy, PacketFramer, protocol
+from uartexe.alarms import CLEAR, RAISE, AlarmEngine
+from uartexe.decode import IN_RANGE, NO_LIMIT, OUT_OF_RANGE, MeasurementDecoder
+from uartexe.latency import CONFIRMED, UNCONFIRMED, CommandLatencyTracker
+from uartexe.metrics import PipelineMetrics
+from uartexe.replay import MAX_SPEED, ReplaySerial
+from uartexe.schema import BINARY_TEXT, MEASUREMENT, TEMPERATURE, compile_schema
+from uartexe.stats import SESSION, SignalStatistics
+from uartexe.timing import FrameTiming, byte_time_ns
+from uartexe.transmit import CommandTransmitter
+from uartexe.trigger import TriggerCapture
 
 class AppStyle:
     # Dark theme colors
@@ -43,6 +60,22 @@ class AppStyle:
     TABLE_ERROR = "#b71c1c"
     TABLE_NA = "#424242"            # Gray for N/A cells
     
+    @staticmethod
+    def button_state(background, color="white", left_aligned=False, rounded=False):
+        """Stylesheet for one visual state of a status or toggle button"""
+        rules = [
+            f"background-color: {background};",
+            f"color: {color};",
+            "font-weight: bold;",
+            "font-size: 11px;",
+        ]
+        if rounded:
+            rules.append("border-radius: 4px;")
+        if left_aligned:
+            rules += ["text-align: left;", "padding-left: 10px;"]
+        body = "\n".join(f"    {rule}" for rule in rules)
+        return f"QPushButton {{\n{body}\n}}"
+    
     @staticmethod
     def get_stylesheet():
         return """
@@ -146,7 +179,7 @@ class AppStyle:
                 font-size: 10px;
             }
             
-            QTableWidget {
+            QTableView {
                 background-color: #252526;
                 alternate-background-color: #252526;;
                 border: 1px solid #3e3e42;
@@ -155,7 +188,7 @@ class AppStyle:
                 font-size: 9px;
             }
             
-            QTableWidget::item {
+            QTableView::item {
                 padding: 4px;
             }
 
@@ -229,22 +262,529 @@ class AppStyle:
         """
 
 
+class SerialReaderThread(QThread):
+    """Background thread that blocks on the serial port and frames incoming packets"""
+
+    ERROR_BACKOFF_MS = 100
+
+    # Valid packets go into a bounded FrameQueue; the GUI thread is woken
+    # through a queued connection only when the queue was empty.
+    frames_available = pyqtSignal()
+    read_error = pyqtSignal(str)
+
+    def __init__(self, serial_port, frame_queue, parent=None):
+        super().__init__(parent)
+        self.serial_port = serial_port
+        self.frame_queue = frame_queue
+        self.framer = PacketFramer()
+        # Frames completed by one read, copied back to back for the block consumers;
+        # a read can never complete more frames than the framer buffer holds
+        self._block = bytearray(PacketFramer.CAPACITY)
+        self._block_view = memoryview(self._block)
+        self.byte_time_ns = byte_time_ns(serial_port)
+        self.error_dropped_bytes = 0
+        self.recorder = None  # CaptureWriter set by the GUI while recording
+        self.latency_tracker = None  # CommandLatencyTracker set by the GUI on live connections
+        self.timing = None  # FrameTiming set by the GUI
+        self.statistics = None  # SignalStatistics set by the GUI
+        self.alarms = None  # AlarmEngine set by the GUI
+        self.trigger = None  # TriggerCapture set by the GUI while armed
+
+    def run(self):
+        """Read until interruption is requested by the GUI"""
+        while not self.isInterruptionRequested():
+            try:
+                self._read_uart_data()
+            except Exception as e:
+                self.error_dropped_bytes += self.framer.pending
+                self.framer.reset()
+                if self.isInterruptionRequested():
+                    break
+                print(f"Read error: {e}")
+                self.read_error.emit(str(e))
+                self.msleep(self.ERROR_BACKOFF_MS)
+
+    def _read_uart_data(self):
+        """Block on the port and frame packets as soon as their bytes arrive"""
+        # read() returns after at least one byte or after the port timeout,
+        # so the loop can notice an interruption request quickly.
+        count = self.framer.readinto(self.serial_port, self.serial_port.in_waiting or 1)
+        if not count:
+            return
+
+        # Frames are recorded and matched against sent commands here, before
+        # any queue overflow policy applies
+        recorder = self.recorder
+        tracker = self.latency_tracker
+        timing = self.timing
+        statistics = self.statistics
+        alarms = self.alarms
+        trigger = self.trigger
+        collect = statistics is not None or alarms is not None or trigger is not None
+        size = 0
+        # Every frame completed by this read is stamped with the time its last byte
+        # arrived, less the line time of the bytes received after it
+        received_ns = time.monotonic_ns()
+
+        # The framer hands out views into its receive buffer; only the copy
+        # that crosses over to the GUI thread is allocated.
+        for frame in self.framer.frames():
+            frame_ns = received_ns - self.framer.pending * self.byte_time_ns
+            if recorder is not None:
+                recorder.write_frame(frame, frame_ns)
+            if tracker is not None:
+                tracker.frame_received(frame, frame_ns)
+            if timing is not None:
+                timing.add(frame_ns)
+            if collect:
+                self._block_view[size:size + protocol.PACKET_SIZE] = frame
+                size += protocol.PACKET_SIZE
+            if self.frame_queue.put(self.framer.detach(frame)):
+                self.frames_available.emit()
+        # After the frames: the recorder keeps timestamps non-decreasing, so a raw
+        # chunk stamped at the end of the read would pull every frame stamp up to it
+        if recorder is not None:
+            recorder.write_raw(self.framer.tail(count), received_ns)
+
+        # Statistics, alarms and the trigger ring take the whole read as one block,
+        # decoded in a single vector pass, so no frame escapes them whatever the display rate
+        events = ()
+        block = self._block_view[:size]
+        if size:
+            if statistics is not None:
+                statistics.update(block, received_ns)
+            if alarms is not None:
+                events = alarms.update(block, received_ns)
+        # Called for reads without a complete frame too, so checksum failure bursts are seen
+        if trigger is not None:
+            trigger.update(block, received_ns, self.framer.checksum_failures, events)
+
+
+class StatusState:
+    """Status indicator states with their text and precompiled stylesheet"""
+
+    ENABLED = "ENABLED"
+    DISABLED = "DISABLED"
+    GPU_DISABLED = "GPU_DISABLED"
+    POWER_OK = "POWER OK"
+    POWER_FAIL = "POWER FAIL"
+
+    TEXT = {
+        ENABLED: "ENABLED",
+        DISABLED: "DISABLED",
+        GPU_DISABLED: "DISABLED",
+        POWER_OK: "POWER OK",
+        POWER_FAIL: "POWER FAIL",
+    }
+
+    STYLESHEET = {
+        ENABLED: AppStyle.button_state(AppStyle.STATUS_ENABLED, left_aligned=True, rounded=True),
+        DISABLED: AppStyle.button_state(AppStyle.STATUS_DISABLED, left_aligned=True, rounded=True),
+        GPU_DISABLED: AppStyle.button_state(AppStyle.STATUS_DISABLED, "black", left_aligned=True, rounded=True),
+        POWER_OK: AppStyle.button_state(AppStyle.STATUS_ENABLED, left_aligned=True, rounded=True),
+        POWER_FAIL: AppStyle.button_state(AppStyle.STATUS_DISABLED, left_aligned=True, rounded=True),
+    }
+
+
+class RenderScheduler(QObject):
+    """Repaints at a fixed display rate with the newest frame and coalesces the rest"""
+
+    render_requested = pyqtSignal(bytes)
+
+    def __init__(self, rate_hz, parent=None):
+        super().__init__(parent)
+        self._latest = None
+        self.frames_submitted = 0
+        self.frames_rendered = 0
+        self.frames_coalesced = 0
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._on_tick)
+        self.set_rate(rate_hz)
+
+    def set_rate(self, rate_hz):
+        """Change the display refresh rate"""
+        self._timer.setInterval(max(1, round(1000 / rate_hz)))
+
+    def start(self):
+        self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
+        self._latest = None
+
+    def submit(self, frame):
+        """Keep the newest frame; a frame replaced before the next tick is coalesced"""
+        if self._latest is not None:
+            self.frames_coalesced += 1
+        self._latest = frame
+        self.frames_submitted += 1
+
+    def _on_tick(self):
+        if self._latest is None:
+            return
+        frame, self._latest = self._latest, None
+        self.frames_rendered += 1
+        self.render_requested.emit(frame)
+
+
+class TelemetryTableModel(QAbstractTableModel):
+    """
+    Table model over one telemetry frame, laid out as 3 groups of
+    #, SIGNAL, MIN, VALUE, MAX, MEANING columns with 44 rows each.
+    Decoded value/meaning cells are cached per index and only re-decoded
+    when their bytes change.
+    """
+
+    ROWS_PER_COLUMN = 44
+    COLUMN_GROUPS = 3
+    HEADERS = ['#', 'SIGNAL', 'MIN', 'VALUE', 'MAX', 'MEANING']
+    INDEX_BACKGROUND = QBrush(QColor("#224055"))
+    NA_BACKGROUND = QBrush(QColor(AppStyle.TABLE_NA))
+
+    # Column offsets inside a group
+    COL_INDEX, COL_SIGNAL, COL_MIN, COL_VALUE, COL_MAX, COL_MEANING = range(6)
+    # Position of the static columns in a static_cells entry
+    STATIC_COLUMNS = {COL_SIGNAL: 0, COL_MIN: 1, COL_MAX: 2}
+
+    def __init__(self, static_cells, initial_cells, decode_cell, pair_partners, parent=None):
+        """
+        static_cells: per index (signal name, min text, max text)
+        initial_cells: per index (value text, value color, meaning text, meaning color)
+        decode_cell: callable(index, frame) returning the same 4-tuple for a frame
+        pair_partners: second byte index -> first byte index of 16-bit pairs
+        """
+        super().__init__(parent)
+        self._static = static_cells
+        self._cells = list(initial_cells)
+        self._decode_cell = decode_cell
+        self._pair_partners = pair_partners
+        self._frame = bytearray(protocol.PACKET_SIZE)
+        self._has_frame = False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.ROWS_PER_COLUMN
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS) * self.COLUMN_GROUPS
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section % len(self.HEADERS)]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        group, col = divmod(index.column(), len(self.HEADERS))
+        i = group * self.ROWS_PER_COLUMN + index.row()
+        if i >= len(self._cells):
+            return None
+
+        if role == Qt.DisplayRole:
+            if col == self.COL_INDEX:
+                return str(i)
+            if col == self.COL_VALUE:
+                return self._cells[i][0]
+            if col == self.COL_MEANING:
+                return self._cells[i][2]
+            return self._static[i][self.STATIC_COLUMNS[col]]
+
+        if role == Qt.BackgroundRole:
+            if col == self.COL_INDEX:
+                return self.INDEX_BACKGROUND
+            if col == self.COL_VALUE:
+                return self._cells[i][1]
+            if col == self.COL_MEANING:
+                return self._cells[i][3]
+            if col in (self.COL_MIN, self.COL_MAX) and self._static[i][self.STATIC_COLUMNS[col]] == "N/A":
+                return self.NA_BACKGROUND
+            return None
+
+        if role == Qt.TextAlignmentRole and col == self.COL_INDEX:
+            return Qt.AlignCenter
+        return None
+
+    def set_frame(self, packet):
+        """Load a new frame, re-decode the changed cells and notify the views"""
+        frame = self._frame
+        size = len(self._cells)
+        if not self._has_frame:
+            changed = set(range(size))
+            self._has_frame = True
+        else:
+            changed = set()
+            for i in range(size):
+                if frame[i] != packet[i]:
+                    changed.add(i)
+                    # The first byte of a 16-bit pair shows the decoded pair value
+                    if i in self._pair_partners:
+                        changed.add(self._pair_partners[i])
+
+        frame[:] = packet
+        if not changed:
+            return changed
+
+        for i in changed:
+            self._cells[i] = self._decode_cell(i, frame)
+        self._emit_changed(sorted(changed))
+        return changed
+
+    def refresh(self, indices):
+        """Re-decode the given indices of the current frame, e.g. when their alarm state changes"""
+        if not self._has_frame or not indices:
+            return
+        indices = sorted(indices)
+        for i in indices:
+            self._cells[i] = self._decode_cell(i, self._frame)
+        self._emit_changed(indices)
+
+    def _emit_changed(self, indices):
+        """Emit one dataChanged per run of consecutive rows inside a column group"""
+        roles = [Qt.DisplayRole, Qt.BackgroundRole]
+        start = prev = indices[0]
+        for i in indices[1:] + [None]:
+            if i is not None and i == prev + 1 and i % self.ROWS_PER_COLUMN:
+                prev = i
+                continue
+            group, first_row = divmod(start, self.ROWS_PER_COLUMN)
+            last_row = prev % self.ROWS_PER_COLUMN
+            base = group * len(self.HEADERS)
+            self.dataChanged.emit(self.index(first_row, base + self.COL_VALUE),
+                                  self.index(last_row, base + self.COL_MEANING), roles)
+            start = prev = i
+
+
+class TimedTableView(QTableView):
+    """Table view that records how long each repaint takes"""
+
+    def __init__(self, latency_window, parent=None):
+        super().__init__(parent)
+        self.latency_window = latency_window
+
+    def paintEvent(self, event):
+        started = time.perf_counter_ns()
+        super().paintEvent(event)
+        self.latency_window.add((time.perf_counter_ns() - started) / 1000)
+
+
+class StatisticsTableModel(QAbstractTableModel):
+    """Per-channel count/min/max/mean/std of one statistics scope"""
+
+    HEADERS = ['SIGNAL', 'UNIT', 'N', 'MIN', 'MAX', 'MEAN', 'STD']
+    STATS = ('min', 'max', 'mean', 'std')
+
+    def __init__(self, names, units, parent=None):
+        super().__init__(parent)
+        self._names = names
+        self._units = units
+        self._rows = [("", "", "", "", "")] * len(names)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return self._names[row]
+            if col == 1:
+                return self._units[row]
+            return self._rows[row][col - 2]
+        if role == Qt.TextAlignmentRole and col >= 2:
+            return Qt.AlignRight | Qt.AlignVCenter
+        return None
+
+    def set_result(self, result):
+        """Show a SignalStatistics scope result"""
+        count = str(result['count'])
+        columns = [[f"{value:.4f}" if value == value else "N/A" for value in result[stat].tolist()]
+                   for stat in self.STATS]
+        self._rows = [(count, *values) for values in zip(*columns)]
+        self.dataChanged.emit(self.index(0, 2), self.index(len(self._names) - 1, len(self.HEADERS) - 1),
+                              [Qt.DisplayRole])
+
+
+class AlarmLogModel(QAbstractTableModel):
+    """Alarm events, newest first"""
+
+    HEADERS = ['TIME', 'SIGNAL', 'EVENT', 'SIDE', 'VALUE', 'LIMIT', 'EXTREME']
+    EVENT_BRUSHES = {
+        RAISE: QBrush(QColor(AppStyle.TABLE_ERROR)),
+        CLEAR: QBrush(QColor(AppStyle.TABLE_SUCCESS)),
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._kinds = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.BackgroundRole and index.column() == 2:
+            return self.EVENT_BRUSHES[self._kinds[index.row()]]
+        return None
+
+    def set_events(self, events, units, wall_offset_ns):
+        """Show AlarmEvents; monotonic timestamps are shown as wall clock time"""
+        self.beginResetModel()
+        self._rows = []
+        self._kinds = []
+        for event in reversed(events):
+            seconds = (event.timestamp_ns + wall_offset_ns) / 1e9
+            unit = units[event.channel]
+            self._rows.append((
+                time.strftime("%H:%M:%S", time.localtime(seconds)) + f".{int(seconds * 1000) % 1000:03d}",
+                event.name, event.kind, event.side,
+                f"{event.value:.3f} {unit}", f"{event.limit:.3f} {unit}", f"{event.extreme:.3f} {unit}",
+            ))
+            self._kinds.append(event.kind)
+        self.endResetModel()
+
+
+class FrameTimingDialog(QDialog):
+    """Live inter-frame interval histogram with JSON export"""
+
+    BAR_WIDTH = 40
+
+    def __init__(self, timing, parent=None):
+        super().__init__(parent)
+        self.timing = timing
+        self.setWindowTitle("FRAME TIMING")
+        self.resize(640, 480)
+        layout = QVBoxLayout(self)
+
+        self.summary_label = QLabel("")
+        self.summary_label.setStyleSheet("font-weight: bold; font-size: 11px;")
+        layout.addWidget(self.summary_label)
+
+        self.histogram_text = QPlainTextEdit()
+        self.histogram_text.setReadOnly(True)
+        self.histogram_text.setFont(QFont("Consolas", 9))
+        layout.addWidget(self.histogram_text)
+
+        buttons = QHBoxLayout()
+        reset_btn = QPushButton("↺ RESET")
+        reset_btn.clicked.connect(self._reset)
+        buttons.addWidget(reset_btn)
+        export_btn = QPushButton("💾 EXPORT")
+        export_btn.clicked.connect(self._export)
+        buttons.addWidget(export_btn)
+        buttons.addStretch()
+        layout.addLayout(buttons)
+
+    def refresh(self):
+        """Redraw the summary and histogram"""
+        t = self.timing.snapshot()
+        self.summary_label.setText(
+            f"FRAMES {t['frames']}  |  PERIOD {t['period_ms']:.2f} ms  |  "
+            f"INTERVAL min {t['min_ms']:.2f} / mean {t['mean_ms']:.2f} / std {t['std_ms']:.2f} / "
+            f"p50 {t['p50_ms']:.2f} / p99 {t['p99_ms']:.2f} / max {t['max_ms']:.2f} ms  |  "
+            f"GAPS {t['gaps']} (~{t['missed_frames']} MISSED)")
+        bins = self.timing.histogram_bins()
+        peak = max((count for _, _, count in bins), default=1)
+        lines = [f"{low:9.3f} - {high:9.3f} ms {count:9d} {'#' * max(1, round(count / peak * self.BAR_WIDTH))}"
+                 for low, high, count in bins]
+        self.histogram_text.setPlainText("\n".join(lines))
+
+    def _reset(self):
+        self.timing.reset()
+        self.refresh()
+
+    def _export(self):
+        default_name = time.strftime("frame_timing_%Y%m%d_%H%M%S.json")
+        path, _ = QFileDialog.getSaveFileName(self, "EXPORT FRAME TIMING", default_name,
+                                              "JSON (*.json);;All files (*)")
+        if not path:
+            return
+        try:
+            self.timing.export(path)
+        except OSError as e:
+            QMessageBox.critical(self, 'Export Error', f'Failed to export frame timing: {str(e)}')
+            return
+        print(f"Frame timing exported to {path}")
+
+
 class UARTMonitor(QMainWindow):
     """Main application window for UART monitoring"""
     
+    # Emitted from the transmitter thread when a command write fails
+    command_error = pyqtSignal(str)
+    zeroize_sent = pyqtSignal(str)
+    
     # Constants
     WINDOW_TITLE = "KAANGES ETC TEST SW"
     WINDOW_WIDTH = 1800
     WINDOW_HEIGHT = 950
-    TIMER_INTERVAL = 100 
-    PACKET_SIZE = 133
-    DATA_SIZE = 132
+    FRAME_QUEUE_SIZE = 64
+    
+    # Cached table brushes shared by every cell
+    BRUSH_OK = QBrush(QColor(AppStyle.TABLE_SUCCESS))
+    BRUSH_ERROR = QBrush(QColor(AppStyle.TABLE_ERROR))
+    BRUSH_NA = QBrush(QColor(AppStyle.TABLE_NA))
+    LIMIT_BRUSHES = {IN_RANGE: BRUSH_OK, OUT_OF_RANGE: BRUSH_ERROR, NO_LIMIT: BRUSH_NA}
+    
+    # (label, telemetry index, state when bit 7 is set, state when clear)
+    STATUS_INDICATORS = [
+        ("SATA0", 32, StatusState.ENABLED, StatusState.DISABLED),
+        ("SATA1", 39, StatusState.ENABLED, StatusState.DISABLED),
+        ("GPU STATUS", 46, StatusState.ENABLED, StatusState.GPU_DISABLED),
+        ("PMON STATUS", 25, StatusState.POWER_OK, StatusState.POWER_FAIL),
+    ]
+    
+    # Precompiled control button stylesheets, indexed by checked state
+    DISC_OUT_STYLES = {
+        True: AppStyle.button_state(AppStyle.SUCCESS),
+        False: AppStyle.button_state(AppStyle.STATUS_NA),
+    }
+    LED_COLORS = [("R", "#e53935"), ("G", "#43a047"), ("B", "#1e88e5")]
+    LED_ENABLED_STYLE = AppStyle.button_state(AppStyle.SUCCESS, left_aligned=True)
+    LED_DISABLED_STYLES = {color: AppStyle.button_state(AppStyle.STATUS_NA, color, left_aligned=True)
+                           for _, color in LED_COLORS}
+    DISPLAY_RATES = ['10 Hz', '30 Hz', '60 Hz']
+    DEFAULT_DISPLAY_RATE = '30 Hz'
+    KEEP_LATEST_FRAMES = 8
+    REPLAY_SPEEDS = ['0.25x', '1x', '2x', '10x', '100x', 'MAX']
+    DEFAULT_REPLAY_SPEED = '1x'
+    REPLAY_SLIDER_STEPS = 1000
+    METRICS_INTERVAL_MS = 1000
+    METRICS_WINDOW_S = 5.0
+    COMMAND_COALESCE_S = 0.05
+    COMMAND_CONFIRM_TIMEOUT_S = 1.0
+    COMMAND_BUDGET_MS = 200  # confirmations slower than this are flagged
+    WRITE_TIMEOUT_S = 1.0
+    ZEROIZE_TARGETS = {protocol.SATA_ZEROIZE_SATA1: "SATA1", protocol.SATA_ZEROIZE_BOTH: "SATA0 & SATA1"}
+    PACKET_SIZE = protocol.PACKET_SIZE
+    DATA_SIZE = protocol.DATA_SIZE
     
     # Protocol constants
-    HEADER_1 = 0x41
-    HEADER_2 = 0x56
-    PACKET_LENGTH = 0x85
-    PACKET_ID = 0x02
+    HEADER_1 = protocol.HEADER_1
+    HEADER_2 = protocol.HEADER_2
+    PACKET_LENGTH = protocol.PACKET_LENGTH
+    PACKET_ID = protocol.PACKET_ID
     
     def __init__(self):
         super().__init__()
@@ -252,98 +792,36 @@ class UARTMonitor(QMainWindow):
         self.is_connected = False
         self.received_data = [0] * self.PACKET_SIZE
         self.disc_type = "OPEN/GND"  # Default disc type
-        self.sata_command_to_send = (0, 0)
-        self.read_buffer = bytearray()
-        self._init_data_limits()
+        self.sata_command_to_send = protocol.SATA_NONE
+        self.reader_thread = None
+        self.frame_queue = None
+        self.recorder = None
+        self.trigger = None
+        self.transmitter = None
+        self.latency_tracker = None
+        self.replay = None
+        self._replay_end_reported = False
+        self.schema = compile_schema()
+        self.measurement_decoder = MeasurementDecoder(self.schema)
+        self.bitfield_brushes = self._build_bitfield_brushes()
+        self._measurement_values = None
+        self._measurement_states = None
+        self.metrics = PipelineMetrics(self.METRICS_WINDOW_S)
+        self.frame_timing = FrameTiming()
+        self.statistics = SignalStatistics(self.schema)
+        self.alarms = AlarmEngine(self.schema)
+        # Schema index of every alarm channel, and the indices the table currently shows as alarmed
+        self.alarm_indices = self.alarms.decoder.indices.tolist()
+        self._active_alarms = set()
+        self._alarm_log_shown = None
+        self.timing_dialog = None
         self._init_ui()
-        self._init_timer()
-        
-    def _init_data_limits(self):
-        """Initialize data validation limits"""
-        self.data_limits = {
-            'min': ['N/A'] * self.DATA_SIZE,
-            'max': ['N/A'] * self.DATA_SIZE
-        }
-        
-        # UART packet header and control bytes (fixed values)
-        self._set_fixed_limits(0, self.HEADER_1)      # HEADER_1
-        self._set_fixed_limits(1, self.HEADER_2)      # HEADER_2
-        self._set_fixed_limits(2, self.PACKET_LENGTH) # LENGTH
-        self._set_fixed_limits(3, self.PACKET_ID)     # PACKET_ID
-        
-        
-        # 2-byte measurement pairs - only first byte has limits
-        # Second byte is marked as N/A (will be grayed out)
-        voltage_current_power_pairs = [
-            (26, 27),   # LTC4281_CPU_12_VOLTAGE
-            (28, 29),   # LTC4281_CPU_12_CURRENT
-            (30, 31),   # LTC4281_CPU_12_POWER
-            (33, 34),   # LTC4281_SATA0_3V3_VOLTAGE
-            (35, 36),   # LTC4281_SATA0_3V3_CURRENT
-            (37, 38),   # LTC4281_SATA0_3V3_POWER
-            (40, 41),   # LTC4281_SATA1_3V3_VOLTAGE
-            (42, 43),   # LTC4281_SATA1_3V3_CURRENT
-            (44, 45),   # LTC4281_SATA1_3V3_POWER
-            (47, 48),   # LTC4281_GPU_12V_VOLTAGE
-            (49, 50),   # LTC4281_GPU_12V_CURRENT
-            (51, 52),   # LTC4281_GPU_12V_POWER
-            (54, 55),   # LTC4281_GPU_5V_VOLTAGE
-            (56, 57),   # LTC4281_GPU_5V_CURRENT
-            (58, 59),   # LTC4281_GPU_5V_POWER
-            (61, 62),   # LTC4281_GPU_3V3_VOLTAGE
-            (63, 64),   # LTC4281_GPU_3V3_CURRENT
-            (65, 66),   # LTC4281_GPU_3V3_POWER
-            (67, 68),   # INA260_PWR_BOARD_24V_VOLTAGE
-            (69, 70),   # INA260_PWR_BOARD_24V_CURRENT
-            (71, 72),   # INA260_PWR_BOARD_24V_POWER
-            (73, 74),   # INA260_PMON_3V3_VOLTAGE
-            (75, 76),   # INA260_PMON_3V3_CURRENT
-            (77, 78),   # INA260_PMON_3V3_POWER
-        ]
-        
-        # Set limits for first byte of each pair
-        for first_byte, second_byte in voltage_current_power_pairs:
-            self.data_limits['min'][first_byte] = 0
-            self.data_limits['max'][first_byte] = 255
-
-            # 2. Apply the specific voltage limit values
-            if first_byte in [26, 47]:   
-                self.data_limits['min'][first_byte] = 10.8
-                self.data_limits['max'][first_byte] = 13.2
-            elif first_byte in [33, 40, 61, 73]:  
-                self.data_limits['min'][first_byte] = 2.97
-                self.data_limits['max'][first_byte] = 3.63
-            elif first_byte in [54]:  
-                self.data_limits['min'][first_byte] = 4.5
-                self.data_limits['max'][first_byte] = 5.5
-            elif first_byte in [67]: 
-                self.data_limits['min'][first_byte] = 21.6
-                self.data_limits['max'][first_byte] = 26.4
-
-            # 2. Apply the specific current limit values
-            elif first_byte in [28, 49]:  
-                self.data_limits['min'][first_byte] = "N/A"
-                self.data_limits['max'][first_byte] = 4
-            elif first_byte in [75]:  
-                self.data_limits['min'][first_byte] = "N/A"
-                self.data_limits['max'][first_byte] = 1 
-            elif first_byte in [35, 42]:  
-                self.data_limits['min'][first_byte] = "N/A"
-                self.data_limits['max'][first_byte] = 3 
-            elif first_byte in [63, 56]:  
-                self.data_limits['min'][first_byte] = "N/A"
-                self.data_limits['max'][first_byte] = 2 
-            
-
-
-        
-        # Temperature sensor indices (always green)
-        self.temp_indices = [79, 80, 81, 82, 83, 84, 85]
-        
-    def _set_fixed_limits(self, index, value):
-        """Set min and max to the same value for fixed fields"""
-        self.data_limits['min'][index] = value
-        self.data_limits['max'][index] = value
+        self._init_render_scheduler()
+        self._init_statistics_dock()
+        self._init_alarm_dock()
+        self._init_metrics()
+        self.command_error.connect(self._on_command_error)
+        self.zeroize_sent.connect(self._on_zeroize_sent)
         
     def _init_ui(self):
         """Initialize the user interface"""
@@ -360,13 +838,16 @@ class UARTMonitor(QMainWindow):
         
         # Connection panel
         main_layout.addWidget(self._create_connection_panel())
+        self.replay_panel = self._create_replay_panel()
+        self.replay_panel.hide()
+        main_layout.addWidget(self.replay_panel)
         
         # Content: Table and control panel
         content_layout = QHBoxLayout()
         content_layout.setSpacing(10)
         
-        self.table_widget = self._create_data_table()
-        content_layout.addWidget(self.table_widget, stretch=7)
+        self.table_view = self._create_data_table()
+        content_layout.addWidget(self.table_view, stretch=7)
         
         # Right side: Status indicators and controls with scroll
         scroll_area = QScrollArea()
@@ -402,11 +883,235 @@ class UARTMonitor(QMainWindow):
         
         main_layout.addLayout(content_layout)
         
-    def _init_timer(self):
-        """Initialize the data reading timer"""
-        self.timer = QTimer()
-        self.timer.timeout.connect(self._read_uart_data)
+    def _init_render_scheduler(self):
+        """Initialize the display-rate render scheduler"""
+        self.render_scheduler = RenderScheduler(self._display_rate_hz(), self)
+        self.render_scheduler.render_requested.connect(self._render_packet)
+
+    def _init_metrics(self):
+        """Pipeline metrics in the status bar, refreshed once per interval"""
+        self.metrics_label = QLabel("")
+        self.metrics_label.setStyleSheet(f"color: {AppStyle.TEXT_SECONDARY}; font-weight: bold; font-size: 11px;")
+        self.statusBar().addWidget(self.metrics_label, 1)
+        self.statusBar().setStyleSheet(f"background-color: {AppStyle.SURFACE}; border-top: 1px solid {AppStyle.BORDER};")
+        self.metrics_timer = QTimer(self)
+        self.metrics_timer.timeout.connect(self._update_metrics)
+        self.metrics_timer.start(self.METRICS_INTERVAL_MS)
+        self._update_metrics()
+
+    def _update_metrics(self):
+        """Sample the reader and queue counters and show rates and stage timings"""
+        # Batched capture records and a finished post-trigger window would otherwise
+        # wait for the next frame on an idle link
+        recorder = self.recorder
+        if recorder is not None:
+            recorder.flush()
+        if self.trigger is not None:
+            self.trigger.poll(time.monotonic_ns())
+        if self.reader_thread is not None:
+            framer = self.reader_thread.framer
+            self.metrics.sample(bytes=framer.bytes_received,
+                                frames=framer.valid_frames,
+                                checksum_failures=framer.checksum_failures,
+                                discarded_bytes=framer.discarded_bytes,
+                                dropped_frames=self.frame_queue.dropped_frames)
+        m = self.metrics.snapshot()
+        text = (f"RX {m['bytes_per_s'] / 1000:.1f} kB/s  |  {m['frames_per_s']:.1f} FRAMES/s  |  "
+                f"CHECKSUM FAIL {m['checksum_failures']} ({m['checksum_failures_per_s']:.1f}/s)  |  "
+                f"RESYNC {m['discarded_bytes']} B ({m['discarded_bytes_per_s']:.0f} B/s)  |  "
+                f"OVERFLOW DROPS {m['dropped_frames']}  |  "
+                f"DECODE p50 {m['decode_p50_us']:.0f} / p99 {m['decode_p99_us']:.0f} µs  |  "
+                f"RENDER p50 {m['render_p50_us']:.0f} / p99 {m['render_p99_us']:.0f} µs")
+        tx = self.transmitter
+        if tx is not None:
+            text += (f"  |  TX {tx.packets_sent} PKTS ({tx.changes_coalesced} COALESCED)  |  "
+                     f"TX QUEUE {tx.depth} (MAX {tx.max_depth})  |  "
+                     f"WRITE p99 {tx.write_times.percentile(99):.0f} / MAX {tx.max_write_us:.0f} µs")
+        t = self.frame_timing.snapshot()
+        text += (f"  |  INTERVAL p50 {t['p50_ms']:.1f} / p99 {t['p99_ms']:.1f} / MAX {t['max_ms']:.1f} ms  |  "
+                 f"GAPS {t['gaps']} (~{t['missed_frames']} MISSED)")
+        if self.timing_dialog is not None and self.timing_dialog.isVisible():
+            self.timing_dialog.refresh()
+        if self.statistics_dock.isVisible():
+            self._refresh_statistics()
+        if self.alarm_dock.isVisible():
+            self._refresh_alarm_log()
+        active_alarms = len(self._active_alarms)
+        text += f"  |  ALARMS ACTIVE {active_alarms}  |  ALARM EVENTS {self.alarms.total_events}"
+        warn = t['gaps'] > 0 or active_alarms > 0
+        if self.trigger is not None:
+            g = self.trigger.snapshot()
+            text += (f"  |  TRIGGERS {g['triggers']}  |  CAPTURES {len(g['captures'])}"
+                     f"{' (COLLECTING)' if g['collecting'] else ''}")
+            warn = warn or g['write_errors'] > 0 or g['captures_dropped'] > 0
+        tracker = self.latency_tracker
+        if tracker is not None:
+            tracker.expire()
+            c = tracker.snapshot()
+            text += (f"  |  CMD RTT p50 {c['p50_ms']:.1f} / p99 {c['p99_ms']:.1f} / MAX {c['max_ms']:.1f} ms  |  "
+                     f"CONFIRMED {c['confirmed']}  |  UNCONFIRMED {c['unconfirmed']}  |  "
+                     f"OVER BUDGET {c['over_budget']}")
+            warn = warn or c['unconfirmed'] or c['over_budget']
+            self.metrics_label.setToolTip("COMMAND → TELEMETRY LATENCY\n" + "\n".join(
+                f"{label:>10}: {count}" for label, count in c['histogram']))
+        if self.metrics_label.text() != text:
+            self.metrics_label.setText(text)
+            link_errors = m['checksum_failures_per_s'] or m['discarded_bytes_per_s']
+            color = AppStyle.WARNING if link_errors or warn else AppStyle.TEXT_SECONDARY
+            self.metrics_label.setStyleSheet(f"color: {color}; font-weight: bold; font-size: 11px;")
+
+    def _init_statistics_dock(self):
+        """Side panel with per-signal session and sliding-window statistics"""
+        self.statistics_dock = QDockWidget("📊 SIGNAL STATISTICS", self)
+        self.statistics_dock.setObjectName("statistics_dock")
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.setContentsMargins(5, 5, 5, 5)
+        
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("SCOPE:"))
+        self.statistics_scope_combo = QComboBox()
+        self.statistics_scope_combo.addItems(self.statistics.scopes)
+        self.statistics_scope_combo.currentTextChanged.connect(self._refresh_statistics)
+        controls.addWidget(self.statistics_scope_combo)
+        reset_btn = QPushButton("↺ RESET")
+        reset_btn.clicked.connect(self._reset_statistics)
+        controls.addWidget(reset_btn)
+        export_btn = QPushButton("💾 EXPORT")
+        export_btn.clicked.connect(self._export_statistics)
+        controls.addWidget(export_btn)
+        controls.addStretch()
+        layout.addLayout(controls)
+        
+        self.statistics_model = StatisticsTableModel(self.statistics.names, self.statistics.units, self)
+        table = QTableView()
+        table.setModel(self.statistics_model)
+        table.verticalHeader().setVisible(False)
+        table.verticalHeader().setDefaultSectionSize(20)
+        font = QFont()
+        font.setPointSize(8)
+        table.setFont(font)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        layout.addWidget(table)
         
+        self.statistics_dock.setWidget(widget)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.statistics_dock)
+        self.statistics_dock.hide()
+        self.statistics_dock.visibilityChanged.connect(self.stats_btn.setChecked)
+
+    def _toggle_statistics(self, checked):
+        """Show or hide the statistics panel"""
+        self.statistics_dock.setVisible(checked)
+        if checked:
+            self._refresh_statistics()
+
+    def _refresh_statistics(self):
+        """Show the selected scope; sliding windows end now, so they empty out when frames stop"""
+        scope = self.statistics_scope_combo.currentText()
+        self.statistics_model.set_result(self.statistics.snapshot(time.monotonic_ns())[scope])
+
+    def _reset_statistics(self):
+        self.statistics.reset()
+        self._refresh_statistics()
+
+    def _export_statistics(self):
+        """Write every scope of every signal to a CSV soak report"""
+        default_name = time.strftime("statistics_%Y%m%d_%H%M%S.csv")
+        path, _ = QFileDialog.getSaveFileName(self, "EXPORT STATISTICS", default_name,
+                                              "CSV (*.csv);;All files (*)")
+        if not path:
+            return
+        try:
+            self.statistics.export_csv(path, time.monotonic_ns())
+        except OSError as e:
+            QMessageBox.critical(self, 'Export Error', f'Failed to export statistics: {str(e)}')
+            return
+        print(f"Statistics exported to {path}")
+
+    def _init_alarm_dock(self):
+        """Side panel with the filterable alarm event log"""
+        self.alarm_dock = QDockWidget("🚨 ALARM LOG", self)
+        self.alarm_dock.setObjectName("alarm_dock")
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.setContentsMargins(5, 5, 5, 5)
+        
+        controls = QHBoxLayout()
+        self.alarm_filter_edit = QLineEdit()
+        self.alarm_filter_edit.setPlaceholderText("FILTER SIGNAL, e.g. 12V or 3V3")
+        self.alarm_filter_edit.textChanged.connect(self._refresh_alarm_log)
+        controls.addWidget(self.alarm_filter_edit)
+        self.alarm_kind_combo = QComboBox()
+        self.alarm_kind_combo.addItems(['ALL', RAISE, CLEAR])
+        self.alarm_kind_combo.currentTextChanged.connect(self._refresh_alarm_log)
+        controls.addWidget(self.alarm_kind_combo)
+        clear_btn = QPushButton("🗑 CLEAR LOG")
+        clear_btn.clicked.connect(self._clear_alarm_log)
+        controls.addWidget(clear_btn)
+        layout.addLayout(controls)
+        
+        self.alarm_log_model = AlarmLogModel(self)
+        table = QTableView()
+        table.setModel(self.alarm_log_model)
+        table.verticalHeader().setVisible(False)
+        table.verticalHeader().setDefaultSectionSize(20)
+        font = QFont()
+        font.setPointSize(8)
+        table.setFont(font)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        layout.addWidget(table)
+        
+        self.alarm_dock.setWidget(widget)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.alarm_dock)
+        self.alarm_dock.hide()
+        self.alarm_dock.visibilityChanged.connect(self.alarms_btn.setChecked)
+
+    def _toggle_alarm_log(self, checked):
+        """Show or hide the alarm log"""
+        self.alarm_dock.setVisible(checked)
+        if checked:
+            self._refresh_alarm_log()
+
+    def _refresh_alarm_log(self):
+        """Rebuild the log when new events arrived or the filter changed"""
+        text = self.alarm_filter_edit.text().strip().upper()
+        kind = self.alarm_kind_combo.currentText()
+        key = (self.alarms.total_events, len(self.alarms.events), text, kind)
+        if key == self._alarm_log_shown:
+            return
+        self._alarm_log_shown = key
+        events = [event for event in self.alarms.snapshot()["events"]
+                  if (kind == 'ALL' or event.kind == kind) and text in event.name]
+        self.alarm_log_model.set_events(events, self.alarms.units, time.time_ns() - time.monotonic_ns())
+
+    def _clear_alarm_log(self):
+        self.alarms.clear_events()
+        self._refresh_alarm_log()
+
+    def _update_alarm_cells(self):
+        """Keep alarmed cells red until their alarm clears, even if the bytes do not change"""
+        active = {self.alarm_indices[channel] for channel in self.alarms.active_channels()}
+        if active != self._active_alarms:
+            changed = active ^ self._active_alarms
+            self._active_alarms = active
+            self.table_model.refresh(changed)
+
+    def _show_timing(self):
+        """Open the live frame timing view"""
+        if self.timing_dialog is None:
+            self.timing_dialog = FrameTimingDialog(self.frame_timing, self)
+        self.timing_dialog.refresh()
+        self.timing_dialog.show()
+        self.timing_dialog.raise_()
+
+    def _display_rate_hz(self):
+        """Selected display refresh rate in Hz"""
+        return int(self.display_rate_combo.currentText().split()[0])
+
+    def _set_display_rate(self):
+        """Apply the selected display refresh rate"""
+        self.render_scheduler.set_rate(self._display_rate_hz())
+
     def _create_connection_panel(self):
         """Create the connection configuration panel"""
         panel = QGroupBox("⚡ CONNECTION SETTINGS")
@@ -418,6 +1123,7 @@ class UARTMonitor(QMainWindow):
         layout.addWidget(QLabel("PORT:"))
         self.com_combo = QComboBox()
         self.com_combo.setMinimumWidth(200)
+        self.com_combo.setEditable(True)  # allows typing a pty path, e.g. the simulator's
         self._refresh_com_ports()
         layout.addWidget(self.com_combo)
         
@@ -429,6 +1135,23 @@ class UARTMonitor(QMainWindow):
         self.baud_combo.setCurrentText('115200')
         layout.addWidget(self.baud_combo)
         
+        # Frame queue overflow policy
+        layout.addWidget(QLabel("OVERFLOW:"))
+        self.overflow_combo = QComboBox()
+        self.overflow_combo.setMinimumWidth(130)
+        self.overflow_combo.addItems(OverflowPolicy.ALL)
+        self.overflow_combo.currentTextChanged.connect(self._set_overflow_policy)
+        layout.addWidget(self.overflow_combo)
+        
+        # Table refresh rate, independent of the telemetry packet rate
+        layout.addWidget(QLabel("DISPLAY:"))
+        self.display_rate_combo = QComboBox()
+        self.display_rate_combo.setMinimumWidth(80)
+        self.display_rate_combo.addItems(self.DISPLAY_RATES)
+        self.display_rate_combo.setCurrentText(self.DEFAULT_DISPLAY_RATE)
+        self.display_rate_combo.currentTextChanged.connect(self._set_display_rate)
+        layout.addWidget(self.display_rate_combo)
+        
         # Refresh button
         refresh_btn = QPushButton("🔄 REFRESH")
         refresh_btn.setMinimumWidth(100)
@@ -451,26 +1174,116 @@ class UARTMonitor(QMainWindow):
         self.connect_btn.clicked.connect(self._toggle_connection)
         layout.addWidget(self.connect_btn)
         
+        # Replay a recorded capture through the same reader path
+        replay_btn = QPushButton("▶ REPLAY")
+        replay_btn.setMinimumWidth(100)
+        replay_btn.clicked.connect(self._start_replay)
+        layout.addWidget(replay_btn)
+        
+        # Inter-frame timing histogram
+        timing_btn = QPushButton("⏱ TIMING")
+        timing_btn.setMinimumWidth(100)
+        timing_btn.clicked.connect(self._show_timing)
+        layout.addWidget(timing_btn)
+        
+        # Per-signal statistics side panel
+        self.stats_btn = QPushButton("📊 STATS")
+        self.stats_btn.setMinimumWidth(100)
+        self.stats_btn.setCheckable(True)
+        self.stats_btn.clicked.connect(self._toggle_statistics)
+        layout.addWidget(self.stats_btn)
+        
+        # Alarm event log side panel
+        self.alarms_btn = QPushButton("🚨 ALARMS")
+        self.alarms_btn.setMinimumWidth(100)
+        self.alarms_btn.setCheckable(True)
+        self.alarms_btn.clicked.connect(self._toggle_alarm_log)
+        layout.addWidget(self.alarms_btn)
+        
         # Status label
         self.status_label = QLabel("● DISCONNECTED")
         self.status_label.setStyleSheet(f"color: {AppStyle.ERROR}; font-weight: bold; font-size: 11px;")
         layout.addWidget(self.status_label)
         
+        # Capture recording of received frames and sent commands
+        self.record_btn = QPushButton("⏺ RECORD")
+        self.record_btn.setMinimumWidth(110)
+        self.record_btn.setCheckable(True)
+        self.record_btn.clicked.connect(self._toggle_recording)
+        layout.addWidget(self.record_btn)
+        
+        self.record_raw_check = QCheckBox("RAW")
+        self.record_raw_check.setToolTip("Also record every raw received chunk")
+        layout.addWidget(self.record_raw_check)
+        
+        # Pre-trigger ring that writes a capture around POWER FAIL, alarms and checksum bursts
+        self.trigger_btn = QPushButton("🎯 TRIGGER")
+        self.trigger_btn.setMinimumWidth(110)
+        self.trigger_btn.setCheckable(True)
+        self.trigger_btn.setToolTip("Write the frames around each PMON POWER FAIL, limit alarm\n"
+                                    "or checksum failure burst to a capture file")
+        self.trigger_btn.clicked.connect(self._toggle_trigger)
+        layout.addWidget(self.trigger_btn)
+        
+        # Exact count of frames/bytes lost to queue overflow or read errors
+        self.drop_label = QLabel("DROPPED: 0 FRAMES / 0 BYTES")
+        self.drop_label.setStyleSheet(f"color: {AppStyle.TEXT_SECONDARY}; font-weight: bold; font-size: 11px;")
+        layout.addWidget(self.drop_label)
+        
+        # Frames skipped by the display because a newer one arrived first
+        self.coalesced_label = QLabel("COALESCED: 0")
+        self.coalesced_label.setStyleSheet(f"color: {AppStyle.TEXT_SECONDARY}; font-weight: bold; font-size: 11px;")
+        layout.addWidget(self.coalesced_label)
+        
         layout.addStretch()
         panel.setLayout(layout)
         return panel
     
+    def _create_replay_panel(self):
+        """Create the replay control panel, shown while a capture is replayed"""
+        panel = QGroupBox("⏯ REPLAY")
+        layout = QHBoxLayout()
+        layout.setSpacing(15)
+        
+        layout.addWidget(QLabel("SPEED:"))
+        self.replay_speed_combo = QComboBox()
+        self.replay_speed_combo.setMinimumWidth(80)
+        self.replay_speed_combo.addItems(self.REPLAY_SPEEDS)
+        self.replay_speed_combo.setCurrentText(self.DEFAULT_REPLAY_SPEED)
+        self.replay_speed_combo.currentTextChanged.connect(self._set_replay_speed)
+        layout.addWidget(self.replay_speed_combo)
+        
+        self.replay_pause_btn = QPushButton("⏸ PAUSE")
+        self.replay_pause_btn.setMinimumWidth(100)
+        self.replay_pause_btn.setCheckable(True)
+        self.replay_pause_btn.clicked.connect(self._toggle_replay_pause)
+        layout.addWidget(self.replay_pause_btn)
+        
+        step_btn = QPushButton("⏭ STEP")
+        step_btn.setMinimumWidth(100)
+        step_btn.clicked.connect(self._step_replay)
+        layout.addWidget(step_btn)
+        
+        # Seek by dragging; the position is applied when the slider is released
+        self.replay_slider = QSlider(Qt.Horizontal)
+        self.replay_slider.setRange(0, self.REPLAY_SLIDER_STEPS)
+        self.replay_slider.sliderReleased.connect(self._seek_replay)
+        layout.addWidget(self.replay_slider, stretch=1)
+        
+        self.replay_label = QLabel("")
+        self.replay_label.setMinimumWidth(320)
+        self.replay_label.setStyleSheet(f"color: {AppStyle.TEXT_SECONDARY}; font-weight: bold; font-size: 11px;")
+        layout.addWidget(self.replay_label)
+        
+        panel.setLayout(layout)
+        return panel
+    
     def _create_data_table(self):
         """Create the main data table"""
-        table = QTableWidget()
-        
-        rows_per_column = 44
-        table.setRowCount(rows_per_column)
-        table.setColumnCount(18)
+        self.table_model = self._create_table_model()
+        table = TimedTableView(self.metrics.render)
+        table.setModel(self.table_model)
         
-        # Updated headers - all in English
-        headers = ['#', 'SIGNAL', 'MIN', 'VALUE', 'MAX', 'MEANING'] * 3
-        table.setHorizontalHeaderLabels(headers)
         table.verticalHeader().setVisible(False)
         
         # Set compact font
@@ -518,112 +1331,40 @@ class UARTMonitor(QMainWindow):
         header.setSectionResizeMode(11, QHeaderView.Stretch)  # MEANING
         header.setSectionResizeMode(13, QHeaderView.Stretch)  # SIGNAL
         header.setSectionResizeMode(17, QHeaderView.Stretch)  # MEANING
-            
-        self._populate_table(table)
         
-        # '#' sütunlarını ortalama ve arka plan rengi ayarlama
-        for row in range(rows_per_column):
-            for col in [0, 6, 12]:  # '#' sütunları (0, 6, 12)
-                item = table.item(row, col)
-                if item:
-                    item.setTextAlignment(Qt.AlignCenter)
-                    item.setBackground(QColor("#224055"))  
-        
-        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setEditTriggers(QTableView.NoEditTriggers)
         
         return table
     
-    def _populate_table(self, table):
-        """Populate the table with initial data"""
-        signal_names = self._get_signal_names()
-        rows_per_column = 44
-        
-        for i in range(self.DATA_SIZE):
-            col_group = i // rows_per_column
-            row = i % rows_per_column
-            
-            if col_group < 3:
-                base_col = col_group * 6
-                
-                # Index
-                table.setItem(row, base_col, QTableWidgetItem(str(i)))
-                
-                # Signal name
-                table.setItem(row, base_col + 1, 
-                            QTableWidgetItem(signal_names.get(i, f"DATA_{i}")))
-                
-                # Check if this is a second byte of a 2-byte pair (should be grayed out)
-                is_second_byte = self._is_second_byte_of_pair(i)
-                
-                # Min value
-                min_val = self.data_limits['min'][i]
-                if min_val == 'N/A':
-                    min_item = QTableWidgetItem("N/A")
-                    min_item.setBackground(QColor(AppStyle.TABLE_NA))
-                else:
-                    if i <=3 :
-                        min_item = QTableWidgetItem(f"0x{min_val:02X}")
-                    else:
-                        min_item = QTableWidgetItem(str(min_val))
-                table.setItem(row, base_col + 2, min_item)
-                
-                # Current value with color coding
-                
-                value_item = QTableWidgetItem("0")
-            
-                value_item.setBackground(self._get_value_color(i, 0))
-                table.setItem(row, base_col + 3, value_item)
-                
-                # Max value
-                max_val = self.data_limits['max'][i]
-                if max_val == 'N/A':
-                    max_item = QTableWidgetItem("N/A")
-                    max_item.setBackground(QColor(AppStyle.TABLE_NA))
-                else:
-                    if i <=3 :
-                        max_item = QTableWidgetItem(f"0x{max_val:02X}")
-                    else:
-                        max_item = QTableWidgetItem(str(max_val))
-                table.setItem(row, base_col + 4, max_item)
-                
-                # Meaning
-                meaning_item = QTableWidgetItem("N/A")
-                table.setItem(row, base_col + 5, meaning_item)
+    def _create_table_model(self):
+        """Create the telemetry table model with the static signal/limit columns"""
+        schema = self.schema
+        static_cells = list(zip(schema.names, schema.min_text, schema.max_text))
+        initial_cells = [("0", self._get_value_color(i, 0), "N/A", None)
+                         for i in range(self.DATA_SIZE)]
+        return TelemetryTableModel(static_cells, initial_cells, self._decode_cell,
+                                   schema.pair_partners, self)
     
-    def _is_second_byte_of_pair(self, index):
-        """Check if this index is the second byte of a 2-byte measurement pair"""
-        second_bytes = [27, 29, 31, 34, 36, 38, 41, 43, 45, 48, 50, 52, 
-                       55, 57, 59, 62, 64, 66, 68, 70, 72, 74, 76, 78]
-        return index in second_bytes
+    def _build_bitfield_brushes(self):
+        """Per-index 256-entry MEANING brush tables for bitfield status bytes"""
+        tables = [None] * self.DATA_SIZE
+        by_errors = {}
+        for i in self.schema.bitfield_indices:
+            errors = self.schema.bitfield_error[i]
+            if id(errors) not in by_errors:
+                by_errors[id(errors)] = [self.BRUSH_ERROR if is_error else self.BRUSH_NA
+                                         for is_error in errors]
+            tables[i] = by_errors[id(errors)]
+        return tables
     
     def _get_value_color(self, index, value):
-        """Determine the appropriate color for a value"""
-        # Temperature sensors - always green
-        if index in self.temp_indices:
-            # Valid range - green
-            if -45 <= value <= 105:
-                return QColor(27, 94, 32)
-            else:
-                return QColor(183, 28, 28)
-        
-        min_val = self.data_limits['min'][index]
-        max_val = self.data_limits['max'][index]
-        
-        # N/A values
-        if min_val == 'N/A' and max_val == 'N/A':
-            return QColor(66, 66, 66)  # Gray for N/A
-        
-        elif min_val == 'N/A' and max_val != 'N/A':
-            if value <= max_val:
-                return QColor(27, 94, 32)
-            else:
-                return QColor(183, 28, 28)
-        # Valid range - green
-        elif min_val <= value <= max_val:
-            return QColor(27, 94, 32)
-
-        # Out of range - red (error)
-        return QColor(183, 28, 28)
+        """Determine the appropriate (cached) brush for a value"""
+        if index in self._active_alarms:
+            return self.BRUSH_ERROR
+        in_limits = self.schema.limit_state(index, value)
+        if in_limits is None:
+            return self.BRUSH_NA  # Gray for N/A
+        return self.BRUSH_OK if in_limits else self.BRUSH_ERROR
     
     def _create_status_panel(self):
         """Create the status indicator panel - Updated per feedback"""
@@ -634,32 +1375,16 @@ class UARTMonitor(QMainWindow):
         layout.setSpacing(6)
         
         self.status_buttons = []
-        # Updated labels: SATA0, SATA1, GPU, PMON
-        status_labels = ["SATA0", "SATA1", "GPU STATUS", "PMON STATUS"]
+        # Current StatusState of each button; None until the first packet
+        self.status_states = [None] * len(self.STATUS_INDICATORS)
         
-        for idx, label in enumerate(status_labels):
+        for idx, (label, _, _, off_state) in enumerate(self.STATUS_INDICATORS):
             # Set initial text based on button type
-            if "PMON" in label:
-                initial_text = f"● {label}\nPOWER FAIL"
-            else:
-                initial_text = f"● {label}\nDISABLED"
-            
-            btn = QPushButton(initial_text)
+            btn = QPushButton(f"● {label}\n{StatusState.TEXT[off_state]}")
             btn.setEnabled(False)
             btn.setMinimumHeight(45)
             btn.setMaximumHeight(50)
-            # Initial state depends on the type
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {AppStyle.STATUS_DISABLED};
-                    color: white;
-                    font-weight: bold;
-                    font-size: 11px;
-                    border-radius: 4px;
-                    text-align: left;
-                    padding-left: 10px;
-                }}
-            """)
+            btn.setStyleSheet(StatusState.STYLESHEET[StatusState.DISABLED])
 
             self.status_buttons.append(btn)
 
@@ -857,9 +1582,7 @@ class UARTMonitor(QMainWindow):
         layout.setSpacing(4)
         
         self.led_buttons = []
-        led_data = [("R", "#e53935"), ("G", "#43a047"), ("B", "#1e88e5")]
-        
-        for name, color in led_data:
+        for name, color in self.LED_COLORS:
             btn = QPushButton(f"● LED {name}\nDISABLED")
             btn.setCheckable(True)
             btn.setMinimumHeight(36)
@@ -909,9 +1632,9 @@ class UARTMonitor(QMainWindow):
         
         if reply == QMessageBox.Yes:
             # Set the one-shot command and send the packet
-            self.sata_command_to_send = (0xAA, 0x55)
+            self.sata_command_to_send = protocol.SATA_ZEROIZE_SATA1
+            # Confirmed by _on_zeroize_sent once the packet is written
             self._build_and_send_command_packet()
-            QMessageBox.information(self, 'INFO', 'SATA1 Zeroize command sent.')
     
     def _activate_satas(self):
         """Activate both SATA0 and SATA1 with confirmation"""
@@ -926,79 +1649,75 @@ class UARTMonitor(QMainWindow):
         
         if reply == QMessageBox.Yes:
             # Set the one-shot command and send the packet
-            self.sata_command_to_send = (0xBB, 0x44)
+            self.sata_command_to_send = protocol.SATA_ZEROIZE_BOTH
+            # Confirmed by _on_zeroize_sent once the packet is written
             self._build_and_send_command_packet()
-            QMessageBox.information(self, 'INFO', 'SATA0 & SATA1 Zeroize command sent.')
             
     def _build_and_send_command_packet(self):
         """
-        Gathers the current state of all UI controls, builds the 37-byte command packet,
-        calculates the checksum, and sends it via UART.
+        Gathers the current state of all UI controls and hands it to the command
+        transmitter, which builds the 37-byte command packet and sends it via UART
+        on its own thread. Control changes are coalesced; a pending SATA zeroize
+        command always goes out in its own packet.
         """
         if not self.is_connected:
             QMessageBox.warning(self, 'WARNING', 'NOT CONNECTED! PLEASE CONNECT FIRST.')
             return
 
-        # Initialize a 37-byte packet with all zeros.
-        command_packet = bytearray(37)
-
-        # Bytes 0-4: Headers, Packet length, ID
-        command_packet[0] = self.HEADER_1
-        command_packet[1] = self.HEADER_2
-        command_packet[2] = 37  # Packet length
-        command_packet[3] = 0x01 # ID
-        command_packet[36] = 0xAA # ID
-
         # Byte 4: Sense Select
-        if self.disc_type == "OPEN/28V":
-            command_packet[4] = 0x01
-        else: # OPEN/GND
-            command_packet[4] = 0x00
+        sense_select = (protocol.SENSE_OPEN_28V if self.disc_type == "OPEN/28V"
+                        else protocol.SENSE_OPEN_GND)
 
         # Byte 5: Disc Out Drives
         disc_out_byte = 0
         for i, button in enumerate(self.disc_out_buttons):
             if button.isChecked():
                 disc_out_byte |= (1 << i)  # Set bit 'i' to 1
-        command_packet[5] = disc_out_byte
-
-        # Bytes 6 & 7: SATA Zeroize Command
-        # This is set by _activate_sata... functions right before sending.
-        command_packet[6] = self.sata_command_to_send[0]
-        command_packet[7] = self.sata_command_to_send[1]
-
-        # Byte 8: Zeroize SATA LSB (Assuming this is a separate flag, not used by buttons)
-        # Kept as 0 for now as per your description.
-        command_packet[8] = 0 
 
         # Byte 9: LED Control
         led_byte = 0
-        if self.led_buttons[0].isChecked(): led_byte |= 0b001  # Red LED
-        if self.led_buttons[1].isChecked(): led_byte |= 0b010  # Green LED
-        if self.led_buttons[2].isChecked(): led_byte |= 0b100  # Blue LED
-        command_packet[9] = led_byte
+        for button, bit in zip(self.led_buttons, (protocol.LED_RED, protocol.LED_GREEN, protocol.LED_BLUE)):
+            if button.isChecked():
+                led_byte |= bit
 
-        # Bytes 10-35 are already 0 (Reserved)
+        self.transmitter.set_controls(sense_select, disc_out_byte, led_byte)
 
-        # Byte 36: Checksum
-        # İlk 36 baytın (indeks 0'dan 35'e kadar) toplamını hesapla.
-        data_sum = sum(command_packet[0:36])
-        
-        # İki'nin tümleyeni checksum'ını hesapla.
-        # (-data_sum) negatif bir sayı üretir.
-        # & 0xFF ise bu sayının 8-bit'lik (0-255) karşılığını alır.
-        checksum = (-data_sum) & 0xFF
-        command_packet[36] = checksum
+        # Bytes 6 & 7 are set by _activate_sata... functions right before sending.
+        if self.sata_command_to_send != protocol.SATA_NONE:
+            self.transmitter.zeroize(self.sata_command_to_send)
 
-        # --- Send the final packet ---
-        try:
-            self.serial_port.write(command_packet)
-            print(f"Sent Packet: {' '.join(f'{b:02X}' for b in command_packet)}")
-        except Exception as e:
-            QMessageBox.critical(self, 'Send Error', f'Failed to send command: {str(e)}')
-        
-        # Reset one-shot commands after sending
-        self.sata_command_to_send = (0, 0)
+        # Reset one-shot commands after queueing
+        self.sata_command_to_send = protocol.SATA_NONE
+
+    def _on_command_sent(self, packet, sent_ns):
+        """Called on the transmitter thread after each successful write"""
+        recorder = self.recorder
+        if recorder is not None:
+            recorder.write_tx(packet, sent_ns)
+        tracker = self.latency_tracker
+        if tracker is not None:
+            tracker.command_sent(packet, sent_ns)
+        print(f"Sent Packet: {' '.join(f'{b:02X}' for b in packet)}")
+        target = self.ZEROIZE_TARGETS.get((packet[6], packet[7]))
+        if target is not None:
+            self.zeroize_sent.emit(target)
+
+    def _on_command_event(self, outcome, sent_ns, latency_ms, packet):
+        """Log the outcome of a command whose confirmation was tracked"""
+        if outcome == CONFIRMED:
+            over = " (OVER BUDGET)" if latency_ms > self.COMMAND_BUDGET_MS else ""
+            print(f"Command confirmed in {latency_ms:.1f} ms{over}: DISC_OUT={packet[5] & 0x0F:04b}")
+        elif outcome == UNCONFIRMED:
+            print(f"WARNING: command not confirmed within {self.COMMAND_CONFIRM_TIMEOUT_S:.1f} s: "
+                  f"DISC_OUT={packet[5] & 0x0F:04b}")
+
+    def _on_zeroize_sent(self, target):
+        """Confirm a zeroize command once its packet has been written to the port"""
+        QMessageBox.information(self, 'INFO', f'{target} Zeroize command sent.')
+
+    def _on_command_error(self, message):
+        """Report a failed command write"""
+        QMessageBox.critical(self, 'Send Error', f'Failed to send command: {message}')
 
     
     def _refresh_com_ports(self):
@@ -1021,34 +1740,280 @@ class UARTMonitor(QMainWindow):
             port_text = self.com_combo.currentText().split(' - ')[0]
             baud_rate = int(self.baud_combo.currentText())
             
-            self.serial_port = serial.Serial(port_text, baud_rate, timeout=0.1, parity=serial.PARITY_EVEN)
-            self.is_connected = True
-            
-            self.connect_btn.setText("⏸ DISCONNECT")
-            self.connect_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {AppStyle.ERROR};
-                    font-weight: bold;
-                    font-size: 11px;
-                }}
-                QPushButton:hover {{
-                    background-color: #d32f2f;
-                }}
-            """)
-            self.status_label.setText("● CONNECTED")
-            self.status_label.setStyleSheet(f"color: {AppStyle.SUCCESS}; font-weight: bold; font-size: 11px;")
+            self.serial_port = serial.Serial(port_text, baud_rate, timeout=0.1, parity=serial.PARITY_EVEN,
+                                             write_timeout=self.WRITE_TIMEOUT_S)
+            self._show_connected("● CONNECTED")
             
-            self.timer.start(self.TIMER_INTERVAL)
+            self._start_reader()
             
         except Exception as e:
             self.status_label.setText(f"● ERROR: {str(e)}")
             self.status_label.setStyleSheet(f"color: {AppStyle.ERROR}; font-weight: bold; font-size: 11px;")
     
+    def _show_connected(self, status_text):
+        """Switch the connection panel to the connected state"""
+        self.is_connected = True
+        self.connect_btn.setText("⏸ DISCONNECT")
+        self.connect_btn.setStyleSheet(f"""
+            QPushButton {{
+                background-color: {AppStyle.ERROR};
+                font-weight: bold;
+                font-size: 11px;
+            }}
+            QPushButton:hover {{
+                background-color: #d32f2f;
+            }}
+        """)
+        self.status_label.setText(status_text)
+        self.status_label.setStyleSheet(f"color: {AppStyle.SUCCESS}; font-weight: bold; font-size: 11px;")
+    
+    def _replay_speed(self):
+        """Selected replay speed factor, MAX_SPEED for as fast as possible"""
+        text = self.replay_speed_combo.currentText()
+        return MAX_SPEED if text == 'MAX' else float(text.rstrip('x'))
+    
+    def _start_replay(self):
+        """Replay a capture file through the reader thread instead of a serial port"""
+        path, _ = QFileDialog.getOpenFileName(self, "REPLAY CAPTURE", "",
+                                              "UART capture (*.uxcap);;All files (*)")
+        if not path:
+            return
+        if self.is_connected:
+            self._disconnect_serial()
+        try:
+            self.replay = ReplaySerial(path, self._replay_speed())
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self, 'Replay Error', f'Failed to open capture: {str(e)}')
+            return
+        
+        self.serial_port = self.replay
+        self._replay_end_reported = False
+        self.replay_pause_btn.setChecked(False)
+        self.replay_pause_btn.setText("⏸ PAUSE")
+        self.replay_slider.setValue(0)
+        self.replay_panel.setTitle(f"⏯ REPLAY: {os.path.basename(path)}")
+        self.replay_panel.show()
+        self._show_connected("● REPLAY")
+        self._start_reader()
+        self._update_replay_label()
+    
+    def _set_replay_speed(self):
+        """Apply the selected replay speed"""
+        if self.replay is not None:
+            self.replay.set_speed(self._replay_speed())
+    
+    def _toggle_replay_pause(self, checked):
+        """Pause or resume the replay"""
+        if self.replay is None:
+            return
+        if checked:
+            self.replay.pause()
+            self.replay_pause_btn.setText("▶ RESUME")
+        else:
+            self.replay.resume()
+            self.replay_pause_btn.setText("⏸ PAUSE")
+    
+    def _step_replay(self):
+        """Pause the replay and release one more record"""
+        if self.replay is None:
+            return
+        self.replay.step()
+        self.replay_pause_btn.setChecked(True)
+        self.replay_pause_btn.setText("▶ RESUME")
+    
+    def _seek_replay(self):
+        """Jump to the slider position"""
+        if self.replay is None:
+            return
+        self.replay.seek_fraction(self.replay_slider.value() / self.REPLAY_SLIDER_STEPS)
+        self._replay_end_reported = False
+        self._update_replay_label()
+    
+    def _update_replay_label(self):
+        """Show the replay position and delivery rate"""
+        replay = self.replay
+        elapsed = (replay.position_ns - replay.capture.start_ns) / 1e9
+        total = (replay.capture.end_ns - replay.capture.start_ns) / 1e9
+        text = (f"{time.strftime('%H:%M:%S', time.gmtime(elapsed))} / "
+                f"{time.strftime('%H:%M:%S', time.gmtime(total))} | "
+                f"{replay.records_per_second:,.0f} REC/S")
+        if self.replay_label.text() != text:
+            self.replay_label.setText(text)
+        if not self.replay_slider.isSliderDown():
+            self.replay_slider.setValue(int(replay.progress * self.REPLAY_SLIDER_STEPS))
+        if replay.at_end and not self._replay_end_reported:
+            self._replay_end_reported = True
+            print(f"Replay finished: {replay.records_played} records at "
+                  f"{replay.records_per_second:,.0f} records/s")
+    
+    def _start_reader(self):
+        """Start the background reader thread for the open serial port"""
+        self.frame_queue = FrameQueue(self.FRAME_QUEUE_SIZE,
+                                      self.overflow_combo.currentText(),
+                                      self.KEEP_LATEST_FRAMES)
+        self.reader_thread = SerialReaderThread(self.serial_port, self.frame_queue)
+        self.reader_thread.recorder = self.recorder
+        if self.trigger is not None:
+            self.trigger.reset()
+            self.reader_thread.trigger = self.trigger
+        # Timing and statistics restart with each connection and stay readable after disconnecting
+        self.frame_timing.reset()
+        self.reader_thread.timing = self.frame_timing
+        self.statistics.reset()
+        self.reader_thread.statistics = self.statistics
+        self.alarms.reset()
+        self.reader_thread.alarms = self.alarms
+        # Replayed telemetry cannot confirm commands, which go nowhere during replay
+        if self.replay is None:
+            self.latency_tracker = CommandLatencyTracker(timeout=self.COMMAND_CONFIRM_TIMEOUT_S,
+                                                         budget_ms=self.COMMAND_BUDGET_MS,
+                                                         on_event=self._on_command_event)
+            self.reader_thread.latency_tracker = self.latency_tracker
+        self.metrics.reset()
+        self.reader_thread.frames_available.connect(self._drain_frames)
+        self.reader_thread.read_error.connect(self._on_read_error)
+        self.reader_thread.start()
+        self.transmitter = CommandTransmitter(self.serial_port, self.COMMAND_COALESCE_S,
+                                              on_sent=self._on_command_sent,
+                                              on_error=self.command_error.emit)
+        self.render_scheduler.start()
+
+    def _stop_reader(self):
+        """Stop the reader thread and wait for its blocking read to return"""
+        self.render_scheduler.stop()
+        self.metrics.reset()
+        if self.transmitter is not None:
+            # Queued zeroize commands still go out; a stalled write is bounded by the write timeout
+            self.transmitter.close(self.WRITE_TIMEOUT_S)
+            self.transmitter = None
+        self.latency_tracker = None
+        if self.reader_thread is not None:
+            # Closing the queue releases a reader blocked by the BLOCK policy
+            self.frame_queue.close()
+            self.reader_thread.requestInterruption()
+            self.reader_thread.wait()
+            self.reader_thread = None
+        # A capture still collecting post-trigger frames is written with what it has
+        if self.trigger is not None:
+            self.trigger.flush()
+
+    def _toggle_recording(self):
+        """Start or stop recording to a capture file"""
+        if self.recorder is None:
+            self._start_recording()
+        else:
+            self._stop_recording()
+
+    def _start_recording(self):
+        """Ask for a capture file and start recording frames and sent commands"""
+        default_name = time.strftime("capture_%Y%m%d_%H%M%S.uxcap")
+        path, _ = QFileDialog.getSaveFileName(self, "RECORD CAPTURE", default_name,
+                                              "UART capture (*.uxcap);;All files (*)")
+        if not path:
+            self.record_btn.setChecked(False)
+            return
+        try:
+            self.recorder = CaptureWriter(path, record_raw=self.record_raw_check.isChecked())
+        except OSError as e:
+            self.record_btn.setChecked(False)
+            QMessageBox.critical(self, 'Record Error', f'Failed to open capture file: {str(e)}')
+            return
+        if self.reader_thread is not None:
+            self.reader_thread.recorder = self.recorder
+        self.record_raw_check.setEnabled(False)
+        self.record_btn.setChecked(True)
+        self.record_btn.setText("⏹ STOP REC")
+        self.record_btn.setStyleSheet(f"background-color: {AppStyle.ERROR}; font-weight: bold;")
+        print(f"Recording to {path}")
+
+    def _stop_recording(self):
+        """Stop recording and close the capture file"""
+        if self.recorder is None:
+            return
+        if self.reader_thread is not None:
+            self.reader_thread.recorder = None
+        recorder, self.recorder = self.recorder, None
+        recorder.close()
+        self.record_raw_check.setEnabled(True)
+        self.record_btn.setChecked(False)
+        self.record_btn.setText("⏺ RECORD")
+        self.record_btn.setStyleSheet("")
+        print(f"Recorded {recorder.frames_written} frames "
+              f"({recorder.bytes_written} bytes) to {recorder.path}")
+
+    def _toggle_trigger(self):
+        """Arm or disarm triggered captures"""
+        if self.trigger is None:
+            self._arm_trigger()
+        else:
+            self._disarm_trigger()
+
+    def _arm_trigger(self):
+        """Ask for a folder and start keeping the pre-trigger ring"""
+        directory = QFileDialog.getExistingDirectory(self, "TRIGGERED CAPTURE FOLDER", os.getcwd())
+        if not directory:
+            self.trigger_btn.setChecked(False)
+            return
+        self.trigger = TriggerCapture(directory)
+        if self.reader_thread is not None:
+            self.reader_thread.trigger = self.trigger
+        self.trigger_btn.setChecked(True)
+        self.trigger_btn.setText("⏹ DISARM")
+        self.trigger_btn.setStyleSheet(f"background-color: {AppStyle.WARNING}; font-weight: bold;")
+        print(f"Triggered captures armed, writing to {directory}")
+
+    def _disarm_trigger(self):
+        """Stop triggering and write a capture still in progress"""
+        if self.trigger is None:
+            return
+        if self.reader_thread is not None:
+            self.reader_thread.trigger = None
+        trigger, self.trigger = self.trigger, None
+        trigger.close()
+        self.trigger_btn.setChecked(False)
+        self.trigger_btn.setText("🎯 TRIGGER")
+        self.trigger_btn.setStyleSheet("")
+        print(f"Triggered captures disarmed after {len(trigger.captures)} captures")
+
+    def _set_overflow_policy(self, policy):
+        """Apply the selected overflow policy to the running frame queue"""
+        if self.frame_queue is not None:
+            self.frame_queue.set_policy(policy)
+
+    def _drain_frames(self):
+        """Process every frame queued by the reader thread"""
+        if self.frame_queue is None:
+            return
+        for packet in self.frame_queue.get_all():
+            self._process_packet(packet)
+        self._update_drop_label()
+        if self.replay is not None:
+            self._update_replay_label()
+
+    def _update_drop_label(self):
+        """Show the exact number of dropped frames and bytes"""
+        dropped_bytes = self.frame_queue.dropped_bytes
+        if self.reader_thread is not None:
+            dropped_bytes += self.reader_thread.error_dropped_bytes
+        text = f"DROPPED: {self.frame_queue.dropped_frames} FRAMES / {dropped_bytes} BYTES"
+        if self.drop_label.text() != text:
+            self.drop_label.setText(text)
+            color = AppStyle.WARNING if dropped_bytes else AppStyle.TEXT_SECONDARY
+            self.drop_label.setStyleSheet(f"color: {color}; font-weight: bold; font-size: 11px;")
+
+    def _on_read_error(self, message):
+        """Show reader thread errors in the status label"""
+        self.status_label.setText(f"● ERROR: {message}")
+        self.status_label.setStyleSheet(f"color: {AppStyle.ERROR}; font-weight: bold; font-size: 11px;")
+
     def _disconnect_serial(self):
         """Close serial connection"""
-        self.timer.stop()
+        self._stop_reader()
         if self.serial_port:
             self.serial_port.close()
+        if self.replay is not None:
+            self.replay = None
+            self.replay_panel.hide()
         
         self.is_connected = False
         self.connect_btn.setText("🔌 CONNECT")
@@ -1064,246 +2029,80 @@ class UARTMonitor(QMainWindow):
         """)
         self.status_label.setText("● DISCONNECTED")
         self.status_label.setStyleSheet(f"color: {AppStyle.ERROR}; font-weight: bold; font-size: 11px;")
-    
-    def _read_uart_data(self):
-        """Read and process UART data with proper buffering"""
-        if not self.serial_port or not self.serial_port.is_open:
-            return
-        
-        try:
-            # Gelen tüm veriyi buffer'a ekle
-            if self.serial_port.in_waiting > 0:
-                new_data = self.serial_port.read(self.serial_port.in_waiting)
-                self.read_buffer.extend(new_data)
-                
-            
-            # Buffer'da yeterli veri var mı kontrol et
-            while len(self.read_buffer) >= self.PACKET_SIZE:
-                # Header'ları ara
-                header_found = False
-                
-                for i in range(len(self.read_buffer) - self.PACKET_SIZE + 1):
-                    # Header kontrolü
-                    if (self.read_buffer[i] == self.HEADER_1 and 
-                        self.read_buffer[i+1] == self.HEADER_2):
-                        # Tam bir paket çıkar
-                        packet = bytes(self.read_buffer[i:i+self.PACKET_SIZE])
-                        
-                        # Paketi doğrula
-                        if self._validate_packet(packet):
-                            # Geçerli paket bulundu
-                            self._process_packet(packet)
-                            
-                            # İşlenen veriyi buffer'dan sil
-                            self.read_buffer = self.read_buffer[i+self.PACKET_SIZE:]
-                            header_found = True
-                            break
-                        else:
-                            # Checksum hatalı, bir sonraki byte'dan devam et
-                            continue
-                
-                # Header bulunamadıysa buffer'ı temizle
-                if not header_found:
-                    # İlk byte'ı at ve tekrar dene
-                    if len(self.read_buffer) > 0:
-                        self.read_buffer.pop(0)
-                    else:
-                        break
-                
-            # Buffer çok büyüdüyse temizle 
-            if len(self.read_buffer) > self.PACKET_SIZE * 3:
-                print("Buffer overflow, temizleniyor...")
-                self.read_buffer.clear()
-        
-                
-        except Exception as e:
-            print(f"Read error: {e}")
-            self.read_buffer.clear()
-        
-    def _validate_packet(self, packet):
-        """
-        Validates the packet using the Two's Complement checksum method.
-        Checks if the sum of ALL 133 bytes is zero (in 8-bit).
-        """
-        if len(packet) != self.PACKET_SIZE:
-            return False
 
-        # Paketin tamamını (133 byte) topla ve sonucun 8-bitlik değerinin
-        # sıfır olup olmadığını kontrol et.
-        if sum(packet) & 0xFF == 0:
-            return True
-        else:
-            return False
+    def closeEvent(self, event):
+        """Stop the reader thread and close any capture before the window is destroyed"""
+        if self.is_connected:
+            self._disconnect_serial()
+        self._stop_recording()
+        self._disarm_trigger()
+        super().closeEvent(event)
     
     def _process_packet(self, packet):
-        """Process received packet data"""
+        """Process every received packet; repainting is left to the render scheduler"""
+        self.render_scheduler.submit(packet)
+
+    def _render_packet(self, packet):
+        """Repaint the table and indicators with the newest packet"""
+        started = time.perf_counter_ns()
         # Transfer the incoming packet data to the received_data list.
         for i in range(self.DATA_SIZE):
             if i < len(packet):
                 self.received_data[i] = packet[i]
         
+        # All V/I/P pairs are decoded and limit-checked in one vector pass
+        values = self.measurement_decoder.decode(packet)
+        self._measurement_values = values.tolist()
+        self._measurement_states = self.measurement_decoder.limit_states(values).tolist()
+        
         # These functions will now be called with the correct data.
-        self._update_table()
+        self.table_model.set_frame(packet)
+        self._update_alarm_cells()
+        self.metrics.decode.add((time.perf_counter_ns() - started) / 1000)
         self._update_status_buttons()
         self._update_disc_in_status()
-
-
-        
-    def _update_table(self):
-        """Update table with new data"""
-        rows_per_column = 44
-        
-        for i in range(self.DATA_SIZE):
-            col_group = i // rows_per_column
-            row = i % rows_per_column
-            second_voltage_bytes = [26,33,40,47,54,61,67,73]
-            second_current_bytes = [28,35,42,49,56,63,69,75]
-            second_power_bytes   = [30,37,44,51,58,65,71,77]
-
-            if col_group < 3:
-                base_col = col_group * 6
-                value = self.received_data[i]
-                next_value = self.received_data[i+1]
-                
-                # Update value
-                item = self.table_widget.item(row, base_col + 3)
-                # Update meaning
-                meaning_item = self.table_widget.item(row, base_col + 5)
-                if item:
-                    item.setText(f"0x{value:02X}")
-                    
-                
-                
-                if meaning_item:
-                    if i in second_voltage_bytes:
-                        meaning_text, voltage_value = self._get_voltage_meaning((i), value, next_value)
-                        item.setBackground(self._get_value_color(i, voltage_value))
-                        meaning_item.setBackground(self._get_value_color(i, voltage_value))
-                    elif i in second_current_bytes:
-                        meaning_text, current_value = self._get_current_meaning((i), value, next_value)
-                        item.setBackground(self._get_value_color(i, current_value))
-                        meaning_item.setBackground(self._get_value_color(i, current_value))
-                    elif i in  second_power_bytes:
-                        meaning_text, power_value = self._get_power_meaning((i), value, next_value)
-                        item.setBackground(self._get_value_color(i, power_value))
-                        meaning_item.setBackground(self._get_value_color(i, power_value))
-                    elif i in self.temp_indices:
-                        # Two's Complement dönüşümü
-                        Twos_Complement_value = value if value < 128 else value - 256
-                        meaning_text = f"{Twos_Complement_value}°C" 
-                        item.setBackground(self._get_value_color(i, Twos_Complement_value))
-                        meaning_item.setBackground(self._get_value_color(i, Twos_Complement_value))
-                    else:
-                        item.setBackground(self._get_value_color(i, value))
-                        meaning_item.setBackground(self._get_value_color(i, value))
-                        meaning_text, is_error = self._get_dynamic_meaning(i, value)
-                        # Set background color based on the error status
-                        if is_error:
-                            meaning_item.setBackground(QColor(183, 28, 28))
-                        else:
-                            meaning_item.setBackground(QColor(66, 66, 66))
-                    meaning_item.setText(meaning_text)
-                        
-                    
+        self.coalesced_label.setText(f"COALESCED: {self.render_scheduler.frames_coalesced}")
+        
+    def _decode_cell(self, i, frame):
+        """Decode the VALUE and MEANING cells of index i as (text, brush, text, brush)"""
+        value_text = f"0x{frame[i]:02X}"
+        pos = self.measurement_decoder.position.get(i)
+        if pos is not None and self._measurement_values is not None:
+            number = self._measurement_values[pos]
+            brush = self.BRUSH_ERROR if i in self._active_alarms else self.LIMIT_BRUSHES[self._measurement_states[pos]]
+            return value_text, brush, f"{number:.3f} {self.schema.unit[i]}", brush
+        
+        # Bitfield status bytes are plain table lookups
+        meaning_brushes = self.bitfield_brushes[i]
+        if meaning_brushes is not None:
+            value = frame[i]
+            return value_text, self._get_value_color(i, value), BINARY_TEXT[value], meaning_brushes[value]
+        
+        number, meaning_text, is_error = self.schema.decode(i, frame)
+        value_brush = self._get_value_color(i, number)
+        
+        # Measurements and temperatures color the meaning like the value,
+        # other bytes flag their error bits in the meaning cell
+        if self.schema.kind[i] in (MEASUREMENT, TEMPERATURE):
+            meaning_brush = value_brush
+        elif is_error:
+            meaning_brush = self.BRUSH_ERROR
+        else:
+            meaning_brush = self.BRUSH_NA
+        return value_text, value_brush, meaning_text, meaning_brush
         
     def _update_status_buttons(self):
-        """Update status indicator buttons - Updated per feedback"""
-        status_indices = [32, 39, 46, 25]  # SATA0, SATA1, GPU_12V, PMON
-        
-        for i, idx in enumerate(status_indices):
-            if idx < len(self.received_data):
-                status = self.received_data[idx]
-                is_on = (status & 0x80) != 0
-                
-                btn = self.status_buttons[i]
-                label = btn.text().split('\n')[0].replace("● ", "")
-                
-                # SATA0 and SATA1 (indices 0, 1)
-                if i in [0, 1]:
-                    if is_on:
-                        btn.setText(f"● {label}\nENABLED")
-                        btn.setStyleSheet(f"""
-                            QPushButton {{
-                                background-color: {AppStyle.STATUS_ENABLED};
-                                color: white;
-                                font-weight: bold;
-                                font-size: 11px;
-                                border-radius: 4px;
-                                text-align: left;
-                                padding-left: 10px;
-                            }}
-                        """)
-                    else:
-                        btn.setText(f"● {label}\nDISABLED")
-                        btn.setStyleSheet(f"""
-                            QPushButton {{
-                                background-color: {AppStyle.STATUS_DISABLED};
-                                color: white;
-                                font-weight: bold;
-                                font-size: 11px;
-                                border-radius: 4px;
-                                text-align: left;
-                                padding-left: 10px;
-                            }}
-                        """)
-                
-                # GPU STATUS (index 2)
-                elif i == 2:
-                    if is_on:
-                        btn.setText(f"● {label}\nENABLED")
-                        btn.setStyleSheet(f"""
-                            QPushButton {{
-                                background-color: {AppStyle.STATUS_ENABLED};
-                                color: white;
-                                font-weight: bold;
-                                font-size: 11px;
-                                border-radius: 4px;
-                                text-align: left;
-                                padding-left: 10px;
-                            }}
-                        """)
-                    else:
-                        btn.setText(f"● {label}\nDISABLED")
-                        btn.setStyleSheet(f"""
-                            QPushButton {{
-                                background-color: {AppStyle.STATUS_DISABLED};
-                                color: black;
-                                font-weight: bold;
-                                font-size: 11px;
-                                border-radius: 4px;
-                                text-align: left;
-                                padding-left: 10px;
-                            }}
-                        """)
-                
-                # PMON STATUS (index 3)
-                elif i == 3:
-                    if is_on:
-                        btn.setText(f"● {label}\nPOWER OK")
-                        btn.setStyleSheet(f"""
-                            QPushButton {{
-                                background-color: {AppStyle.STATUS_ENABLED};
-                                color: white;
-                                font-weight: bold;
-                                font-size: 11px;
-                                border-radius: 4px;
-                                text-align: left;
-                                padding-left: 10px;
-                            }}
-                        """)
-                    else:
-                        btn.setText(f"● {label}\nPOWER FAIL")
-                        btn.setStyleSheet(f"""
-                            QPushButton {{
-                                background-color: {AppStyle.STATUS_DISABLED};
-                                color: white;
-                                font-weight: bold;
-                                font-size: 11px;
-                                border-radius: 4px;
-                                text-align: left;
-                                padding-left: 10px;
-                            }}
-                        """)
+        """Update status indicator buttons, restyling only on state transitions"""
+        for i, (label, idx, on_state, off_state) in enumerate(self.STATUS_INDICATORS):
+            is_on = (self.received_data[idx] & 0x80) != 0
+            state = on_state if is_on else off_state
+            if state == self.status_states[i]:
+                continue
+            
+            self.status_states[i] = state
+            btn = self.status_buttons[i]
+            btn.setText(f"● {label}\n{StatusState.TEXT[state]}")
+            btn.setStyleSheet(StatusState.STYLESHEET[state])
     
     def _update_disc_in_status(self):
         """Update DISC_IN_STATUS indicators"""
@@ -1326,26 +2125,9 @@ class UARTMonitor(QMainWindow):
             button.setChecked(False)
             return
         
-        if checked:
-            button.setText(button.text().split('\n')[0] + "\nENABLED")
-            button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {AppStyle.SUCCESS};
-                    color: white;
-                    font-weight: bold;
-                    font-size: 11px;
-                }}
-            """)
-        else:
-            button.setText(button.text().split('\n')[0] + "\nDISABLED")
-            button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {AppStyle.STATUS_NA};
-                    color: white;
-                    font-weight: bold;
-                    font-size: 11px;
-                }}
-            """)
+        state_text = "ENABLED" if checked else "DISABLED"
+        button.setText(f"DISC OUT {index+1}\n{state_text}")
+        button.setStyleSheet(self.DISC_OUT_STYLES[checked])
         self._build_and_send_command_packet()
     
     def _toggle_led_button(self, button, checked, color, name):
@@ -1356,210 +2138,13 @@ class UARTMonitor(QMainWindow):
         
         if checked:
             button.setText(f"● LED {name}\nENABLED")
-            button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {AppStyle.SUCCESS};
-                    color: white;
-                    font-weight: bold;
-                    font-size: 11px;
-                    text-align: left;
-                    padding-left: 10px;
-                }}
-            """)
+            button.setStyleSheet(self.LED_ENABLED_STYLE)
         else:
             button.setText(f"● LED {name}\nDISABLED")
-            button.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {AppStyle.STATUS_NA};
-                    color: {color};
-                    font-weight: bold;
-                    font-size: 11px;
-                    text-align: left;
-                    padding-left: 10px;
-                }}
-            """)
+            button.setStyleSheet(self.LED_DISABLED_STYLES[color])
         self._build_and_send_command_packet() # Send updated state
-    
-    
-    def _get_signal_names(self):
-        """Get signal name mappings"""
-        names = {
-            0: "HEADER_1", 1: "HEADER_2", 2: "LENGTH", 3: "PACKET_ID",
-            4: "FPGA_VERSION", 5: "FPGA_REVISION",
-            6: "I2C_ACK_STATUS_1", 7: "I2C_ACK_STATUS_2", 8: "I2C_ACK_STATUS_3",
-            9: "I2C_ACK_STATUS_4", 10: "I2C_ACK_STATUS_5",
-            11: "UART_STATUS", 12: "CPU_STATUS", 13: "HSN_STATUS",
-            14: "SATA_STATUS", 15: "USB_STATUS", 16: "JTAG_STATUS",
-            17: "GPU_STATUS_1", 18: "GPU_STATUS_2", 19: "HDMI_STATUS",
-            20: "DISC_IN_STATUS", 21: "DISC_DISCREPANCY_CHECK",
-            22: "DISC_OUT_BIT_STATUS", 23: "DISC_OUT_LB_FAIL_STATUS",
-            24: "DISC_OUT_FAULT_STATUS", 25: "LTC4281_CPU_12V_STATUS",
-            26: "LTC4281_CPU_VOLTAGE_1", 27: "LTC4281_CPU_VOLTAGE_2",
-            28: "LTC4281_CPU_CURRENT_1", 29: "LTC4281_CPU_CURRENT_2",
-            30: "LTC4281_CPU_POWER_1", 31: "LTC4281_CPU_POWER_2",
-            32: "LTC4281_SATA0_3V3_STATUS", 33: "LTC4281_SATA0_3V3_VOLTAGE_1",
-            34: "LTC4281_SATA0_3V3_VOLTAGE_2", 35: "LTC4281_SATA0_3V3_CURRENT_1",
-            36: "LTC4281_SATA0_3V3_CURRENT_2", 37: "LTC4281_SATA0_3V3_POWER_1",
-            38: "LTC4281_SATA0_3V3_POWER_2", 39: "LTC4281_SATA1_3V3_STATUS",
-            40: "LTC4281_SATA1_3V3_VOLTAGE_1", 41: "LTC4281_SATA1_3V3_VOLTAGE_2",
-            42: "LTC4281_SATA1_3V3_CURRENT_1", 43: "LTC4281_SATA1_3V3_CURRENT_2",
-            44: "LTC4281_SATA1_3V3_POWER_1", 45: "LTC4281_SATA1_3V3_POWER_2",
-            46: "LTC4281_GPU_12V_STATUS", 47: "LTC4281_GPU_12V_VOLTAGE_1",
-            48: "LTC4281_GPU_12V_VOLTAGE_2", 49: "LTC4281_GPU_12V_CURRENT_1",
-            50: "LTC4281_GPU_12V_CURRENT_2", 51: "LTC4281_GPU_12V_POWER_1",
-            52: "LTC4281_GPU_12V_POWER_2", 53: "LTC4281_GPU_5V_STATUS",
-            54: "LTC4281_GPU_5V_VOLTAGE_1", 55: "LTC4281_GPU_5V_VOLTAGE_2",
-            56: "LTC4281_GPU_5V_CURRENT_1", 57: "LTC4281_GPU_5V_CURRENT_2",
-            58: "LTC4281_GPU_5V_POWER_1", 59: "LTC4281_GPU_5V_POWER_2",
-            60: "LTC4281_GPU_3V3_STATUS", 61: "LTC4281_GPU_3V3_VOLTAGE_1",
-            62: "LTC4281_GPU_3V3_VOLTAGE_2", 63: "LTC4281_GPU_3V3_CURRENT_1",
-            64: "LTC4281_GPU_3V3_CURRENT_2", 65: "LTC4281_GPU_3V3_POWER_1",
-            66: "LTC4281_GPU_3V3_POWER_2", 67: "INA260_PWR_BOARD_27V_VOLTAGE_1",
-            68: "INA260_PWR_BOARD_27V_VOLTAGE_2", 69: "INA260_PWR_BOARD_27V_CURRENT_1",
-            70: "INA260_PWR_BOARD_27V_CURRENT_2", 71: "INA260_PWR_BOARD_27V_POWER_1",
-            72: "INA260_PWR_BOARD_27V_POWER_2", 73: "INA260_CPLD_3V3_VOLTAGE_1",
-            74: "INA260_CPLD_3V3_VOLTAGE_2", 75: "INA260_CPLD_3V3_CURRENT_1",
-            76: "INA260_CPLD_3V3_CURRENT_2", 77: "INA260_CPLD_3V3_POWER_1",
-            78: "INA260_CPLD_3V3_POWER_2", 79: "TMP100_CPLD_TEMP",
-            80: "TMP100_GPU_TEMP", 81: "TMP100_CARRIER_TEMP",
-            82: "TMP100_PWR_REG_TEMP", 83: "TMP100_PWR_BOARD_TEMP",
-            84: "TMP100_IGLOO2_TEMP", 85: "GPU_TEMP",
-            86: "HSN_TRANS_DATA_1", 87: "HSN_TRANS_DATA_2",
-            88: "HSN_TRANS_DATA_3", 89: "HSN_TRANS_DATA_4",
-            90: "HSN_TRANS_DATA_5", 91: "HSN_TRANS_DATA_6",
-            92: "HSN_TRANS_DATA_7", 93: "HSN_TRANS_DATA_8",
-        }
-        
-        # Reserved and UART Loopback
-        for i in range(94, 127):
-            names[i] = "RESERVED"
-        for i in range(128, 132):
-            names[i] = "UART_LOOPBACK"
-        
-        return names
-    
-    def _get_dynamic_meaning(self, index, value):
-        """
-        Get dynamic meaning based on the received value.
-        This function is customized to show different interpretations based on the data index.
-        """
-        # Show data for specified indices in 8-bit binary format.
-        binary_indices = list(range(6, 26)) + [32, 39, 46, 53, 60]
-        if index in binary_indices:
-            is_error = False  
-            
-            # Check if only a single bit is set to 1 (indicates an error/status).
-            if index == 10:
-                if (value & 0x3F) != 0:
-                    is_error = True
-            elif index == 21:
-                if (value & 0x1F) != 0:
-                    is_error = True
-            elif index in [14, 23]:
-                if (value & 0x0F) != 0:
-                    is_error = True
-            elif index == 15:
-                if (value & 0x07) != 0:
-                    is_error = True
-            elif index in [11, 12, 13, 16, 18, 19]:
-                if (value & 0x01) != 0:
-                    is_error = True
-            elif index in [6,7,8,9,17,24]:
-                is_error = (value != 0)      
-            
-            # Format the binary string with spaces between bits for readability.
-            binary_string = f"{value:08b}"
-            spaced_binary_string = ' '.join(binary_string)
-            
-            # Return the formatted text and the error status as a tuple.
-            return (f"0b {spaced_binary_string}", is_error)
-        
-        return ("N/A", False)
-
-
-    def _get_voltage_meaning(self, index, msb_value, lsb_value):
-        """
-        Calculates the voltage from MSB and LSB values and updates the table item.
-        """
-        # 1. Combine MSB and LSB to get a 16-bit value
-        combined_value = (msb_value << 8) | lsb_value
-
-        # 2. Two's Complement dönüşümü (16-bit için)
-        if combined_value > 32767:  # Negatif sayı
-            Twos_Complement_value = combined_value - 65536
-        else:  # Pozitif sayı
-            Twos_Complement_value = combined_value    
-
-        # 2. Apply the specific voltage scaling factor
-        if index in [26, 47]:  # LTC4281 12V mode 
-            voltage_value = Twos_Complement_value * (0.254e-3)
-            return f"{voltage_value:.3f} V", voltage_value
-        elif index in [33, 40, 61]:  # LTC4281 3v3 mode 
-            voltage_value = Twos_Complement_value * (0.0847e-3)
-            return f"{voltage_value:.3f} V", voltage_value
-        elif index in [54]:  # LTC4281 5v mode 
-            voltage_value = Twos_Complement_value * (0.127e-3)
-            return f"{voltage_value:.3f} V", voltage_value
-        elif index in [67, 73]:  # INA260 mode
-            voltage_value = Twos_Complement_value * (1.25e-3)
-            return f"{voltage_value:.3f} V", voltage_value
-        else:
-            return "N/A"
 
 
-    def _get_current_meaning(self, index, msb_value, lsb_value):
-        """
-        Calculates the current from MSB and LSB values and updates the table item.
-        """
-        # 1. Combine MSB and LSB to get a 16-bit value
-        combined_value = (msb_value << 8) | lsb_value
-
-        # 2. Two's Complement dönüşümü (16-bit için)
-        if combined_value > 32767:  # Negatif sayı
-            Twos_Complement_value = combined_value - 65536
-        else:  # Pozitif sayı
-            Twos_Complement_value = combined_value 
-
-        # 2. Apply the specific current scaling factor
-        if index in [28, 35, 42, 49, 56, 63]:  # LTC4281 mode 
-            current_value = Twos_Complement_value * (0.305e-3)
-            return f"{current_value:.3f} A", current_value
-        elif index in [69, 75]:  # INA260 mode
-            current_value = Twos_Complement_value * (1.25e-3)
-            return f"{current_value:.3f} A", current_value
-        else:
-            return "N/A"
-
-
-    def _get_power_meaning(self, index, msb_value, lsb_value):
-        """
-        Calculates the power from MSB and LSB values and updates the table item.
-        """
-        # 1. Combine MSB and LSB to get a 16-bit value
-        combined_value = (msb_value << 8) | lsb_value
-
-        # 2. Two's Complement dönüşümü (16-bit için)
-        if combined_value > 32767:  # Negatif sayı
-            Twos_Complement_value = combined_value - 65536
-        else:  # Pozitif sayı
-            Twos_Complement_value = combined_value 
-
-        # 2. Apply the specific power scaling factor
-        if index in [30, 51]:  # LTC4281 12V mode 
-            power_value = Twos_Complement_value * (5.08e-3)
-            return f"{power_value:.3f} W", power_value
-        elif index in [37, 44, 65]:  # LTC4281 3V3 V mode 
-            power_value = Twos_Complement_value * (1.69e-3)
-            return f"{power_value:.3f} W", power_value
-        elif index in [58]:  # LTC4281 5V mode 
-            power_value = Twos_Complement_value * (2.54e-3)
-            return f"{power_value:.3f} W", power_value
-        elif index in [71, 77]:  # INA260 mode
-            power_value = Twos_Complement_value * (10e-3)
-            return f"{power_value:.3f} W", power_value
-        else:
-            return "N/A"
-
 def main():
     """Application entry point"""
     app = QApplication(sys.argv)
@@ -0,0 +1,240 @@
+"""
+UART Monitoring Interface benchmarks
+Measures framing, decoding, table rendering and command building on
+synthetic frames and writes the results as JSON, so frames-per-second
+capacity can be compared across releases.
+
+    python benchmark.py --json results.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from uartexe import PacketFramer, compile_schema, protocol
+from uartexe.alarms import AlarmEngine
+from uartexe.decode import MeasurementDecoder
+from uartexe.faults import FaultInjector, sequenced_frames
+from uartexe.schema import BITFIELD, MEASUREMENT, RAW, TEMPERATURE
+from uartexe.stats import SignalStatistics
+from uartexe.transmit import CommandTransmitter
+from uartexe.trigger import TriggerCapture
+
+FRAME_COUNT = 2000
+NOISE_LEVELS = [0.0, 1e-4, 1e-3, 1e-2]  # noise bursts per byte
+BATCH_FRAMES = 1000
+
+
+class NullPort:
+    """Serial port stand-in that discards writes"""
+
+    is_open = True
+    in_waiting = 0
+
+    def write(self, data):
+        return len(data)
+
+    def close(self):
+        pass
+
+
+def _run(func, number):
+    started = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - started
+
+
+def measure(func, min_time=0.2, repeat=3):
+    """Best time per call in seconds over repeat runs of at least min_time each"""
+    number = 1
+    elapsed = _run(func, number)
+    while elapsed < min_time:
+        number = max(number * 2, int(number * min_time * 1.1 / max(elapsed, 1e-9)))
+        elapsed = _run(func, number)
+    best = min([elapsed] + [_run(func, number) for _ in range(repeat - 1)])
+    return best / number, number
+
+
+def result(seconds, number, items=1, unit="frames"):
+    """Benchmark entry: time per call and items per second"""
+    return {
+        "us_per_op": seconds * 1e6,
+        f"{unit}_per_s": items / seconds,
+        "iterations": number,
+    }
+
+
+def bench_framing(frames, min_time):
+    results = {}
+    for level in NOISE_LEVELS:
+        stream = FaultInjector(noise_rate=level, seed=1).inject(b"".join(frames))
+
+        def run():
+            framer = PacketFramer()
+            for offset in range(0, len(stream), 4096):
+                framer.feed(stream[offset:offset + 4096])
+
+        seconds, number = measure(run, min_time)
+        entry = result(seconds, number, len(frames))
+        entry["mb_per_s"] = len(stream) / seconds / 1e6
+        results[f"framing.noise_{level:g}"] = entry
+    return results
+
+
+def bench_decoders(frames, min_time):
+    schema = compile_schema()
+    frame = frames[0]
+    results = {}
+    for kind in (MEASUREMENT, TEMPERATURE, BITFIELD, RAW):
+        indices = [i for i in range(schema.size) if schema.kind[i] == kind]
+
+        def run(indices=indices):
+            decode = schema.decode
+            for i in indices:
+                decode(i, frame)
+
+        seconds, number = measure(run, min_time)
+        results[f"decode.{kind}"] = result(seconds, number, len(indices), "values")
+
+    seconds, number = measure(lambda: schema.decode_frame(frame), min_time)
+    results["decode.frame"] = result(seconds, number)
+
+    decoder = MeasurementDecoder(schema)
+    seconds, number = measure(lambda: decoder.limit_states(decoder.decode(frame)), min_time)
+    results["decode.measurements_vector"] = result(seconds, number)
+
+    batch = b"".join((frames * (BATCH_FRAMES // len(frames) + 1))[:BATCH_FRAMES])
+    seconds, number = measure(lambda: decoder.limit_states(decoder.decode(batch)), min_time)
+    results["decode.measurements_batch"] = result(seconds, number, BATCH_FRAMES)
+
+    statistics = SignalStatistics(schema)
+    seconds, number = measure(lambda: statistics.update(frame, 0), min_time)
+    results["stats.update_frame"] = result(seconds, number)
+    seconds, number = measure(lambda: statistics.update(batch, 0), min_time)
+    results["stats.update_batch"] = result(seconds, number, BATCH_FRAMES)
+
+    alarms = AlarmEngine(schema)
+    seconds, number = measure(lambda: alarms.update(frame, 0), min_time)
+    results["alarms.update_frame"] = result(seconds, number)
+    seconds, number = measure(lambda: alarms.update(batch, 0), min_time)
+    results["alarms.update_batch"] = result(seconds, number, BATCH_FRAMES)
+
+    # Steady state of the pre-trigger ring: copies and status edge checks, no capture written
+    with tempfile.TemporaryDirectory() as directory:
+        trigger = TriggerCapture(directory, on_alarm=False, checksum_burst=None)
+        seconds, number = measure(lambda: trigger.update(batch, 0), min_time)
+        results["trigger.update_batch"] = result(seconds, number, BATCH_FRAMES)
+        trigger.close()
+    return results
+
+
+def bench_command(min_time):
+    seconds, number = measure(lambda: protocol.build_command_packet(1, 0x05, protocol.SATA_NONE, 0x07),
+                              min_time)
+    return {"command.build": result(seconds, number, unit="packets")}
+
+
+def bench_gui(frames, min_time):
+    """Render and command benchmarks on an offscreen UARTMonitor"""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PyQt5.QtWidgets import QApplication
+        import UART_GUI_V3
+    except ImportError as e:
+        print(f"Skipping GUI benchmarks: {e}", file=sys.stderr)
+        return {}
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    window = UART_GUI_V3.UARTMonitor()
+    window.show()
+    app.processEvents()
+    results = {}
+
+    state = {"n": 0}
+
+    def next_frame():
+        state["n"] += 1
+        return frames[state["n"] % len(frames)]
+
+    # Model and indicator updates only; Qt paints them later from the event loop
+    seconds, number = measure(lambda: window._render_packet(next_frame()), min_time)
+    results["render.update_no_paint"] = result(seconds, number)
+
+    def render_and_paint():
+        window._render_packet(next_frame())
+        window.repaint()
+
+    # What a displayed frame costs the GUI thread: updates plus the synchronous repaint
+    seconds, number = measure(render_and_paint, min_time)
+    results["render.full_pass"] = result(seconds, number)
+
+    seconds, number = measure(lambda: window.table_model.set_frame(next_frame()), min_time)
+    results["render.table_model"] = result(seconds, number)
+
+    seconds, number = measure(window._update_status_buttons, min_time)
+    results["render.status_buttons"] = result(seconds, number)
+
+    # Time spent on the GUI thread per control change; the write itself runs on the transmitter thread
+    window.serial_port = NullPort()
+    window.transmitter = CommandTransmitter(window.serial_port, window.COMMAND_COALESCE_S)
+    window.is_connected = True
+    with contextlib.redirect_stdout(io.StringIO()):
+        seconds, number = measure(window._build_and_send_command_packet, min_time)
+    results["command.build_and_send"] = result(seconds, number, unit="packets")
+
+    window.transmitter.close()
+    window.transmitter = None
+    window.is_connected = False
+    window.close()
+    app.processEvents()
+    return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="UART Monitoring Interface benchmarks")
+    parser.add_argument("--json", metavar="PATH", help="write results to this JSON file")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="minimum seconds per measurement (default 0.2)")
+    parser.add_argument("--no-gui", action="store_true", help="skip the offscreen GUI benchmarks")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    frames = sequenced_frames(FRAME_COUNT, seed=0)
+
+    results = {}
+    results.update(bench_framing(frames, args.min_time))
+    results.update(bench_decoders(frames, args.min_time))
+    results.update(bench_command(args.min_time))
+    if not args.no_gui:
+        results.update(bench_gui(frames, args.min_time))
+
+    report = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+    for name, entry in results.items():
+        rate_key = next(key for key in entry if key.endswith("_per_s"))
+        print(f"{name:32} {entry['us_per_op']:12.2f} us/op {entry[rate_key]:14,.0f} {rate_key}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from uartexe import compile_schema
+from uartexe.alarms import CLEAR, HIGH, LOW, RAISE, AlarmEngine
+from uartexe.faults import sequenced_frames
+
+BASE = np.frombuffer(sequenced_frames(1, seed=0)[0], dtype=np.uint8)
+GPU_TEMP = 80  # TMP100 GPU temperature byte, limits -45..105 °C
+CURRENT = 69  # INA260 27 V current pair, placeholder limits 0..255 A in 1.25 mA steps
+
+
+@pytest.fixture
+def engine():
+    return AlarmEngine(compile_schema())
+
+
+@pytest.fixture
+def channel(engine):
+    return engine.names.index("TMP100_GPU_TEMP")
+
+
+def frames(*temperatures):
+    block = np.tile(BASE, (len(temperatures), 1))
+    block[:, GPU_TEMP] = np.array(temperatures, dtype=np.int8).view(np.uint8)
+    return block
+
+
+def current_frames(*codes):
+    block = np.tile(BASE, (len(codes), 1))
+    block[:, CURRENT:CURRENT + 2] = np.array(codes, dtype=">i2").view(np.uint8).reshape(-1, 2)
+    return block
+
+
+def test_in_range_frames_raise_nothing(engine):
+    assert engine.update(frames(40, 50, 60), 0) == []
+    assert not engine.snapshot()["active"].any()
+
+
+def test_debounce(engine, channel):
+    # Two samples out of range are not enough, and the count restarts once back in range
+    assert engine.update(frames(110, 110, 50, 110, 110), 0) == []
+    assert engine.snapshot()["violations"][channel] == 4
+
+    events = engine.update(frames(110), 1)
+    assert [(e.kind, e.side, e.channel) for e in events] == [(RAISE, HIGH, channel)]
+    assert events[0].timestamp_ns == 1
+    assert events[0].value == 110
+    assert events[0].limit == 105
+    assert engine.active_channels() == [channel]
+
+
+def test_debounce_spans_blocks(engine):
+    for timestamp in range(2):
+        assert engine.update(frames(-50), timestamp) == []
+    events = engine.update(frames(-50), 2)
+    assert [(e.kind, e.side) for e in events] == [(RAISE, LOW)]
+
+
+def test_hysteresis(engine, channel):
+    engine.update(frames(110, 110, 110), 0)
+    # Back inside the limit but not by the band, 2 % of the 105 °C limit: the alarm holds
+    assert engine.update(frames(104, 103, 104, 103), 1) == []
+    assert engine.active_channels() == [channel]
+
+    events = engine.update(frames(101, 101, 101), 2)
+    assert [(e.kind, e.side, e.channel) for e in events] == [(CLEAR, HIGH, channel)]
+    assert events[0].limit == pytest.approx(102.9)
+    assert events[0].extreme == 110
+    assert engine.active_channels() == []
+    assert engine.snapshot()["raised"][channel] == 1
+
+
+def test_wide_span_channel_clears_near_its_limit(engine):
+    channel = engine.names.index("INA260_PWR_BOARD_27V_CURRENT_1")
+    events = engine.update(current_frames(-1, -1, -1), 0)
+    assert [(e.kind, e.side, e.value) for e in events] == [(RAISE, LOW, -1.25e-3)]
+    # A normal 1 A is well inside 0..255 A even though the span is 255 A wide
+    events = engine.update(current_frames(800, 800, 800), 1)
+    assert [(e.kind, e.channel) for e in events] == [(CLEAR, channel)]
+    assert engine.active_channels() == []
+
+
+def test_steady_block_tracks_extreme(engine, channel):
+    engine.update(frames(110, 110, 110), 0)
+    assert engine.update(frames(112, 120, 115), 1) == []
+    events = engine.update(frames(50, 50, 50), 2)
+    assert events[0].kind == CLEAR
+    assert events[0].extreme == 120
+
+
+def test_separate_clear_debounce():
+    engine = AlarmEngine(compile_schema(), debounce=1, clear_debounce=4)
+    assert [e.kind for e in engine.update(frames(110), 0)] == [RAISE]
+    assert engine.update(frames(50, 50, 50), 1) == []
+    assert [e.kind for e in engine.update(frames(50), 2)] == [CLEAR]
+
+
+def test_reset(engine):
+    engine.update(frames(110, 110, 110), 0)
+    engine.reset()
+    snapshot = engine.snapshot()
+    assert not snapshot["active"].any()
+    assert snapshot["total_events"] == 0
+    assert snapshot["events"] == []
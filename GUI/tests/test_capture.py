@@ -0,0 +1,79 @@
+from uartexe import protocol
+from uartexe.capture import FLAG_PARTIAL_INDEX, KIND_FRAME, KIND_INDEX, KIND_RAW, KIND_TX, CaptureWriter
+from uartexe.capture_reader import CaptureReader
+from uartexe.faults import SEQUENCE_OFFSET, sequenced_frames
+
+FRAMES = sequenced_frames(25, seed=3)
+
+
+def write_capture(path, index_interval=10, batch_records=4):
+    with CaptureWriter(path, index_interval=index_interval, batch_records=batch_records) as writer:
+        for n, frame in enumerate(FRAMES):
+            writer.write_frame(frame, 1000 * (n + 1))
+    return path
+
+
+def test_round_trip_with_index(tmp_path):
+    with CaptureReader(write_capture(tmp_path / "run.uxcap")) as reader:
+        # Two full blocks of ten frames and a partial block of five
+        assert len(reader) == 28
+        assert reader.index_positions.tolist() == [10, 21, 27]
+        assert reader.index["frames"].tolist() == [10, 10, 5]
+        assert reader.index["first_ns"].tolist() == [1000, 11000, 21000]
+        assert reader.index["last_ns"].tolist() == [10000, 20000, 25000]
+        assert reader.index["first_record"].tolist() == [0, 11, 22]
+        assert reader.records["flags"][-1] & FLAG_PARTIAL_INDEX
+        assert reader.frame_count == len(FRAMES)
+
+        timestamps, payloads = reader.window()
+        assert timestamps.tolist() == [1000 * (n + 1) for n in range(len(FRAMES))]
+        assert [bytes(row) for row in payloads] == FRAMES
+        assert bytes(reader.frame(0)) == FRAMES[0]
+
+
+def test_seek_and_window(tmp_path):
+    with CaptureReader(write_capture(tmp_path / "run.uxcap")) as reader:
+        assert reader.seek(0) == 0
+        assert reader.seek(11000) == 11  # first record of the second block
+        assert reader.seek(11500) == 12
+        assert reader.seek(25000) == 26
+        assert reader.seek(99999) == len(reader)
+        timestamps, payloads = reader.window(5000, 15000)
+        assert timestamps.tolist() == list(range(5000, 15000, 1000))
+        assert [bytes(row) for row in payloads] == FRAMES[4:14]
+
+
+def test_find(tmp_path):
+    with CaptureReader(write_capture(tmp_path / "run.uxcap")) as reader:
+        # Low byte of the big-endian sequence number
+        low = SEQUENCE_OFFSET + 3
+        assert reader.find(low, 0xFF, 17) == 18000
+        assert reader.find(low, 0xFF, 17, start_ns=19000) is None
+        assert reader.find(low, 0x01, 1, start_ns=19500) == 20000
+
+
+def test_mixed_records(tmp_path):
+    path = tmp_path / "mixed.uxcap"
+    packet = protocol.build_command_packet(1, 0x05, protocol.SATA_NONE, 0x07)
+    with CaptureWriter(path, record_raw=True, index_interval=4) as writer:
+        writer.write_raw(bytes(300), 10)
+        writer.write_frame(FRAMES[0], 20)
+        writer.write_tx(packet, 30)
+        writer.write_frame(FRAMES[1], 5)  # clamped to the last timestamp
+    with CaptureReader(path) as reader:
+        assert reader.kinds.tolist() == [KIND_RAW, KIND_RAW, KIND_RAW, KIND_FRAME, KIND_INDEX,
+                                         KIND_TX, KIND_FRAME, KIND_INDEX]
+        assert reader.records["length"][:3].tolist() == [133, 133, 34]
+        assert reader.timestamps[-2] == 30
+        assert reader.frame_count == 2
+        assert bytes(reader.frame(5)) == packet
+        timestamps, payloads = reader.window(kind=KIND_TX)
+        assert timestamps.tolist() == [30]
+
+
+def test_truncated_record_is_ignored(tmp_path):
+    path = write_capture(tmp_path / "run.uxcap")
+    with open(path, "ab") as f:
+        f.write(b"\x01\x02\x03")
+    with CaptureReader(path) as reader:
+        assert len(reader) == 28
@@ -0,0 +1,42 @@
+import io
+
+import numpy as np
+
+from uartexe import compile_schema, protocol
+from uartexe.capture import KIND_RAW, CaptureWriter
+from uartexe.capture_reader import CaptureReader
+from uartexe.daemon import WRITERS, TelemetryDaemon
+from uartexe.faults import sequenced_frames
+from uartexe.timing import byte_time_ns
+
+
+class StreamPort(io.BytesIO):
+    """Serial port stand-in that delivers a fixed byte stream"""
+
+    baudrate = 115200
+    bytesize = 8
+    parity = "N"
+    stopbits = 1
+
+    @property
+    def in_waiting(self):
+        return len(self.getbuffer()) - self.tell()
+
+
+def test_raw_recording_keeps_per_frame_timestamps(tmp_path):
+    frames = sequenced_frames(3, seed=4)
+    port = StreamPort(b"".join(frames))
+    path = tmp_path / "run.uxcap"
+    recorder = CaptureWriter(path, record_raw=True)
+    daemon = TelemetryDaemon(port, WRITERS["csv"](io.StringIO(), compile_schema()), count=3,
+                             recorder=recorder)
+    daemon.run()
+    recorder.close()
+
+    with CaptureReader(path) as reader:
+        timestamps, payloads = reader.window()
+        assert [bytes(row) for row in payloads] == frames
+        # One read delivered all three frames; each is stamped back by the line time after it
+        assert np.diff(timestamps).tolist() == [protocol.PACKET_SIZE * byte_time_ns(port)] * 2
+        raw_timestamps, _ = reader.window(kind=KIND_RAW)
+        assert raw_timestamps.min() == timestamps[-1]
@@ -0,0 +1,85 @@
+import threading
+import time
+
+import pytest
+
+from uartexe.frame_queue import FrameQueue, OverflowPolicy
+
+
+def frame(n):
+    return bytes([n]) * 4
+
+
+def test_put_reports_empty_queue():
+    queue = FrameQueue(capacity=4, keep_latest=1)
+    assert queue.put(frame(0)) is True
+    assert queue.put(frame(1)) is False
+    assert queue.get_all() == [frame(0), frame(1)]
+    assert queue.put(frame(2)) is True
+
+
+def test_drop_oldest_keeps_newest_capacity_frames():
+    queue = FrameQueue(capacity=4, policy=OverflowPolicy.DROP_OLDEST, keep_latest=1)
+    for n in range(10):
+        queue.put(frame(n))
+    assert queue.get_all() == [frame(n) for n in range(6, 10)]
+    assert queue.dropped_frames == 6
+    assert queue.dropped_bytes == 24
+    assert queue.overflows == 6
+    assert queue.max_depth == 4
+
+
+def test_keep_latest_discards_backlog():
+    queue = FrameQueue(capacity=4, policy=OverflowPolicy.KEEP_LATEST, keep_latest=2)
+    for n in range(5):
+        queue.put(frame(n))
+    # The fifth frame finds the queue full, so only the newest keep_latest survive
+    assert queue.get_all() == [frame(3), frame(4)]
+    assert queue.dropped_frames == 3
+    assert queue.overflows == 1
+
+
+def test_block_waits_for_consumer():
+    queue = FrameQueue(capacity=2, policy=OverflowPolicy.BLOCK, keep_latest=1)
+    queue.put(frame(0))
+    queue.put(frame(1))
+    producer = threading.Thread(target=queue.put, args=(frame(2),))
+    producer.start()
+    time.sleep(0.05)
+    assert producer.is_alive()
+    assert queue.get_all() == [frame(0), frame(1)]
+    producer.join(1)
+    assert not producer.is_alive()
+    assert queue.get_all() == [frame(2)]
+    assert queue.dropped_frames == 0
+    assert queue.blocked_seconds > 0
+
+
+def test_close_releases_blocked_producer():
+    queue = FrameQueue(capacity=1, policy=OverflowPolicy.BLOCK, keep_latest=1)
+    queue.put(frame(0))
+    producer = threading.Thread(target=queue.put, args=(frame(1),))
+    producer.start()
+    time.sleep(0.05)
+    queue.close()
+    producer.join(1)
+    assert not producer.is_alive()
+    assert queue.dropped_frames == 1
+    assert queue.get_all() == [frame(0)]
+
+
+def test_policy_switch_releases_blocked_producer():
+    queue = FrameQueue(capacity=1, policy=OverflowPolicy.BLOCK, keep_latest=1)
+    queue.put(frame(0))
+    producer = threading.Thread(target=queue.put, args=(frame(1),))
+    producer.start()
+    time.sleep(0.05)
+    queue.set_policy(OverflowPolicy.DROP_OLDEST)
+    producer.join(1)
+    assert not producer.is_alive()
+    assert queue.get_all() == [frame(1)]
+
+
+def test_rejects_unknown_policy():
+    with pytest.raises(ValueError):
+        FrameQueue(policy="SOMETIMES")
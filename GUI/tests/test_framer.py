@@ -0,0 +1,59 @@
+import io
+import random
+
+from uartexe import PacketFramer, protocol
+from uartexe.faults import sequenced_frames
+
+FRAMES = sequenced_frames(20, seed=1)
+
+
+def feed_in_chunks(framer, data, chunk):
+    packets = []
+    for offset in range(0, len(data), chunk):
+        packets.extend(framer.feed(data[offset:offset + chunk]))
+    return packets
+
+
+def test_clean_stream_in_any_chunking():
+    stream = b"".join(FRAMES)
+    for chunk in (1, 7, protocol.PACKET_SIZE, 1000):
+        framer = PacketFramer()
+        assert feed_in_chunks(framer, stream, chunk) == FRAMES
+        assert framer.valid_frames == len(FRAMES)
+        assert framer.discarded_bytes == 0
+
+
+def test_resyncs_after_noise():
+    rng = random.Random(2)
+    # Noise without HEADER_1 cannot hide a header, so every frame must come back
+    noise = [bytes(rng.choice([b for b in range(256) if b != protocol.HEADER_1])
+                   for _ in range(rng.randint(1, 50))) for _ in FRAMES]
+    stream = b"".join(n + f for n, f in zip(noise, FRAMES))
+    framer = PacketFramer()
+    assert feed_in_chunks(framer, stream, 64) == FRAMES
+    assert framer.discarded_bytes == sum(map(len, noise))
+
+
+def test_corrupted_frame_is_counted_and_skipped():
+    bad = bytearray(FRAMES[1])
+    bad[60] ^= 0x01
+    framer = PacketFramer()
+    packets = framer.feed(FRAMES[0] + bytes(bad) + FRAMES[2])
+    assert packets == [FRAMES[0], FRAMES[2]]
+    assert framer.checksum_failures == 1
+
+
+def test_false_header_is_skipped():
+    fake = protocol.HEADER + b"\x00\x00"
+    framer = PacketFramer()
+    assert framer.feed(fake + FRAMES[0]) == [FRAMES[0]]
+    assert framer.false_headers == 1
+
+
+def test_readinto_hands_out_views():
+    framer = PacketFramer()
+    stream = io.BytesIO(b"".join(FRAMES[:3]))
+    count = framer.readinto(stream, 4096)
+    assert count == 3 * protocol.PACKET_SIZE
+    assert [bytes(frame) for frame in framer.frames()] == FRAMES[:3]
+    assert framer.pending == 0
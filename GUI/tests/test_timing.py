@@ -0,0 +1,97 @@
+from types import SimpleNamespace
+
+import pytest
+
+from uartexe.timing import GAP_SETTLE, FrameTiming, byte_time_ns
+
+MS = 1_000_000
+PERIOD = 20 * MS
+
+
+def run(timing, timestamps):
+    for timestamp in timestamps:
+        timing.add(timestamp)
+    return timing.snapshot()
+
+
+def steady(start, count):
+    return [start + k * PERIOD for k in range(count)]
+
+
+def test_steady_stream():
+    snapshot = run(FrameTiming(PERIOD), steady(0, 100))
+    assert snapshot["intervals"] == 99
+    assert snapshot["mean_ms"] == pytest.approx(20)
+    assert snapshot["std_ms"] == pytest.approx(0, abs=1e-6)
+    assert snapshot["p50_ms"] == pytest.approx(20)
+    assert snapshot["gaps"] == 0
+
+
+def test_late_read_is_not_a_gap():
+    # Frames 10-12 arrive in one late read: a 60 ms interval paid back by the 0 ms ones
+    timestamps = steady(0, 10) + [12 * PERIOD] * 3 + steady(13 * PERIOD, 20)
+    timing = FrameTiming(PERIOD)
+    snapshot = run(timing, timestamps)
+    assert snapshot["gaps"] == 0
+    assert snapshot["missed_frames"] == 0
+
+
+def test_dropped_frame_is_counted_once_settled():
+    timing = FrameTiming(PERIOD)
+    run(timing, steady(0, 10) + steady(11 * PERIOD, GAP_SETTLE - 1))
+    assert timing.snapshot()["gaps"] == 0  # still open
+    snapshot = run(timing, [(11 + GAP_SETTLE) * PERIOD])
+    assert snapshot["gaps"] == 1
+    assert snapshot["missed_frames"] == 1
+    assert list(timing.gaps) == [(11 * PERIOD, 2 * PERIOD, 1)]
+
+
+def test_half_period_boundary():
+    # A 35 ms interval opens a gap with 15 ms unpaid, the 15 ms one after it pays back 5 ms
+    def unpaid_after(offset_ns):
+        second = 215 * MS + 15 * MS + offset_ns
+        return steady(0, 10) + [215 * MS, second] + steady(second + PERIOD, 20)
+
+    under = run(FrameTiming(PERIOD), unpaid_after(-1))  # just under half a period left
+    assert (under["gaps"], under["missed_frames"]) == (0, 0)
+    at = run(FrameTiming(PERIOD), unpaid_after(0))  # exactly half a period left
+    assert (at["gaps"], at["missed_frames"]) == (1, 1)
+
+
+def test_partly_paid_gap():
+    # 80 ms then one bunched frame: four periods elapsed, two frames delivered
+    timestamps = steady(0, 10) + [13 * PERIOD] * 2 + steady(14 * PERIOD, 20)
+    snapshot = run(FrameTiming(PERIOD), timestamps)
+    assert snapshot["gaps"] == 1
+    assert snapshot["missed_frames"] == 2
+
+
+def test_second_long_interval_settles_the_first():
+    timestamps = steady(0, 10) + steady(11 * PERIOD, 2) + steady(15 * PERIOD, 20)
+    timing = FrameTiming(PERIOD)
+    snapshot = run(timing, timestamps)
+    assert snapshot["gaps"] == 2
+    assert [missed for _, _, missed in timing.gaps] == [1, 2]
+
+
+def test_estimated_period():
+    timing = FrameTiming()
+    snapshot = run(timing, steady(0, 300) + steady(301 * PERIOD, 20))
+    assert snapshot["period_ms"] == pytest.approx(20, rel=0.01)
+    assert snapshot["missed_frames"] == 1
+
+
+def test_reset():
+    timing = FrameTiming(PERIOD)
+    run(timing, steady(0, 10) + steady(12 * PERIOD, 20))
+    timing.reset()
+    snapshot = timing.snapshot()
+    assert snapshot["frames"] == 0
+    assert snapshot["gaps"] == 0
+    assert not timing.gaps
+
+
+def test_byte_time():
+    assert byte_time_ns(SimpleNamespace(baudrate=115200, bytesize=8, parity="N", stopbits=1)) == 86805
+    assert byte_time_ns(SimpleNamespace(baudrate=115200, bytesize=8, parity="E", stopbits=1)) == 95486
+    assert byte_time_ns(SimpleNamespace(baudrate=None)) == 0
@@ -0,0 +1,93 @@
+import threading
+import time
+
+import pytest
+
+from uartexe import protocol
+from uartexe.transmit import CommandTransmitter
+
+
+class RecordingPort:
+    """Serial port stand-in that keeps every write"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.writes = []
+        self.written = threading.Event()
+
+    def write(self, data):
+        if self.fail:
+            raise OSError("port gone")
+        self.writes.append(bytes(data))
+        self.written.set()
+        return len(data)
+
+
+def packet(sense_select=protocol.SENSE_OPEN_GND, disc_out=0, sata=protocol.SATA_NONE, led=0):
+    return protocol.build_command_packet(sense_select, disc_out, sata, led)
+
+
+def wait_for(condition, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+def test_rapid_changes_coalesce_into_latest_state():
+    port = RecordingPort()
+    transmitter = CommandTransmitter(port, coalesce_window=0.1)
+    for disc_out in range(10):
+        transmitter.set_controls(protocol.SENSE_OPEN_28V, disc_out, 1)
+    assert port.written.wait(1)
+    time.sleep(0.15)
+    transmitter.close()
+    assert port.writes == [packet(protocol.SENSE_OPEN_28V, 9, led=1)]
+    assert transmitter.changes_submitted == 10
+    assert transmitter.changes_coalesced == 9
+    assert transmitter.packets_sent == 1
+
+
+def test_zeroizes_are_never_merged():
+    port = RecordingPort()
+    transmitter = CommandTransmitter(port, coalesce_window=10)
+    transmitter.set_controls(protocol.SENSE_OPEN_28V, 3, 0)
+    transmitter.zeroize(protocol.SATA_ZEROIZE_SATA1)
+    transmitter.zeroize(protocol.SATA_ZEROIZE_BOTH)
+    assert wait_for(lambda: len(port.writes) == 2)
+    transmitter.close()
+    # Both carry the pending control state, which no longer needs a packet of its own
+    assert port.writes == [packet(protocol.SENSE_OPEN_28V, 3, protocol.SATA_ZEROIZE_SATA1),
+                           packet(protocol.SENSE_OPEN_28V, 3, protocol.SATA_ZEROIZE_BOTH)]
+    assert transmitter.zeroizes_sent == 2
+    assert transmitter.depth == 0
+
+
+def test_on_sent_and_on_error():
+    sent = []
+    transmitter = CommandTransmitter(RecordingPort(), on_sent=lambda p, ts: sent.append(p))
+    transmitter.zeroize(protocol.SATA_ZEROIZE_SATA1)
+    assert wait_for(lambda: sent)
+    transmitter.close()
+    assert sent == [packet(sata=protocol.SATA_ZEROIZE_SATA1)]
+
+    errors = []
+    transmitter = CommandTransmitter(RecordingPort(fail=True), on_error=errors.append)
+    transmitter.zeroize(protocol.SATA_ZEROIZE_SATA1)
+    assert wait_for(lambda: errors)
+    transmitter.close()
+    assert errors == ["port gone"]
+    assert transmitter.write_errors == 1
+    assert transmitter.packets_sent == 0
+
+
+def test_close_drops_pending_changes():
+    port = RecordingPort()
+    transmitter = CommandTransmitter(port, coalesce_window=10)
+    transmitter.set_controls(protocol.SENSE_OPEN_28V, 1, 1)
+    transmitter.close()
+    assert port.writes == []
+    with pytest.raises(RuntimeError):
+        transmitter.zeroize(protocol.SATA_ZEROIZE_SATA1)
@@ -0,0 +1,148 @@
+import json
+import os
+
+import pytest
+
+from uartexe import protocol
+from uartexe.alarms import CLEAR, RAISE, AlarmEvent
+from uartexe.capture_reader import CaptureReader
+from uartexe.faults import sequenced_frames
+from uartexe.trigger import ALARM, CHECKSUM, STATUS, TriggerCapture
+
+PERIOD_NS = 20_000_000
+BLOCK = 4
+PMON = 25  # bit 7 set while power is good
+
+
+def power_fail_frames(count=400, first=300, last=320):
+    frames = []
+    for n, frame in enumerate(sequenced_frames(count, seed=1)):
+        frame = bytearray(frame)
+        frame[PMON] |= 0x80
+        if first <= n < last:
+            frame[PMON] &= 0x7F
+        frame[-1] = protocol.checksum(frame[:-1])
+        frames.append(bytes(frame))
+    return frames
+
+
+def feed(trigger, frames, **kwargs):
+    """Blocks of BLOCK frames, each stamped with the arrival time of its last frame"""
+    for n in range(0, len(frames), BLOCK):
+        trigger.update(b"".join(frames[n:n + BLOCK]), (n + BLOCK - 1) * PERIOD_NS, **kwargs)
+
+
+@pytest.fixture
+def frames():
+    return power_fail_frames()
+
+
+def test_status_edge_window(tmp_path, frames):
+    trigger = TriggerCapture(str(tmp_path), pre_s=1.0, post_s=0.5, capacity=200)
+    feed(trigger, frames)
+    trigger.close()
+    snapshot = trigger.snapshot()
+    assert snapshot["triggers"] == 1  # the rising edge back to POWER OK is not a trigger
+    assert snapshot["captures_dropped"] == 0
+    [capture] = snapshot["captures"]
+    assert (capture["source"], capture["label"]) == (STATUS, "PMON POWER FAIL")
+    assert capture["trigger_ns"] == 303 * PERIOD_NS
+
+    # Pre-trigger: blocks stamped 1 s or less before the trigger block; post-trigger: blocks up to 0.5 s after it
+    assert capture["frames"] == 76
+    assert capture["trigger_frame"] == 48
+    assert not capture["truncated"]
+    with CaptureReader(capture["path"]) as reader:
+        assert [bytes(row) for row in reader.frames()] == frames[252:328]
+        assert reader.start_ns == 255 * PERIOD_NS
+        assert reader.end_ns == 327 * PERIOD_NS
+    with open(os.path.splitext(capture["path"])[0] + ".json", encoding="utf-8") as f:
+        assert json.load(f) == capture
+
+
+def test_poll_writes_capture_on_a_silent_link(tmp_path, frames):
+    trigger = TriggerCapture(str(tmp_path), pre_s=1.0, post_s=0.5, capacity=200)
+    # The link goes quiet right after the POWER FAIL frames
+    feed(trigger, frames[:308])
+    trigger.poll(303 * PERIOD_NS + 500_000_000)
+    assert trigger.snapshot()["collecting"]
+    trigger.poll(303 * PERIOD_NS + 500_000_001)
+    assert not trigger.snapshot()["collecting"]
+    trigger.flush()
+    [capture] = trigger.snapshot()["captures"]
+    assert capture["frames"] == 56
+    assert capture["trigger_frame"] == 48
+    trigger.close()
+
+
+def test_ring_overrun_truncates_window(tmp_path, frames):
+    trigger = TriggerCapture(str(tmp_path), pre_s=1.0, post_s=0.5, capacity=60)
+    feed(trigger, frames)
+    trigger.close()
+    [capture] = trigger.snapshot()["captures"]
+    assert capture["frames"] == 60
+    assert capture["truncated"]
+    assert capture["trigger_frame"] == 32
+    with CaptureReader(capture["path"]) as reader:
+        assert [bytes(row) for row in reader.frames()] == frames[268:328]
+
+
+def test_no_trigger_without_an_edge(tmp_path):
+    # Power already failed when the first frame arrived
+    trigger = TriggerCapture(str(tmp_path), pre_s=0.1, post_s=0.1, capacity=50)
+    feed(trigger, power_fail_frames(count=40, first=0, last=40))
+    trigger.close()
+    assert trigger.snapshot()["triggers"] == 0
+
+
+def test_alarm_trigger(tmp_path, frames):
+    trigger = TriggerCapture(str(tmp_path), pre_s=0.1, post_s=0.1, capacity=50, status_triggers=())
+    feed(trigger, frames[:20])
+    raised = AlarmEvent(0, 30, "GPU_TEMP", RAISE, "HIGH", 110.0, 105.0, 110.0)
+    cleared = raised._replace(kind=CLEAR)
+    trigger.update(frames[20], 20 * PERIOD_NS, alarm_events=[cleared])
+    assert not trigger.snapshot()["collecting"]
+    trigger.update(frames[21], 21 * PERIOD_NS, alarm_events=[raised])
+    trigger.update(frames[22], 22 * PERIOD_NS, alarm_events=[raised._replace(name="TMP100_GPU_TEMP")])
+    trigger.close()
+    [capture] = trigger.snapshot()["captures"]
+    assert (capture["source"], capture["label"]) == (ALARM, "GPU_TEMP HIGH")
+    # The second alarm arrived while the first capture was collecting
+    assert [t["label"] for t in capture["triggers"]] == ["GPU_TEMP HIGH", "TMP100_GPU_TEMP HIGH"]
+    assert [t["frame"] for t in capture["triggers"]] == [capture["trigger_frame"], capture["trigger_frame"] + 1]
+
+
+def test_checksum_burst_trigger(tmp_path, frames):
+    trigger = TriggerCapture(str(tmp_path), pre_s=0.1, post_s=0.1, capacity=50, status_triggers=(),
+                             checksum_burst=5, checksum_window_s=1.0)
+    failures = [0, 2, 4, 4, 6]  # 6 failures within a second, the fifth one in the last block
+    for n, count in enumerate(failures):
+        trigger.update(frames[n], n * PERIOD_NS, checksum_failures=count)
+        assert trigger.snapshot()["collecting"] == (n == len(failures) - 1)
+    trigger.close()
+    [capture] = trigger.snapshot()["captures"]
+    assert (capture["source"], capture["label"]) == (CHECKSUM, "6 checksum failures")
+    assert capture["trigger_frame"] == 4
+
+
+def test_trigger_on_empty_ring(tmp_path, frames):
+    trigger = TriggerCapture(str(tmp_path), pre_s=0.1, post_s=0.1, capacity=10)
+    event = AlarmEvent(0, 0, "X", RAISE, "LOW", 0.0, 1.0, 0.0)
+    trigger.update(b"", 0, alarm_events=[event])
+    trigger.update(b"".join(frames[:3]), 1)
+    trigger.close()
+    [capture] = trigger.snapshot()["captures"]
+    assert capture["trigger_frame"] == 0
+    assert capture["frames"] == 3
+
+
+def test_reset_drops_pending_capture(tmp_path, frames):
+    trigger = TriggerCapture(str(tmp_path), pre_s=1.0, post_s=0.5, capacity=200)
+    feed(trigger, frames[:304])
+    assert trigger.snapshot()["collecting"]
+    trigger.reset()
+    snapshot = trigger.snapshot()
+    assert not snapshot["collecting"]
+    assert snapshot["stored"] == 0
+    trigger.close()
+    assert trigger.snapshot()["captures"] == []
@@ -0,0 +1,13 @@
+"""
+UARTEXE protocol core
+Qt-free building blocks shared by the monitoring GUI and the headless tools
+"""
+
+from . import protocol
+from .capture import CaptureWriter
+from .frame_queue import FrameQueue, OverflowPolicy
+from .framer import PacketFramer
+from .schema import compile_schema
+
+__all__ = ["CaptureWriter", "FrameQueue", "OverflowPolicy", "PacketFramer",
+           "compile_schema", "protocol"]
@@ -0,0 +1,157 @@
+"""
+Limit alarms
+Checks every V/I/P and temperature channel against its limits in one
+vectorized pass per frame, using the schema's numeric limit arrays where
+NaN means "no limit". An alarm is raised after `debounce` consecutive
+out-of-range samples and cleared after `clear_debounce` consecutive samples
+back inside the limits by more than the hysteresis band, so a value sitting
+on a boundary does not flicker. Raise and clear events are kept in a bounded
+log with their monotonic timestamps.
+"""
+
+import threading
+from collections import deque, namedtuple
+
+import numpy as np
+
+from .decode import ChannelDecoder, as_frames
+
+RAISE = "RAISE"
+CLEAR = "CLEAR"
+LOW = "LOW"
+HIGH = "HIGH"
+
+# Hysteresis band as a fraction of the limit span, capped at that fraction of the
+# limit itself, so a 0..255 placeholder range does not hold an alarm at 0 for 5 units
+HYSTERESIS = 0.02
+DEBOUNCE = 3
+EVENTS = 1000
+
+# value is the sample that raised or cleared; extreme is the worst value seen while active
+AlarmEvent = namedtuple("AlarmEvent", "timestamp_ns channel name kind side value limit extreme")
+
+
+class AlarmEngine:
+    """Debounced, hysteretic limit alarms over every decoded channel
+
+    update() is called by the reader thread with each block of frames;
+    the GUI reads the state and the event log, so both are guarded by a lock.
+    """
+
+    def __init__(self, schema, hysteresis=HYSTERESIS, debounce=DEBOUNCE, clear_debounce=None,
+                 events=EVENTS):
+        self.decoder = ChannelDecoder(schema)
+        self.names = self.decoder.names
+        self.units = self.decoder.units
+        self.lo = self.decoder.lo
+        self.hi = self.decoder.hi
+        self.debounce = debounce
+        self.clear_debounce = clear_debounce or debounce
+
+        # Clearing needs the value inside the limits by the band; NaN limits never block it.
+        # fmin skips the NaN span of one-sided limits and caps wide placeholder spans.
+        span = self.hi - self.lo
+        self.clear_lo = self.lo + hysteresis * np.fmin(span, np.abs(self.lo))
+        self.clear_hi = self.hi - hysteresis * np.fmin(span, np.abs(self.hi))
+
+        self._lock = threading.Lock()
+        self.events = deque(maxlen=events)
+        self.reset()
+
+    def reset(self):
+        """Clear every alarm, counter and the event log"""
+        channels = len(self.names)
+        with self._lock:
+            self.active = np.zeros(channels, dtype=bool)
+            self.side = np.zeros(channels, dtype=np.int8)  # -1 low, +1 high while active
+            self.extreme = np.full(channels, np.nan)
+            self.raised = np.zeros(channels, dtype=np.int64)
+            self.violations = np.zeros(channels, dtype=np.int64)  # out-of-range samples, debounced or not
+            self._count = np.zeros(channels, dtype=np.int64)  # consecutive samples toward the other state
+            self.events.clear()
+            self.total_events = 0
+
+    def update(self, frames, timestamp_ns):
+        """Check a block of frames received at timestamp_ns; returns the new events"""
+        frames = as_frames(frames)
+        values = self.decoder.decode(frames.reshape(-1, frames.shape[-1]))
+        low = values < self.lo
+        high = values > self.hi
+        out = low | high
+        inside = ~((values < self.clear_lo) | (values > self.clear_hi))
+
+        with self._lock:
+            self.violations += out.sum(axis=0)
+            # Common case: all quiet and every sample in range
+            if not (out.any() or self._count.any() or self.active.any()):
+                return []
+            # Steady block: active channels never came back inside and the others
+            # never left their limits, so only the extremes move
+            active = self.active
+            if not (self._count.any() or (active & inside.any(axis=0)).any()
+                    or (~active & out.any(axis=0)).any()):
+                self.extreme = np.where(self.side < 0, np.fmin(self.extreme, values.min(axis=0)),
+                                        np.where(self.side > 0, np.fmax(self.extreme, values.max(axis=0)),
+                                                 self.extreme))
+                return []
+            events = []
+            for row in range(len(values)):
+                self._step(values[row], low[row], high[row], out[row], inside[row], timestamp_ns, events)
+            return events
+
+    def _step(self, values, low, high, out, inside, timestamp_ns, events):
+        active = self.active
+        toward = np.where(active, inside, out)
+        count = np.where(toward, self._count + 1, 0)
+
+        # Track the worst value of every active alarm
+        self.extreme = np.where(self.side < 0, np.fmin(self.extreme, values),
+                                np.where(self.side > 0, np.fmax(self.extreme, values), self.extreme))
+
+        raising = ~active & (count >= self.debounce)
+        clearing = active & (count >= self.clear_debounce)
+        if raising.any() or clearing.any():
+            for channel in np.flatnonzero(clearing).tolist():
+                side = LOW if self.side[channel] < 0 else HIGH
+                limit = self.clear_lo[channel] if side == LOW else self.clear_hi[channel]
+                self._event(events, timestamp_ns, channel, CLEAR, side, values[channel], limit)
+                active[channel] = False
+                self.side[channel] = 0
+            for channel in np.flatnonzero(raising).tolist():
+                side = LOW if low[channel] else HIGH
+                active[channel] = True
+                self.side[channel] = -1 if side == LOW else 1
+                self.extreme[channel] = values[channel]
+                self.raised[channel] += 1
+                limit = self.lo[channel] if side == LOW else self.hi[channel]
+                self._event(events, timestamp_ns, channel, RAISE, side, values[channel], limit)
+            count[raising | clearing] = 0
+        self._count = count
+
+    def _event(self, events, timestamp_ns, channel, kind, side, value, limit):
+        event = AlarmEvent(timestamp_ns, channel, self.names[channel], kind, side,
+                           float(value), float(limit), float(self.extreme[channel]))
+        self.events.append(event)
+        self.total_events += 1
+        events.append(event)
+
+    def clear_events(self):
+        """Empty the event log; alarm states are kept"""
+        with self._lock:
+            self.events.clear()
+
+    def snapshot(self):
+        """Copies of the active flags, raise counts and violation counts, plus the event log"""
+        with self._lock:
+            return {
+                "active": self.active.copy(),
+                "raised": self.raised.copy(),
+                "violations": self.violations.copy(),
+                "total_events": self.total_events,
+                "events": list(self.events),
+            }
+
+    def active_channels(self):
+        """Indices of the channels with an active alarm"""
+        with self._lock:
+            return np.flatnonzero(self.active).tolist()
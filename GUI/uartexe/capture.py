@@ -0,0 +1,191 @@
+"""
+Binary capture file format and recorder
+A capture is a fixed header followed by fixed-size records, written
+append-only. Every record carries a time.monotonic_ns timestamp, and after
+every index_interval data records an INDEX record summarises the block so
+a reader can seek by time without scanning the whole file.
+
+File header (HEADER_SIZE bytes, little endian):
+    magic b"UXCAP001", version u16, record size u16, index interval u32,
+    wall clock time_ns at start i64, monotonic_ns at start i64
+
+Record (RECORD_SIZE bytes):
+    timestamp_ns i64, kind u8, flags u8, length u16, payload[PACKET_SIZE]
+    Only the first length payload bytes are meaningful, the rest is zero.
+
+INDEX payload: first timestamp i64, last timestamp i64,
+    first data record number u64, frames in the block u64
+"""
+
+import struct
+import threading
+import time
+
+from .protocol import PACKET_SIZE
+
+MAGIC = b"UXCAP001"
+VERSION = 1
+
+FILE_HEADER = struct.Struct("<8sHHIqq")
+RECORD_HEADER = struct.Struct("<qBBH")
+INDEX_PAYLOAD = struct.Struct("<qqQQ")
+
+HEADER_SIZE = FILE_HEADER.size
+PAYLOAD_SIZE = PACKET_SIZE
+RECORD_SIZE = RECORD_HEADER.size + PAYLOAD_SIZE
+
+# Record kinds
+KIND_FRAME = 1   # validated 133-byte telemetry frame
+KIND_RAW = 2     # raw received bytes, long reads are split over several records
+KIND_TX = 3      # command packet sent to the device
+KIND_INDEX = 4   # summary of the preceding block of data records
+
+# Record flags
+FLAG_PARTIAL_INDEX = 0x01  # INDEX written on close for an incomplete block
+
+INDEX_INTERVAL = 4096
+BATCH_RECORDS = 256
+FLUSH_INTERVAL_NS = 1_000_000_000
+
+_ZEROS = bytes(PAYLOAD_SIZE)
+
+
+class CaptureWriter:
+    """Thread-safe append-only recorder
+
+    Records are packed into a preallocated batch buffer and written with one
+    unbuffered write per batch, or at least once per second while records keep
+    arriving, so a crash loses little data. The check runs when a record is
+    added, so owners call flush() about once per second to cover idle links.
+    Timestamps are clamped to be non-decreasing across threads.
+    """
+
+    def __init__(self, path, record_raw=False, record_tx=True,
+                 index_interval=INDEX_INTERVAL, batch_records=BATCH_RECORDS):
+        if index_interval < 1 or batch_records < 1:
+            raise ValueError("index_interval and batch_records must be positive")
+        self.path = path
+        self.record_raw = record_raw
+        self.record_tx = record_tx
+        self.index_interval = index_interval
+
+        self._lock = threading.Lock()
+        self._batch = bytearray(RECORD_SIZE * batch_records)
+        self._batch_view = memoryview(self._batch)
+        self._batch_used = 0
+        self._last_ts = 0
+        self._last_flush = time.monotonic_ns()
+
+        # Current index block
+        self._block_records = 0
+        self._block_frames = 0
+        self._block_first_ts = 0
+        self._block_first_record = 0
+
+        self.records_written = 0
+        self.data_records = 0
+        self.frames_written = 0
+        self.bytes_written = 0
+
+        self._file = open(path, "wb", buffering=0)
+        self._file.write(FILE_HEADER.pack(MAGIC, VERSION, RECORD_SIZE, index_interval,
+                                          time.time_ns(), self._last_flush))
+        self.bytes_written += HEADER_SIZE
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def closed(self):
+        return self._file is None
+
+    def write_frame(self, frame, timestamp_ns=None):
+        """Record one validated telemetry frame"""
+        self._append_data(KIND_FRAME, frame, timestamp_ns)
+
+    def write_raw(self, chunk, timestamp_ns=None):
+        """Record raw received bytes if raw recording is enabled"""
+        if not self.record_raw:
+            return
+        with memoryview(chunk) as data:
+            for offset in range(0, len(data), PAYLOAD_SIZE):
+                self._append_data(KIND_RAW, data[offset:offset + PAYLOAD_SIZE], timestamp_ns)
+
+    def write_tx(self, packet, timestamp_ns=None):
+        """Record a sent command packet if TX recording is enabled"""
+        if self.record_tx:
+            self._append_data(KIND_TX, packet, timestamp_ns)
+
+    def _append_data(self, kind, payload, timestamp_ns):
+        with self._lock:
+            if self._file is None:
+                return
+            if timestamp_ns is None:
+                timestamp_ns = time.monotonic_ns()
+            timestamp_ns = max(timestamp_ns, self._last_ts)
+            self._last_ts = timestamp_ns
+
+            if not self._block_records:
+                self._block_first_ts = timestamp_ns
+                self._block_first_record = self.records_written
+            self._append(kind, 0, payload, timestamp_ns)
+            self.data_records += 1
+            self._block_records += 1
+            if kind == KIND_FRAME:
+                self.frames_written += 1
+                self._block_frames += 1
+
+            if self._block_records == self.index_interval:
+                self._append_index(0)
+            if timestamp_ns - self._last_flush >= FLUSH_INTERVAL_NS:
+                self._write_batch(timestamp_ns)
+
+    def _append(self, kind, flags, payload, timestamp_ns):
+        """Pack one record into the batch buffer; the caller holds the lock"""
+        # A full batch is written lazily, right before the next record needs room
+        if self._batch_used == len(self._batch):
+            self._write_batch(timestamp_ns)
+        length = len(payload)
+        offset = self._batch_used
+        start = offset + RECORD_HEADER.size
+        RECORD_HEADER.pack_into(self._batch, offset, timestamp_ns, kind, flags, length)
+        self._batch_view[start:start + length] = payload
+        self._batch_view[start + length:offset + RECORD_SIZE] = _ZEROS[length:]
+        self._batch_used += RECORD_SIZE
+        self.records_written += 1
+
+    def _append_index(self, flags):
+        """Close the current block with an INDEX record"""
+        payload = INDEX_PAYLOAD.pack(self._block_first_ts, self._last_ts,
+                                     self._block_first_record, self._block_frames)
+        self._append(KIND_INDEX, flags, payload, self._last_ts)
+        self._block_records = 0
+        self._block_frames = 0
+
+    def _write_batch(self, now_ns):
+        """Write the packed records with a single write call"""
+        if self._batch_used:
+            self._file.write(self._batch_view[:self._batch_used])
+            self.bytes_written += self._batch_used
+            self._batch_used = 0
+        self._last_flush = now_ns
+
+    def flush(self):
+        """Write any batched records to the file"""
+        with self._lock:
+            if self._file is not None:
+                self._write_batch(time.monotonic_ns())
+
+    def close(self):
+        """Index the last partial block, flush and close the file"""
+        with self._lock:
+            if self._file is None:
+                return
+            if self._block_records:
+                self._append_index(FLAG_PARTIAL_INDEX)
+            self._write_batch(time.monotonic_ns())
+            self._file.close()
+            self._file = None
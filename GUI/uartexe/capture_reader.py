@@ -0,0 +1,172 @@
+"""
+Memory-mapped capture reader
+The capture file is mapped once and viewed as a NumPy structured array of
+fixed-size records, so nothing is read until it is touched. Time seeks go
+through the INDEX records first and then binary-search a single block,
+touching only a handful of pages even in a multi-GB soak log.
+"""
+
+import mmap
+
+import numpy as np
+
+from .capture import (FILE_HEADER, FLAG_PARTIAL_INDEX, HEADER_SIZE, INDEX_PAYLOAD, KIND_FRAME,
+                      KIND_INDEX, MAGIC, PAYLOAD_SIZE, RECORD_SIZE, VERSION)
+
+RECORD_DTYPE = np.dtype([
+    ("timestamp_ns", "<i8"),
+    ("kind", "u1"),
+    ("flags", "u1"),
+    ("length", "<u2"),
+    ("payload", "u1", (PAYLOAD_SIZE,)),
+])
+
+INDEX_DTYPE = np.dtype([
+    ("first_ns", "<i8"),
+    ("last_ns", "<i8"),
+    ("first_record", "<u8"),
+    ("frames", "<u8"),
+])
+
+# Frames scanned per step by find()
+FIND_CHUNK = 65536
+
+assert RECORD_DTYPE.itemsize == RECORD_SIZE
+assert INDEX_DTYPE.itemsize == INDEX_PAYLOAD.size
+
+
+class CaptureReader:
+    """Read-only, zero-copy access to a capture written by CaptureWriter
+
+    records, timestamps, kinds and payloads are views into the mapping.
+    A trailing partial record left by a crash is ignored.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            header = f.read(HEADER_SIZE)
+            if len(header) < HEADER_SIZE:
+                raise ValueError(f"{path} is too short to be a capture file")
+            (magic, version, record_size, self.index_interval,
+             self.start_wall_ns, self.start_monotonic_ns) = FILE_HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a capture file")
+            if version != VERSION or record_size != RECORD_SIZE:
+                raise ValueError(f"Unsupported capture version {version} / record size {record_size}")
+
+            count = (f.seek(0, 2) - HEADER_SIZE) // RECORD_SIZE
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if count else None
+
+        if count:
+            self.records = np.frombuffer(self._mmap, dtype=RECORD_DTYPE, count=count,
+                                         offset=HEADER_SIZE)
+        else:
+            self.records = np.zeros(0, dtype=RECORD_DTYPE)
+        self.timestamps = self.records["timestamp_ns"]
+        self.kinds = self.records["kind"]
+        self.payloads = self.records["payload"]
+        self.index_positions, self.index = self._read_index()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return len(self.records)
+
+    def close(self):
+        """Drop the views and unmap the file"""
+        self.records = self.timestamps = self.kinds = self.payloads = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass  # views handed out are still alive; unmapped when they are released
+            self._mmap = None
+
+    def _read_index(self):
+        """Record numbers and payloads of the INDEX records"""
+        # Full blocks put their INDEX at fixed positions; close() may add a partial one
+        step = self.index_interval + 1
+        positions = np.arange(self.index_interval, len(self), step)
+        if len(self) and self.kinds[-1] == KIND_INDEX and self.records["flags"][-1] & FLAG_PARTIAL_INDEX:
+            positions = np.append(positions, len(self) - 1)
+        positions = positions[self.kinds[positions] == KIND_INDEX]
+        payloads = np.ascontiguousarray(self.payloads[positions, :INDEX_DTYPE.itemsize])
+        return positions, payloads.view(INDEX_DTYPE).reshape(-1)
+
+    @property
+    def start_ns(self):
+        return int(self.timestamps[0]) if len(self) else self.start_monotonic_ns
+
+    @property
+    def end_ns(self):
+        return int(self.timestamps[-1]) if len(self) else self.start_monotonic_ns
+
+    @property
+    def frame_count(self):
+        """Number of frames in the indexed blocks"""
+        return int(self.index["frames"].sum())
+
+    def to_wall_ns(self, timestamp_ns):
+        """Convert a record timestamp to wall clock time_ns"""
+        return self.start_wall_ns + (timestamp_ns - self.start_monotonic_ns)
+
+    def from_wall_ns(self, wall_ns):
+        """Convert wall clock time_ns to a record timestamp"""
+        return self.start_monotonic_ns + (wall_ns - self.start_wall_ns)
+
+    def seek(self, timestamp_ns):
+        """Number of the first record at or after timestamp_ns (len(self) if none)"""
+        lo, hi = 0, len(self)
+        if len(self.index):
+            # First block that ends at or after the time, then a binary search inside it
+            block = int(np.searchsorted(self.index["last_ns"], timestamp_ns))
+            if block < len(self.index):
+                hi = int(self.index_positions[block]) + 1
+                if block:
+                    lo = int(self.index_positions[block - 1]) + 1
+            else:
+                lo = int(self.index_positions[-1]) + 1
+        return lo + int(np.searchsorted(self.timestamps[lo:hi], timestamp_ns))
+
+    def window(self, start_ns=None, end_ns=None, kind=KIND_FRAME):
+        """
+        (timestamps, payloads) of the records of one kind in [start_ns, end_ns).
+        Payloads are an (N, 133) uint8 array; it is a zero-copy view when the
+        window holds nothing but that kind, e.g. a frames-only capture.
+        """
+        lo = 0 if start_ns is None else self.seek(start_ns)
+        hi = len(self) if end_ns is None else self.seek(end_ns)
+        records = self.records[lo:hi]
+        mask = records["kind"] == kind
+        if mask.all():
+            return records["timestamp_ns"], records["payload"]
+        return records["timestamp_ns"][mask], records["payload"][mask]
+
+    def frames(self, start_ns=None, end_ns=None):
+        """(N, 133) telemetry frames in [start_ns, end_ns)"""
+        return self.window(start_ns, end_ns)[1]
+
+    def frame(self, record):
+        """Zero-copy memoryview of one record's payload"""
+        return memoryview(self.payloads[record])[:int(self.records["length"][record])]
+
+    def find(self, index, mask, value, start_ns=None):
+        """
+        Timestamp of the first frame at or after start_ns whose byte index,
+        masked with mask, equals value; None if there is none.
+        Scans forward in chunks so an early match returns without reading the rest.
+        """
+        pos = 0 if start_ns is None else self.seek(start_ns)
+        while pos < len(self):
+            chunk = self.records[pos:pos + FIND_CHUNK]
+            hits = np.flatnonzero((chunk["kind"] == KIND_FRAME)
+                                  & ((chunk["payload"][:, index] & mask) == value))
+            if len(hits):
+                return int(chunk["timestamp_ns"][hits[0]])
+            pos += FIND_CHUNK
+        return None
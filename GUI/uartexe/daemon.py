@@ -0,0 +1,262 @@
+"""
+Headless telemetry daemon
+Reads the UART link with the shared framer and schema and streams decoded
+frames to a file or stdout, without PyQt5 or a display.
+
+    python -m uartexe.daemon --port /dev/ttyUSB0 --baud 115200 --output telemetry.csv
+    python -m uartexe.daemon --port /dev/ttyUSB0 --output /dev/null --record soak.uxcap
+    python -m uartexe.daemon --port /dev/ttyUSB0 --output /dev/null --timing-report cadence.json
+"""
+
+import abc
+import argparse
+import csv
+import json
+import signal
+import sys
+import time
+
+from .capture import CaptureWriter
+from .framer import PacketFramer
+from .schema import BITFIELD, MEASUREMENT, TEMPERATURE, compile_schema
+from .timing import FrameTiming, byte_time_ns
+
+FORMATS = ("csv", "jsonl", "raw")
+PARITIES = ("N", "E", "O")
+
+# Signal kinds written as decoded columns; RAW bytes are only kept by the raw format
+DECODED_KINDS = (BITFIELD, MEASUREMENT, TEMPERATURE)
+
+
+class DecodedFrameWriter(abc.ABC):
+    """Writes one decoded record per frame: wall clock time plus every decoded signal"""
+
+    def __init__(self, stream, schema):
+        self.stream = stream
+        self.schema = schema
+        self.indices = [i for i in range(schema.size) if schema.kind[i] in DECODED_KINDS]
+        self.fields = ["time"] + [schema.names[i] for i in self.indices]
+
+    def values(self, frame):
+        """Decoded numbers of the selected indices, measurements rounded to the LSB range"""
+        decode = self.schema.decode
+        values = []
+        for i in self.indices:
+            number = decode(i, frame)[0]
+            values.append(round(number, 6) if isinstance(number, float) else number)
+        return values
+
+    @abc.abstractmethod
+    def write(self, timestamp, frame):
+        """Write one frame received at wall clock time timestamp"""
+
+    def flush(self):
+        self.stream.flush()
+
+
+class CsvFrameWriter(DecodedFrameWriter):
+    """One CSV row per frame, with a header row naming the signals"""
+
+    def __init__(self, stream, schema):
+        super().__init__(stream, schema)
+        self._writer = csv.writer(stream)
+        self._writer.writerow(self.fields)
+
+    def write(self, timestamp, frame):
+        self._writer.writerow([f"{timestamp:.6f}", *self.values(frame)])
+
+
+class JsonlFrameWriter(DecodedFrameWriter):
+    """One JSON object per line, keyed by signal name"""
+
+    def write(self, timestamp, frame):
+        record = dict(zip(self.fields, [round(timestamp, 6), *self.values(frame)]))
+        self.stream.write(json.dumps(record, separators=(",", ":")))
+        self.stream.write("\n")
+
+
+class RawFrameWriter:
+    """Validated 133-byte frames written back to back, without timestamps"""
+
+    def __init__(self, stream, schema=None):
+        self.stream = stream
+
+    def write(self, timestamp, frame):
+        self.stream.write(frame)
+
+    def flush(self):
+        self.stream.flush()
+
+
+WRITERS = {"csv": CsvFrameWriter, "jsonl": JsonlFrameWriter, "raw": RawFrameWriter}
+
+
+class TelemetryDaemon:
+    """Read loop: serial port -> PacketFramer -> frame writer (and optional capture)"""
+
+    # Largest single read, also bounded by the framer's free space
+    READ_SIZE = 4096
+
+    def __init__(self, port, writer, count=None, flush_interval=1.0, recorder=None):
+        self.port = port
+        self.writer = writer
+        self.recorder = recorder
+        self.count = count
+        self.flush_interval = flush_interval
+        self.framer = PacketFramer()
+        self.timing = FrameTiming()
+        self.byte_time_ns = byte_time_ns(port)
+        self.frames_written = 0
+        self._running = False
+
+    def stop(self):
+        """Ask the read loop to finish after the current read"""
+        self._running = False
+
+    def run(self):
+        """Frame and write until stopped, count frames are written or the port fails"""
+        port = self.port
+        framer = self.framer
+        writer = self.writer
+        self._running = True
+        next_flush = time.monotonic() + self.flush_interval
+
+        try:
+            while self._running:
+                # Block for at most the port timeout when nothing is waiting
+                count = framer.readinto(port, min(port.in_waiting or 1, self.READ_SIZE))
+                if count:
+                    self._handle_read(count)
+
+                if time.monotonic() >= next_flush:
+                    writer.flush()
+                    if self.recorder is not None:
+                        self.recorder.flush()
+                    next_flush = time.monotonic() + self.flush_interval
+        finally:
+            writer.flush()
+
+    def _handle_read(self, count):
+        """Record the chunk just read and write every frame it completed"""
+        writer = self.writer
+        recorder = self.recorder
+        now = time.time()
+        received_ns = time.monotonic_ns()
+        for frame in self.framer.frames():
+            # Bytes still pending after the frame arrived after it
+            frame_ns = received_ns - self.framer.pending * self.byte_time_ns
+            self.timing.add(frame_ns)
+            writer.write(now, frame)
+            if recorder is not None:
+                recorder.write_frame(frame, frame_ns)
+            self.frames_written += 1
+            if self.count is not None and self.frames_written >= self.count:
+                self._running = False
+                break
+        # Written last so its read-completion stamp does not clamp the frame stamps
+        if recorder is not None:
+            recorder.write_raw(self.framer.tail(count), received_ns)
+
+    def summary(self):
+        """One-line framing statistics"""
+        f = self.framer
+        t = self.timing.snapshot()
+        return (f"frames={self.frames_written} bytes={f.bytes_received} "
+                f"checksum_failures={f.checksum_failures} false_headers={f.false_headers} "
+                f"discarded_bytes={f.discarded_bytes} interval_p50_ms={t['p50_ms']:.2f} "
+                f"interval_p99_ms={t['p99_ms']:.2f} interval_max_ms={t['max_ms']:.2f} "
+                f"gaps={t['gaps']} missed_frames={t['missed_frames']}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m uartexe.daemon",
+        description="Stream decoded UARTEXE telemetry frames to a file or stdout.")
+    parser.add_argument("--port", required=True, help="serial port, e.g. /dev/ttyUSB0 or COM3")
+    parser.add_argument("--baud", type=int, default=115200, help="baud rate (default 115200)")
+    parser.add_argument("--parity", choices=PARITIES, default="E",
+                        help="parity, E like the GUI (default E)")
+    parser.add_argument("--output", default="-", help="output file, '-' for stdout (default)")
+    parser.add_argument("--format", choices=FORMATS, default="csv", help="output format (default csv)")
+    parser.add_argument("--count", type=int, help="stop after this many frames")
+    parser.add_argument("--record", metavar="PATH", help="also record frames to a capture file")
+    parser.add_argument("--record-raw", action="store_true",
+                        help="include every raw received chunk in the capture")
+    parser.add_argument("--timing-report", metavar="PATH",
+                        help="write the inter-frame timing histogram to this JSON file on exit")
+    parser.add_argument("--flush-interval", type=float, default=1.0,
+                        help="seconds between output flushes (default 1.0)")
+    return parser.parse_args(argv)
+
+
+def _open_output(path, binary):
+    """Output stream for path; '-' is stdout"""
+    if path == "-":
+        return sys.stdout.buffer if binary else sys.stdout
+    if binary:
+        return open(path, "wb")
+    return open(path, "w", newline="", encoding="utf-8")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # pyserial is imported here so --help works without it
+    import serial
+
+    try:
+        port = serial.Serial(args.port, args.baud, parity=args.parity, timeout=0.1)
+    except serial.SerialException as e:
+        print(f"uartexe: cannot open {args.port}: {e}", file=sys.stderr)
+        return 1
+
+    recorder = None
+    if args.record:
+        try:
+            recorder = CaptureWriter(args.record, record_raw=args.record_raw)
+        except OSError as e:
+            print(f"uartexe: cannot open {args.record}: {e}", file=sys.stderr)
+            port.close()
+            return 1
+
+    binary = args.format == "raw"
+    try:
+        stream = _open_output(args.output, binary)
+    except OSError as e:
+        print(f"uartexe: cannot open {args.output}: {e}", file=sys.stderr)
+        port.close()
+        if recorder is not None:
+            recorder.close()
+        return 1
+    writer = WRITERS[args.format](stream, compile_schema())
+    daemon = TelemetryDaemon(port, writer, args.count, args.flush_interval, recorder)
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: daemon.stop())
+    print(f"uartexe: reading {args.port} at {args.baud} baud", file=sys.stderr)
+
+    status = 0
+    try:
+        daemon.run()
+    except KeyboardInterrupt:
+        pass
+    except serial.SerialException as e:
+        print(f"uartexe: read error: {e}", file=sys.stderr)
+        status = 1
+    finally:
+        port.close()
+        if recorder is not None:
+            recorder.close()
+        if args.timing_report:
+            try:
+                daemon.timing.export(args.timing_report)
+            except OSError as e:
+                print(f"uartexe: cannot write {args.timing_report}: {e}", file=sys.stderr)
+                status = 1
+        if stream not in (sys.stdout, sys.stdout.buffer):
+            stream.close()
+        print(f"uartexe: {daemon.summary()}", file=sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Vectorized decoding of the 16-bit V/I/P measurement pairs
+Works on a single 133-byte frame or on a stacked N x 133 block of frames
+"""
+
+import numpy as np
+
+from .protocol import PACKET_SIZE
+
+# Limit states, matching CompiledSchema.limit_state (None -> NO_LIMIT)
+NO_LIMIT = -1
+OUT_OF_RANGE = 0
+IN_RANGE = 1
+
+
+def as_frames(data):
+    """
+    View frames as uint8 without copying.
+    A single frame (bytes, bytearray, memoryview) gives a (133,) array,
+    a buffer of N whole frames or an (N, 133) array gives an (N, 133) array.
+    """
+    if isinstance(data, np.ndarray):
+        if data.dtype != np.uint8:
+            raise ValueError("Frame arrays must be uint8")
+        frames = data
+    else:
+        frames = np.frombuffer(data, dtype=np.uint8)
+    if frames.ndim == 1 and frames.size != PACKET_SIZE:
+        if frames.size % PACKET_SIZE:
+            raise ValueError(f"Buffer of {frames.size} bytes is not a whole number of frames")
+        frames = frames.reshape(-1, PACKET_SIZE)
+    if frames.shape[-1] != PACKET_SIZE:
+        raise ValueError(f"Frames must be {PACKET_SIZE} bytes wide")
+    return frames
+
+
+class MeasurementDecoder:
+    """Decodes every MEASUREMENT signal of a compiled schema in one vector pass"""
+
+    def __init__(self, schema):
+        self.indices = np.array(schema.measurement_indices, dtype=np.intp)
+        self.names = [schema.names[i] for i in self.indices]
+        self.units = [schema.unit[i] for i in self.indices]
+        self.position = {int(i): pos for pos, i in enumerate(self.indices)}
+
+        # (channels, 2) byte offsets of each MSB/LSB pair
+        self._pair_bytes = np.stack([self.indices, self.indices + 1], axis=1)
+        self._signed = np.array([schema.signed[i] for i in self.indices], dtype=bool)
+        self.scale = np.array([schema.scale[i] for i in self.indices], dtype=np.float64)
+        self.lo = np.array([schema.lo[i] for i in self.indices], dtype=np.float64)
+        self.hi = np.array([schema.hi[i] for i in self.indices], dtype=np.float64)
+        self._has_limit = ~(np.isnan(self.lo) & np.isnan(self.hi))
+
+    def raw(self, data):
+        """Combined 16-bit register values, shape (..., channels)"""
+        frames = as_frames(data)
+        # Gathering the pairs yields a contiguous (..., channels, 2) block that
+        # can be reinterpreted as big-endian int16 without per-element work.
+        words = frames.take(self._pair_bytes, axis=-1).view(">i2")[..., 0]
+        if self._signed.all():
+            return words
+        return np.where(self._signed, words, words.view(">u2"))
+
+    def decode(self, data):
+        """Scaled physical values (V, A, W), shape (..., channels)"""
+        return self.raw(data) * self.scale
+
+    def limit_states(self, values):
+        """IN_RANGE / OUT_OF_RANGE / NO_LIMIT per value; NaN limits never fail"""
+        # Comparisons against NaN are False, so missing limits pass automatically
+        in_range = ~((values < self.lo) | (values > self.hi))
+        return np.where(self._has_limit, in_range.astype(np.int8), np.int8(NO_LIMIT))
+
+
+class ChannelDecoder:
+    """V/I/P measurements followed by temperatures, as one (..., channels) array of physical values"""
+
+    def __init__(self, schema):
+        self.measurements = MeasurementDecoder(schema)
+        self.temperature_indices = np.array(schema.temperature_indices, dtype=np.intp)
+        self.indices = np.concatenate([self.measurements.indices, self.temperature_indices])
+        self.names = [schema.names[i] for i in self.indices]
+        self.units = [schema.unit[i] for i in self.indices]
+        self.lo = np.array([schema.lo[i] for i in self.indices], dtype=np.float64)
+        self.hi = np.array([schema.hi[i] for i in self.indices], dtype=np.float64)
+
+    def decode(self, data):
+        """Physical values of a frame (channels,) or of N frames (N, channels); temperatures in °C"""
+        frames = as_frames(data)
+        temperatures = frames[..., self.temperature_indices].view(np.int8)
+        return np.concatenate([self.measurements.decode(frames), temperatures], axis=-1)
@@ -0,0 +1,249 @@
+"""
+Fault injection for the telemetry byte stream
+FaultInjector corrupts a byte stream with bit flips, dropped bytes, noise
+bursts and fake headers. FaultyStream wraps any serial-like stream with it,
+and the benchmark measures how well a framer recovers:
+
+    python -m uartexe.faults --frames 20000 --bit-flip 1e-5 --drop 1e-4 --noise 1e-4 --fake-header 1e-4
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from . import protocol
+from .framer import PacketFramer
+
+# Frame bytes that carry the benchmark sequence number (HSN_TRANS_DATA_1..4)
+SEQUENCE_OFFSET = 86
+
+# Bytes fed to the framer per call, like one serial read
+CHUNK_SIZE = 4096
+
+# Framer strategies the benchmark can compare; each needs feed(data) -> frames
+FRAMERS = {"linear": PacketFramer}
+
+FAKE_HEADER = bytes((protocol.HEADER_1, protocol.HEADER_2, protocol.PACKET_LENGTH, protocol.PACKET_ID))
+
+
+class FaultInjector:
+    """Applies random faults to byte chunks
+
+    bit_flip_rate is per bit; drop_rate, noise_rate and fake_header_rate are
+    events per byte. A noise event inserts 1..noise_burst random bytes, a
+    fake header event inserts a header that passes the LENGTH/ID precheck.
+    """
+
+    def __init__(self, bit_flip_rate=0.0, drop_rate=0.0, noise_rate=0.0, noise_burst=16,
+                 fake_header_rate=0.0, seed=None):
+        self.bit_flip_rate = bit_flip_rate
+        self.drop_rate = drop_rate
+        self.noise_rate = noise_rate
+        self.noise_burst = noise_burst
+        self.fake_header_rate = fake_header_rate
+        self._rng = np.random.default_rng(seed)
+
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.bit_flips = 0
+        self.dropped_bytes = 0
+        self.noise_bursts = 0
+        self.fake_headers = 0
+
+    def inject(self, data):
+        """Return a corrupted copy of data"""
+        return self.inject_with_offsets(data)[0]
+
+    def inject_with_offsets(self, data):
+        """Return (corrupted bytes, input offsets whose byte was flipped, dropped or preceded by an insert)"""
+        rng = self._rng
+        arr = np.frombuffer(data, dtype=np.uint8).copy()
+        n = len(arr)
+        self.bytes_in += n
+        touched = []
+
+        flips = rng.binomial(n * 8, self.bit_flip_rate) if n else 0
+        if flips:
+            bits = rng.integers(0, n * 8, flips)
+            np.bitwise_xor.at(arr, bits >> 3, (1 << (bits & 7)).astype(np.uint8))
+            touched.append(bits >> 3)
+            self.bit_flips += flips
+
+        # Inserts are placed before input offsets, then drops remove input bytes
+        inserts = []
+        for rate, make in ((self.noise_rate, self._noise), (self.fake_header_rate, self._fake_header)):
+            count = rng.binomial(n, rate) if n else 0
+            for offset in rng.integers(0, n + 1, count):
+                inserts.append((int(offset), make()))
+
+        drops = rng.binomial(n, self.drop_rate) if n else 0
+        keep = np.ones(n, dtype=bool)
+        if drops:
+            dropped = rng.integers(0, n, drops)
+            keep[dropped] = False
+            touched.append(dropped)
+            self.dropped_bytes += int(n - keep.sum())
+
+        if inserts:
+            inserts.sort(key=lambda item: item[0])
+            offsets = np.array([offset for offset, _ in inserts])
+            touched.append(offsets[offsets < n])
+            pieces = []
+            previous = 0
+            for offset, payload in inserts:
+                pieces.append(arr[previous:offset][keep[previous:offset]].tobytes())
+                pieces.append(payload)
+                previous = offset
+            pieces.append(arr[previous:][keep[previous:]].tobytes())
+            out = b"".join(pieces)
+        else:
+            out = arr[keep].tobytes()
+
+        self.bytes_out += len(out)
+        offsets = np.unique(np.concatenate(touched)) if touched else np.zeros(0, dtype=np.int64)
+        return out, offsets
+
+    def _noise(self):
+        self.noise_bursts += 1
+        size = int(self._rng.integers(1, self.noise_burst + 1))
+        return self._rng.integers(0, 256, size, dtype=np.uint8).tobytes()
+
+    def _fake_header(self):
+        self.fake_headers += 1
+        return FAKE_HEADER
+
+
+class FaultyStream:
+    """Serial-like wrapper that corrupts everything read from stream"""
+
+    def __init__(self, stream, injector):
+        self.stream = stream
+        self.injector = injector
+        self._pending = b""
+
+    @property
+    def in_waiting(self):
+        return len(self._pending) + self.stream.in_waiting
+
+    def readinto(self, buffer):
+        if not self._pending:
+            chunk = self.stream.read(len(buffer))
+            if chunk:
+                self._pending = self.injector.inject(chunk)
+        count = min(len(buffer), len(self._pending))
+        buffer[:count] = self._pending[:count]
+        self._pending = self._pending[count:]
+        return count
+
+    def read(self, size=1):
+        buffer = bytearray(size)
+        return bytes(buffer[:self.readinto(buffer)])
+
+    def write(self, data):
+        return self.stream.write(data)
+
+    def close(self):
+        self.stream.close()
+
+
+def sequenced_frames(count, seed=None):
+    """count valid frames with a 32-bit sequence number; realistic values from the simulator"""
+    from .simulator import FrameGenerator
+
+    generator = FrameGenerator(seed=seed)
+    frames = []
+    for seq in range(count):
+        frame = generator.frame(seq / 50)
+        frame[SEQUENCE_OFFSET:SEQUENCE_OFFSET + 4] = seq.to_bytes(4, "big")
+        frame[-1] = protocol.checksum(frame[:-1])
+        frames.append(bytes(frame))
+    return frames
+
+
+def run_benchmark(injector, frames, framer_factory=PacketFramer, chunk_size=CHUNK_SIZE):
+    """
+    Feed the corrupted stream to a framer and compare its output with frames.
+    Returns a report dict: recovered ratio against all and against intact
+    frames, false accepts and framer CPU time per MB of corrupted input.
+    """
+    stream = b"".join(frames)
+    corrupted, touched = injector.inject_with_offsets(stream)
+    damaged = set((touched // protocol.PACKET_SIZE).tolist())
+    intact = len(frames) - len(damaged)
+
+    framer = framer_factory()
+    accepted = []
+    started = time.process_time()
+    for offset in range(0, len(corrupted), chunk_size):
+        accepted.extend(framer.feed(corrupted[offset:offset + chunk_size]))
+    cpu_seconds = time.process_time() - started
+
+    recovered = 0
+    false_accepts = 0
+    seen = set()
+    for frame in accepted:
+        seq = int.from_bytes(frame[SEQUENCE_OFFSET:SEQUENCE_OFFSET + 4], "big")
+        if seq < len(frames) and seq not in seen and frame == frames[seq]:
+            seen.add(seq)
+            recovered += 1
+        else:
+            false_accepts += 1
+
+    megabytes = len(corrupted) / 1e6
+    return {
+        "frames_sent": len(frames),
+        "frames_intact": intact,
+        "frames_recovered": recovered,
+        "recovered_ratio": recovered / len(frames) if frames else 0.0,
+        "intact_recovered_ratio": len(seen - damaged) / intact if intact else 0.0,
+        "false_accepts": false_accepts,
+        "bytes_in": injector.bytes_in,
+        "bytes_out": len(corrupted),
+        "bit_flips": injector.bit_flips,
+        "dropped_bytes": injector.dropped_bytes,
+        "noise_bursts": injector.noise_bursts,
+        "fake_headers": injector.fake_headers,
+        "checksum_failures": getattr(framer, "checksum_failures", None),
+        "false_headers": getattr(framer, "false_headers", None),
+        "cpu_seconds": cpu_seconds,
+        "cpu_ms_per_mb": cpu_seconds * 1e3 / megabytes if megabytes else 0.0,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m uartexe.faults",
+        description="Measure framer recovery under injected stream faults.")
+    parser.add_argument("--frames", type=int, default=20000, help="frames to send (default 20000)")
+    parser.add_argument("--bit-flip", type=float, default=0.0, help="bit flip probability per bit")
+    parser.add_argument("--drop", type=float, default=0.0, help="dropped bytes per byte")
+    parser.add_argument("--noise", type=float, default=0.0, help="noise bursts per byte")
+    parser.add_argument("--noise-burst", type=int, default=16, help="longest noise burst (default 16)")
+    parser.add_argument("--fake-header", type=float, default=0.0, help="fake headers per byte")
+    parser.add_argument("--framer", choices=sorted(FRAMERS), default="linear", help="framer strategy")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default 0)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    injector = FaultInjector(args.bit_flip, args.drop, args.noise, args.noise_burst,
+                             args.fake_header, seed=args.seed)
+    report = run_benchmark(injector, sequenced_frames(args.frames, seed=args.seed),
+                           FRAMERS[args.framer])
+    report["framer"] = args.framer
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for key, value in report.items():
+            print(f"{key:24} {value:.4f}" if isinstance(value, float) else f"{key:24} {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+Bounded frame queue between the reader and its consumer
+Overflow is resolved by an explicit policy and every dropped frame is counted
+"""
+
+import threading
+import time
+from collections import deque
+
+
+class OverflowPolicy:
+    """What the queue does when a frame arrives and the queue is full"""
+
+    DROP_OLDEST = "DROP OLDEST"    # evict the oldest queued frame
+    KEEP_LATEST = "KEEP LATEST"    # discard the backlog, keep only the newest frames
+    BLOCK = "BLOCK READER"         # make the reader wait for the consumer
+
+    ALL = (DROP_OLDEST, KEEP_LATEST, BLOCK)
+
+
+class FrameQueue:
+    """Thread-safe bounded FIFO of frames with drop accounting"""
+
+    def __init__(self, capacity=64, policy=OverflowPolicy.DROP_OLDEST, keep_latest=8):
+        if policy not in OverflowPolicy.ALL:
+            raise ValueError(f"Unknown overflow policy: {policy}")
+        if not 0 < keep_latest <= capacity:
+            raise ValueError("keep_latest must be between 1 and capacity")
+        self.capacity = capacity
+        self.policy = policy
+        self.keep_latest = keep_latest
+        self._frames = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+
+        self.dropped_frames = 0
+        self.dropped_bytes = 0
+        self.overflows = 0
+        self.blocked_seconds = 0.0
+        self.max_depth = 0
+
+    def __len__(self):
+        with self._cond:
+            return len(self._frames)
+
+    def set_policy(self, policy):
+        """Switch the overflow policy while the queue is in use"""
+        if policy not in OverflowPolicy.ALL:
+            raise ValueError(f"Unknown overflow policy: {policy}")
+        with self._cond:
+            self.policy = policy
+            self._cond.notify_all()
+
+    def _drop_oldest(self, count):
+        """Discard count frames from the head of the queue"""
+        for _ in range(count):
+            frame = self._frames.popleft()
+            self.dropped_frames += 1
+            self.dropped_bytes += len(frame)
+
+    def put(self, frame):
+        """
+        Queue a frame, applying the overflow policy when full.
+        Returns True if the queue was empty, i.e. the consumer needs a wake-up.
+        """
+        with self._cond:
+            if not self._closed and len(self._frames) >= self.capacity:
+                self.overflows += 1
+                if self.policy == OverflowPolicy.BLOCK:
+                    started = time.monotonic()
+                    self._cond.wait_for(
+                        lambda: (len(self._frames) < self.capacity or self._closed
+                                 or self.policy != OverflowPolicy.BLOCK))
+                    self.blocked_seconds += time.monotonic() - started
+
+                if len(self._frames) >= self.capacity and not self._closed:
+                    if self.policy == OverflowPolicy.KEEP_LATEST:
+                        self._drop_oldest(len(self._frames) - self.keep_latest + 1)
+                    else:
+                        self._drop_oldest(len(self._frames) - self.capacity + 1)
+
+            if self._closed:
+                self.dropped_frames += 1
+                self.dropped_bytes += len(frame)
+                return False
+
+            was_empty = not self._frames
+            self._frames.append(frame)
+            self.max_depth = max(self.max_depth, len(self._frames))
+            return was_empty
+
+    def get_all(self):
+        """Remove and return every queued frame, oldest first"""
+        with self._cond:
+            frames = list(self._frames)
+            self._frames.clear()
+            self._cond.notify_all()
+            return frames
+
+    def close(self):
+        """Release a blocked producer; frames put afterwards are dropped"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
@@ -0,0 +1,138 @@
+"""
+Linear-time packet framer
+Resynchronises on HEADER_1/HEADER_2 with bytes.find instead of a per-offset loop
+"""
+
+from .protocol import HEADER, HEADER_1, PACKET_ID, PACKET_LENGTH, PACKET_SIZE
+
+
+class PacketFramer:
+    """Frames 133-byte telemetry packets out of an arbitrary byte stream
+
+    Received bytes live in one preallocated buffer that is never resized.
+    New data is read straight into its free tail with readinto(), valid
+    packets are handed out as memoryview slices of it, and the few pending
+    bytes are moved back to the front once the free tail runs low.
+    """
+
+    CAPACITY = 65536
+    # Minimum free tail before the pending bytes are moved to the front
+    MIN_READ = 4096
+
+    def __init__(self, capacity=CAPACITY):
+        if capacity < self.MIN_READ + PACKET_SIZE:
+            raise ValueError(f"capacity must be at least {self.MIN_READ + PACKET_SIZE} bytes")
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._start = 0  # consume offset
+        self._end = 0    # write offset
+
+        self.bytes_received = 0
+        self.bytes_allocated = 0
+        self.valid_frames = 0
+        self.checksum_failures = 0
+        self.false_headers = 0
+        self.discarded_bytes = 0
+
+    @property
+    def pending(self):
+        """Number of received bytes not yet framed or discarded"""
+        return self._end - self._start
+
+    @property
+    def bytes_allocated_per_frame(self):
+        """Bytes copied out of the receive buffer per valid frame"""
+        if not self.valid_frames:
+            return 0.0
+        return self.bytes_allocated / self.valid_frames
+
+    def reset(self):
+        """Drop all pending bytes, counting them as discarded"""
+        self.discarded_bytes += self.pending
+        self._start = self._end = 0
+
+    def _make_room(self):
+        """Move the pending bytes to the front when the free tail runs low"""
+        if len(self._buffer) - self._end >= self.MIN_READ:
+            return
+        count = self._end - self._start
+        self._view[:count] = self._view[self._start:self._end]
+        self._start, self._end = 0, count
+
+    def readinto(self, stream, size):
+        """Read up to size bytes from stream directly into the receive buffer"""
+        self._make_room()
+        end = self._end
+        size = min(size, len(self._buffer) - end)
+        count = stream.readinto(self._view[end:end + size]) or 0
+        self._end += count
+        self.bytes_received += count
+        return count
+
+    def tail(self, count):
+        """View of the last count received bytes, e.g. the chunk of the last readinto()"""
+        return self._view[self._end - count:self._end]
+
+    def feed(self, data):
+        """Copy data into the receive buffer and return detached copies of the completed packets"""
+        packets = []
+        with memoryview(data) as src:
+            offset = 0
+            while offset < len(src):
+                self._make_room()
+                count = min(len(src) - offset, len(self._buffer) - self._end)
+                self._view[self._end:self._end + count] = src[offset:offset + count]
+                self._end += count
+                self.bytes_received += count
+                offset += count
+                packets.extend(self.detach(frame) for frame in self.frames())
+        return packets
+
+    def detach(self, frame):
+        """Copy a frame view into bytes that outlive the receive buffer"""
+        self.bytes_allocated += len(frame)
+        return bytes(frame)
+
+    def frames(self):
+        """
+        Yield the valid packets currently in the buffer as zero-copy views.
+        A view is only valid until the next readinto() or feed() call.
+        """
+        buf = self._buffer
+        view = self._view
+        end = self._end
+        pos = self._start
+
+        while end - pos >= PACKET_SIZE:
+            header_pos = buf.find(HEADER, pos, end)
+            if header_pos < 0:
+                # Keep a trailing HEADER_1, it may be the start of the next header
+                keep = 1 if buf[end - 1] == HEADER_1 else 0
+                self.discarded_bytes += end - keep - pos
+                pos = end - keep
+                break
+
+            self.discarded_bytes += header_pos - pos
+            pos = header_pos
+            if end - pos < PACKET_SIZE:
+                break  # wait for the rest of the packet
+
+            # Cheap LENGTH / PACKET_ID checks before summing 133 bytes
+            if buf[pos + 2] != PACKET_LENGTH or buf[pos + 3] != PACKET_ID:
+                self.false_headers += 1
+            elif sum(view[pos:pos + PACKET_SIZE]) & 0xFF == 0:
+                self.valid_frames += 1
+                self._start = pos + PACKET_SIZE
+                yield view[pos:pos + PACKET_SIZE]
+                pos += PACKET_SIZE
+                continue
+            else:
+                self.checksum_failures += 1
+
+            # False header or corrupted packet, resync from the next byte
+            self.discarded_bytes += 1
+            pos += 1
+
+        self._start = pos
+        if pos == end:
+            self._start = self._end = 0
@@ -0,0 +1,185 @@
+"""
+Command round-trip latency
+Each sent command packet is timestamped and matched against the telemetry
+frames that follow it; the first frame reporting the commanded state
+confirms the command. Confirmation latencies go into a fixed-bin histogram
+and commands that are not confirmed within the timeout are flagged.
+"""
+
+import bisect
+import threading
+import time
+from collections import deque
+
+from . import protocol
+from .metrics import LatencyWindow
+
+DISC_OUT_BIT_STATUS = 22
+DISC_OUT_MASK = 0x0F
+LOOPBACK_START = 128
+
+# Command packet bytes echoed by UART_LOOPBACK: sense select, DISC_OUT, LED
+LOOPBACK_COMMAND_BYTES = (4, 5, 9)
+
+# Histogram bin upper edges in ms; the last bin collects everything slower
+HISTOGRAM_EDGES_MS = (5, 10, 20, 50, 100, 200, 500, 1000, 2000)
+
+# Per match mode: command packet -> ((telemetry index, mask, expected value), ...)
+MATCHERS = {
+    "disc_out": lambda packet: ((DISC_OUT_BIT_STATUS, DISC_OUT_MASK, packet[5] & DISC_OUT_MASK),),
+    "loopback": lambda packet: tuple((LOOPBACK_START + i, 0xFF, packet[offset])
+                                     for i, offset in enumerate(LOOPBACK_COMMAND_BYTES)),
+}
+
+# Finished command outcomes kept for the event list
+CONFIRMED = "CONFIRMED"
+UNCONFIRMED = "UNCONFIRMED"
+SUPERSEDED = "SUPERSEDED"
+
+
+class CommandLatencyTracker:
+    """Matches sent commands to the telemetry that confirms them
+
+    command_sent() is called by the transmitter thread, frame_received() by
+    the reader thread and snapshot()/expire() by the GUI, so all state is
+    guarded by one lock.
+
+    A command whose expected state is already reported by the latest frame
+    cannot be confirmed by a change and is counted as unchanged instead, as
+    is one that repeats the state of the newest pending command. Older
+    pending commands are superseded when a newer one is confirmed or
+    unchanged. on_event(outcome, sent_ns, latency_ms, packet) is called for
+    every finished command on the thread that finished it.
+    """
+
+    def __init__(self, match="disc_out", timeout=1.0, budget_ms=None, edges_ms=HISTOGRAM_EDGES_MS,
+                 events=256, on_event=None):
+        self.expected = MATCHERS[match]
+        self.timeout_ns = int(timeout * 1e9)
+        self.budget_ms = budget_ms
+        self.edges_ms = tuple(edges_ms)
+        self.on_event = on_event
+
+        self._lock = threading.Lock()
+        self._pending = deque()  # (sent_ns, expected, packet)
+        self._last_frame = None  # latest frame bytes at the matched indices
+        self._indices = sorted({index for index, _, _ in self.expected(bytes(protocol.COMMAND_SIZE))})
+
+        self.histogram = [0] * (len(self.edges_ms) + 1)
+        self.latencies = LatencyWindow()  # µs
+        self.events = deque(maxlen=events)  # (outcome, sent_ns, latency ms or None, packet)
+        self.commands = 0
+        self.confirmed = 0
+        self.unconfirmed = 0
+        self.superseded = 0
+        self.unchanged = 0
+        self.over_budget = 0
+        self.max_ms = 0.0
+
+    def reset(self):
+        """Forget pending commands, results and the last seen frame"""
+        with self._lock:
+            self._pending.clear()
+            self._last_frame = None
+            self.histogram = [0] * (len(self.edges_ms) + 1)
+            self.latencies.clear()
+            self.events.clear()
+            self.commands = self.confirmed = self.unconfirmed = 0
+            self.superseded = self.unchanged = self.over_budget = 0
+            self.max_ms = 0.0
+
+    @property
+    def pending(self):
+        return len(self._pending)
+
+    def command_sent(self, packet, sent_ns=None):
+        """Start timing a command packet that has just been written"""
+        sent_ns = time.monotonic_ns() if sent_ns is None else sent_ns
+        expected = self.expected(packet)
+        with self._lock:
+            self.commands += 1
+            if self._last_frame is not None and self._matches(self._last_frame, expected):
+                self.unchanged += 1
+                self._supersede(len(self._pending))
+                return
+            if self._pending and self._pending[-1][1] == expected:
+                self.unchanged += 1
+                return
+            self._pending.append((sent_ns, expected, bytes(packet)))
+
+    def frame_received(self, frame, received_ns=None):
+        """Check a telemetry frame against the pending commands"""
+        received_ns = time.monotonic_ns() if received_ns is None else received_ns
+        with self._lock:
+            self._last_frame = {index: frame[index] for index in self._indices}
+            pending = self._pending
+            if not pending:
+                return
+            self._expire(received_ns)
+            # The newest matching command wins; anything sent before it is superseded
+            for position in range(len(pending) - 1, -1, -1):
+                sent_ns, expected, packet = pending[position]
+                if received_ns >= sent_ns and self._matches(self._last_frame, expected):
+                    self._supersede(position)
+                    pending.popleft()
+                    self._confirm(sent_ns, received_ns, packet)
+                    break
+
+    def expire(self, now_ns=None):
+        """Flag pending commands older than the timeout; returns how many were flagged"""
+        now_ns = time.monotonic_ns() if now_ns is None else now_ns
+        with self._lock:
+            return self._expire(now_ns)
+
+    def snapshot(self):
+        """Counts, p50/p99/max latency in ms and the histogram as (label, count) pairs"""
+        with self._lock:
+            labels = [f"<{edge} ms" for edge in self.edges_ms] + [f">={self.edges_ms[-1]} ms"]
+            return {
+                "commands": self.commands,
+                "confirmed": self.confirmed,
+                "unconfirmed": self.unconfirmed,
+                "superseded": self.superseded,
+                "unchanged": self.unchanged,
+                "pending": len(self._pending),
+                "over_budget": self.over_budget,
+                "p50_ms": self.latencies.percentile(50) / 1000,
+                "p99_ms": self.latencies.percentile(99) / 1000,
+                "max_ms": self.max_ms,
+                "histogram": list(zip(labels, self.histogram)),
+            }
+
+    @staticmethod
+    def _matches(values, expected):
+        return all(values[index] & mask == value for index, mask, value in expected)
+
+    def _confirm(self, sent_ns, received_ns, packet):
+        latency_ms = (received_ns - sent_ns) / 1e6
+        self.confirmed += 1
+        self.histogram[bisect.bisect_right(self.edges_ms, latency_ms)] += 1
+        self.latencies.add(latency_ms * 1000)
+        self.max_ms = max(self.max_ms, latency_ms)
+        if self.budget_ms is not None and latency_ms > self.budget_ms:
+            self.over_budget += 1
+        self._event(CONFIRMED, sent_ns, latency_ms, packet)
+
+    def _supersede(self, count):
+        for _ in range(count):
+            sent_ns, _, packet = self._pending.popleft()
+            self.superseded += 1
+            self._event(SUPERSEDED, sent_ns, None, packet)
+
+    def _event(self, outcome, sent_ns, latency_ms, packet):
+        self.events.append((outcome, sent_ns, latency_ms, packet))
+        if self.on_event is not None:
+            self.on_event(outcome, sent_ns, latency_ms, packet)
+
+    def _expire(self, now_ns):
+        expired = 0
+        pending = self._pending
+        while pending and now_ns - pending[0][0] > self.timeout_ns:
+            sent_ns, _, packet = pending.popleft()
+            self.unconfirmed += 1
+            self._event(UNCONFIRMED, sent_ns, None, packet)
+            expired += 1
+        return expired
@@ -0,0 +1,106 @@
+"""
+Sliding-window pipeline metrics
+Rates are derived from the cumulative counters the framer and frame queue
+already keep, sampled periodically; stage timings keep the last N samples
+in a fixed ring so recording a timing is a list store.
+"""
+
+import math
+import time
+from collections import deque
+
+
+class LatencyWindow:
+    """Last size durations (µs) with percentile readout"""
+
+    def __init__(self, size=1024):
+        self._samples = [0.0] * size
+        self._pos = 0
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def add(self, micros):
+        self._samples[self._pos] = micros
+        self._pos = (self._pos + 1) % len(self._samples)
+        if self._count < len(self._samples):
+            self._count += 1
+
+    def percentile(self, p):
+        """Nearest-rank percentile (0-100) of the samples in the window, 0.0 if empty"""
+        if not self._count:
+            return 0.0
+        ordered = sorted(self._samples[:self._count])
+        rank = min(self._count - 1, max(0, math.ceil(p / 100 * self._count) - 1))
+        return ordered[rank]
+
+    def clear(self):
+        self._pos = 0
+        self._count = 0
+
+
+class RateWindow:
+    """Per-second rates of cumulative counters over the last window seconds"""
+
+    def __init__(self, window=5.0):
+        self.window = window
+        self._samples = deque()  # (monotonic seconds, counters dict)
+
+    def sample(self, counters, now=None):
+        """Store the current cumulative counter values"""
+        now = time.monotonic() if now is None else now
+        self._samples.append((now, dict(counters)))
+        # Keep one sample at or beyond the window edge as the rate baseline
+        while len(self._samples) > 2 and now - self._samples[1][0] >= self.window:
+            self._samples.popleft()
+
+    def rate(self, name):
+        """Increase per second of a counter across the window"""
+        if len(self._samples) < 2:
+            return 0.0
+        (t0, first), (t1, last) = self._samples[0], self._samples[-1]
+        if t1 <= t0:
+            return 0.0
+        return max(0.0, (last[name] - first[name]) / (t1 - t0))
+
+    def total(self, name):
+        """Latest cumulative value of a counter"""
+        return self._samples[-1][1][name] if self._samples else 0
+
+    def clear(self):
+        self._samples.clear()
+
+
+class PipelineMetrics:
+    """Link and stage health: counter rates plus decode / render timings"""
+
+    COUNTERS = ("bytes", "frames", "checksum_failures", "discarded_bytes", "dropped_frames")
+
+    def __init__(self, window=5.0, latency_samples=1024):
+        self.rates = RateWindow(window)
+        self.decode = LatencyWindow(latency_samples)
+        self.render = LatencyWindow(latency_samples)
+
+    def reset(self):
+        """Forget everything, e.g. when a new connection restarts the counters"""
+        self.rates.clear()
+        self.decode.clear()
+        self.render.clear()
+
+    def sample(self, now=None, **counters):
+        """Record the cumulative counters named in COUNTERS"""
+        self.rates.sample({name: counters.get(name, 0) for name in self.COUNTERS}, now)
+
+    def snapshot(self):
+        """Current totals, per-second rates and p50/p99 stage timings in µs"""
+        rates = self.rates
+        snapshot = {}
+        for name in self.COUNTERS:
+            snapshot[name] = rates.total(name)
+            snapshot[f"{name}_per_s"] = rates.rate(name)
+        for stage in ("decode", "render"):
+            window = getattr(self, stage)
+            snapshot[f"{stage}_p50_us"] = window.percentile(50)
+            snapshot[f"{stage}_p99_us"] = window.percentile(99)
+        return snapshot
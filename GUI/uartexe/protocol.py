@@ -0,0 +1,53 @@
+"""
+UART protocol constants and helpers
+Telemetry packets are 133 bytes: header, length, id, 128 data bytes and checksum
+Command packets are 37 bytes: header, length, id, control bytes and checksum
+"""
+
+# Telemetry packet layout
+HEADER_1 = 0x41
+HEADER_2 = 0x56
+PACKET_LENGTH = 0x85
+PACKET_ID = 0x02
+PACKET_SIZE = 133
+DATA_SIZE = 132
+
+HEADER = bytes((HEADER_1, HEADER_2))
+
+# Command packet layout
+COMMAND_SIZE = 37
+COMMAND_ID = 0x01
+
+# Byte 4: discrete input sense select
+SENSE_OPEN_GND = 0x00
+SENSE_OPEN_28V = 0x01
+
+# Bytes 6-7: one-shot SATA zeroize commands
+SATA_NONE = (0x00, 0x00)
+SATA_ZEROIZE_SATA1 = (0xAA, 0x55)
+SATA_ZEROIZE_BOTH = (0xBB, 0x44)
+
+# Byte 9: LED control bits
+LED_RED = 0b001
+LED_GREEN = 0b010
+LED_BLUE = 0b100
+
+
+def checksum(data):
+    """Two's complement checksum that makes the packet sum to 0 mod 256"""
+    return (-sum(data)) & 0xFF
+
+
+def build_command_packet(sense_select=SENSE_OPEN_GND, disc_out=0, sata_command=SATA_NONE, led=0):
+    """Build the 37-byte command packet; bytes 8 and 10-35 are reserved and left 0"""
+    packet = bytearray(COMMAND_SIZE)
+    packet[0] = HEADER_1
+    packet[1] = HEADER_2
+    packet[2] = COMMAND_SIZE
+    packet[3] = COMMAND_ID
+    packet[4] = sense_select
+    packet[5] = disc_out
+    packet[6], packet[7] = sata_command
+    packet[9] = led
+    packet[36] = checksum(packet[:36])
+    return packet
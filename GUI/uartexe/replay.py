@@ -0,0 +1,244 @@
+"""
+Capture replay source
+ReplaySerial plays a capture file back through the same calls the reader
+uses on serial.Serial (in_waiting, read, readinto, write, close), in real
+time, at N x speed or as fast as possible, with pause, step and seek.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from .capture import KIND_FRAME, KIND_RAW, PAYLOAD_SIZE
+from .capture_reader import CaptureReader
+
+# Speed value meaning "as fast as the consumer reads"
+MAX_SPEED = 0
+
+
+class ReplaySerial:
+    """serial.Serial stand-in that replays a capture file
+
+    Raw chunks are replayed when the capture has them, so framing errors
+    are reproduced as well; otherwise the recorded frames are replayed.
+    Sent commands are accepted and discarded.
+    """
+
+    # Records fetched per batch
+    BATCH_RECORDS = 256
+
+    def __init__(self, path, speed=1.0, timeout=0.1):
+        self.port = path
+        self.timeout = timeout
+        self.capture = CaptureReader(path)
+        self.is_open = True
+
+        # Raw recording is a per-capture setting, so the first block tells
+        first_block = self.capture.kinds[:self.capture.index_interval + 1]
+        self.kind = KIND_RAW if np.any(first_block == KIND_RAW) else KIND_FRAME
+
+        self._cond = threading.Condition()
+        self._pending = bytearray()
+        self._pending_pos = 0
+        self._cursor = 0
+        self._paused = False
+        self._steps = 0
+        self._speed = speed
+        self._clock_ts = self.capture.start_ns
+        self._clock_mono = time.monotonic_ns()
+
+        self.position_ns = self.capture.start_ns
+        self.records_played = 0
+        self.bytes_played = 0
+        self._started = time.monotonic()
+
+    # --- serial.Serial interface -------------------------------------------
+
+    @property
+    def in_waiting(self):
+        """Bytes that are due now and can be read without blocking"""
+        with self._cond:
+            self._fetch_due()
+            return len(self._pending) - self._pending_pos
+
+    def readinto(self, buffer):
+        """Wait up to timeout for due bytes, then copy as many as fit into buffer"""
+        with self._cond:
+            deadline = time.monotonic() + self.timeout
+            while self.is_open and not self._fetch_due():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return 0
+                self._cond.wait(min(remaining, self._wait_hint()))
+            if not self.is_open:
+                return 0
+
+            count = min(len(buffer), len(self._pending) - self._pending_pos)
+            buffer[:count] = self._pending[self._pending_pos:self._pending_pos + count]
+            self._pending_pos += count
+            self.bytes_played += count
+            return count
+
+    def read(self, size=1):
+        buffer = bytearray(size)
+        return bytes(buffer[:self.readinto(buffer)])
+
+    def write(self, data):
+        return len(data)
+
+    def reset_input_buffer(self):
+        with self._cond:
+            self._pending.clear()
+            self._pending_pos = 0
+
+    def close(self):
+        with self._cond:
+            if not self.is_open:
+                return
+            self.is_open = False
+            self._cond.notify_all()
+        self.capture.close()
+
+    # --- playback control --------------------------------------------------
+
+    @property
+    def speed(self):
+        return self._speed
+
+    @property
+    def paused(self):
+        return self._paused
+
+    @property
+    def at_end(self):
+        """True once every record has been delivered"""
+        with self._cond:
+            return (self._cursor >= len(self.capture)
+                    and self._pending_pos >= len(self._pending))
+
+    @property
+    def progress(self):
+        """Played fraction of the capture time span, 0.0 to 1.0"""
+        span = self.capture.end_ns - self.capture.start_ns
+        if span <= 0:
+            return 1.0 if self.at_end else 0.0
+        return (self.position_ns - self.capture.start_ns) / span
+
+    @property
+    def records_per_second(self):
+        """Average delivery rate since the replay started"""
+        elapsed = time.monotonic() - self._started
+        return self.records_played / elapsed if elapsed > 0 else 0.0
+
+    def set_speed(self, speed):
+        """Change the speed factor (MAX_SPEED for as fast as possible)"""
+        with self._cond:
+            self._rebase_clock()
+            self._speed = speed
+            self._cond.notify_all()
+
+    def pause(self):
+        with self._cond:
+            if not self._paused:
+                self._rebase_clock()
+                self._paused = True
+
+    def resume(self):
+        with self._cond:
+            if self._paused:
+                self._paused = False
+                self._steps = 0
+                self._clock_ts = self.position_ns
+                self._clock_mono = time.monotonic_ns()
+                self._cond.notify_all()
+
+    def step(self, count=1):
+        """Pause and release the next count records"""
+        with self._cond:
+            if not self._paused:
+                self._rebase_clock()
+                self._paused = True
+            self._steps += count
+            self._cond.notify_all()
+
+    def seek(self, timestamp_ns):
+        """Continue playback from the first record at or after timestamp_ns"""
+        with self._cond:
+            self._cursor = self.capture.seek(timestamp_ns)
+            self._pending.clear()
+            self._pending_pos = 0
+            self._steps = 0
+            self.position_ns = max(timestamp_ns, self.capture.start_ns)
+            self._clock_ts = self.position_ns
+            self._clock_mono = time.monotonic_ns()
+            self._cond.notify_all()
+
+    def seek_fraction(self, fraction):
+        """Seek to a fraction (0.0 to 1.0) of the capture time span"""
+        span = self.capture.end_ns - self.capture.start_ns
+        self.seek(self.capture.start_ns + int(span * min(max(fraction, 0.0), 1.0)))
+
+    # --- internals (caller holds the lock) ----------------------------------
+
+    def _due_ns(self):
+        """Capture time that playback has reached"""
+        if self._paused:
+            return self._clock_ts
+        if self._speed == MAX_SPEED:
+            return None
+        return self._clock_ts + int((time.monotonic_ns() - self._clock_mono) * self._speed)
+
+    def _rebase_clock(self):
+        due = self._due_ns()
+        self._clock_ts = self.position_ns if due is None else due
+        self._clock_mono = time.monotonic_ns()
+
+    def _wait_hint(self):
+        """Seconds until the next record is due, bounded to stay responsive"""
+        due = self._due_ns()
+        if self._paused or due is None or self._cursor >= len(self.capture):
+            return self.timeout
+        wait_ns = int(self.capture.timestamps[self._cursor]) - due
+        return min(max(wait_ns / self._speed / 1e9, 0.0005), self.timeout)
+
+    def _fetch_due(self):
+        """Move due records into the pending buffer; True if bytes are pending"""
+        if self._pending_pos < len(self._pending):
+            return True
+        capture = self.capture
+        while self.is_open and self._cursor < len(capture):
+            lo = self._cursor
+            hi = min(lo + self.BATCH_RECORDS, len(capture))
+            if self._paused:
+                if not self._steps:
+                    return False
+                selected = np.flatnonzero(capture.kinds[lo:hi] == self.kind)[:self._steps]
+                end = lo + int(selected[-1]) + 1 if len(selected) else hi
+                self._steps -= len(selected)
+            else:
+                due = self._due_ns()
+                end = hi if due is None else lo + int(
+                    np.searchsorted(capture.timestamps[lo:hi], due, side="right"))
+                if end == lo:
+                    return False
+
+            records = capture.records[lo:end]
+            records = records[records["kind"] == self.kind]
+            self._cursor = end
+            self.position_ns = int(capture.timestamps[end - 1])
+            if len(records):
+                self._fill_pending(records)
+                return True
+        return False
+
+    def _fill_pending(self, records):
+        """Concatenate the payloads of records into the pending buffer"""
+        lengths = records["length"]
+        if (lengths == PAYLOAD_SIZE).all():
+            self._pending = bytearray(records["payload"].tobytes())
+        else:
+            self._pending = bytearray(b"".join(
+                records["payload"][i, :length].tobytes() for i, length in enumerate(lengths)))
+        self._pending_pos = 0
+        self.records_played += len(records)
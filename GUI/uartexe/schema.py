@@ -0,0 +1,232 @@
+"""
+Declarative telemetry signal schema
+Every byte of the 132-byte telemetry frame is described once here and
+compiled at startup into per-index lookup arrays used by the decoders.
+Supporting a new board variant means editing SIGNALS, not the GUI.
+"""
+
+import math
+from collections import namedtuple
+
+from .protocol import DATA_SIZE, HEADER_1, HEADER_2, PACKET_ID, PACKET_LENGTH
+
+# Signal kinds
+RAW = "raw"                  # shown as hex only
+BITFIELD = "bitfield"        # shown as spaced binary, error_mask bits flag an error
+MEASUREMENT = "measurement"  # big-endian 16-bit pair, first byte carries the value
+TEMPERATURE = "temperature"  # 8-bit two's complement in °C
+
+# Spaced binary text of every byte value, e.g. "0b 0 0 0 0 0 0 0 1"
+BINARY_TEXT = tuple("0b " + " ".join(f"{value:08b}") for value in range(256))
+
+Signal = namedtuple(
+    "Signal",
+    ["index", "name", "kind", "width", "signed", "scale", "unit",
+     "min", "max", "error_mask", "hex_limits"],
+    defaults=[RAW, 1, False, 1.0, "", None, None, 0, False],
+)
+
+
+def _fixed(index, name, value):
+    """Header byte that must always equal value"""
+    return [Signal(index, name, min=value, max=value, hex_limits=True)]
+
+
+def _bits(index, name, error_mask=0):
+    """Status byte shown in binary; any bit in error_mask marks an error"""
+    return [Signal(index, name, BITFIELD, error_mask=error_mask)]
+
+
+def _pair(index, name, scale, unit, min=None, max=None, signed=True):
+    """Big-endian 16-bit measurement stored in index and index + 1"""
+    return [
+        Signal(index, f"{name}_1", MEASUREMENT, 2, signed, scale, unit, min, max),
+        Signal(index + 1, f"{name}_2"),
+    ]
+
+
+def _temp(index, name):
+    """TMP100 / GPU temperature byte"""
+    return [Signal(index, name, TEMPERATURE, signed=True, unit="°C", min=-45, max=105)]
+
+
+# LTC4281 / INA260 LSB weights; LTC4281 ADC codes are unsigned (12 V full scale is
+# 65535 * 0.254 mV = 16.6 V), INA260 codes are two's complement
+LTC4281_12V_VOLTAGE = 0.254e-3
+LTC4281_5V_VOLTAGE = 0.127e-3
+LTC4281_3V3_VOLTAGE = 0.0847e-3
+LTC4281_CURRENT = 0.305e-3
+LTC4281_12V_POWER = 5.08e-3
+LTC4281_5V_POWER = 2.54e-3
+LTC4281_3V3_POWER = 1.69e-3
+INA260_VOLTAGE = 1.25e-3
+INA260_CURRENT = 1.25e-3
+INA260_POWER = 10e-3
+
+SIGNALS = [
+    *_fixed(0, "HEADER_1", HEADER_1),
+    *_fixed(1, "HEADER_2", HEADER_2),
+    *_fixed(2, "LENGTH", PACKET_LENGTH),
+    *_fixed(3, "PACKET_ID", PACKET_ID),
+    Signal(4, "FPGA_VERSION"),
+    Signal(5, "FPGA_REVISION"),
+    *_bits(6, "I2C_ACK_STATUS_1", 0xFF),
+    *_bits(7, "I2C_ACK_STATUS_2", 0xFF),
+    *_bits(8, "I2C_ACK_STATUS_3", 0xFF),
+    *_bits(9, "I2C_ACK_STATUS_4", 0xFF),
+    *_bits(10, "I2C_ACK_STATUS_5", 0x3F),
+    *_bits(11, "UART_STATUS", 0x01),
+    *_bits(12, "CPU_STATUS", 0x01),
+    *_bits(13, "HSN_STATUS", 0x01),
+    *_bits(14, "SATA_STATUS", 0x0F),
+    *_bits(15, "USB_STATUS", 0x07),
+    *_bits(16, "JTAG_STATUS", 0x01),
+    *_bits(17, "GPU_STATUS_1", 0xFF),
+    *_bits(18, "GPU_STATUS_2", 0x01),
+    *_bits(19, "HDMI_STATUS", 0x01),
+    *_bits(20, "DISC_IN_STATUS"),
+    *_bits(21, "DISC_DISCREPANCY_CHECK", 0x1F),
+    *_bits(22, "DISC_OUT_BIT_STATUS"),
+    *_bits(23, "DISC_OUT_LB_FAIL_STATUS", 0x0F),
+    *_bits(24, "DISC_OUT_FAULT_STATUS", 0xFF),
+    *_bits(25, "LTC4281_CPU_12V_STATUS"),
+    *_pair(26, "LTC4281_CPU_VOLTAGE", LTC4281_12V_VOLTAGE, "V", 10.8, 13.2, signed=False),
+    *_pair(28, "LTC4281_CPU_CURRENT", LTC4281_CURRENT, "A", max=4, signed=False),
+    *_pair(30, "LTC4281_CPU_POWER", LTC4281_12V_POWER, "W", 0, 255, signed=False),
+    *_bits(32, "LTC4281_SATA0_3V3_STATUS"),
+    *_pair(33, "LTC4281_SATA0_3V3_VOLTAGE", LTC4281_3V3_VOLTAGE, "V", 2.97, 3.63, signed=False),
+    *_pair(35, "LTC4281_SATA0_3V3_CURRENT", LTC4281_CURRENT, "A", max=3, signed=False),
+    *_pair(37, "LTC4281_SATA0_3V3_POWER", LTC4281_3V3_POWER, "W", 0, 255, signed=False),
+    *_bits(39, "LTC4281_SATA1_3V3_STATUS"),
+    *_pair(40, "LTC4281_SATA1_3V3_VOLTAGE", LTC4281_3V3_VOLTAGE, "V", 2.97, 3.63, signed=False),
+    *_pair(42, "LTC4281_SATA1_3V3_CURRENT", LTC4281_CURRENT, "A", max=3, signed=False),
+    *_pair(44, "LTC4281_SATA1_3V3_POWER", LTC4281_3V3_POWER, "W", 0, 255, signed=False),
+    *_bits(46, "LTC4281_GPU_12V_STATUS"),
+    *_pair(47, "LTC4281_GPU_12V_VOLTAGE", LTC4281_12V_VOLTAGE, "V", 10.8, 13.2, signed=False),
+    *_pair(49, "LTC4281_GPU_12V_CURRENT", LTC4281_CURRENT, "A", max=4, signed=False),
+    *_pair(51, "LTC4281_GPU_12V_POWER", LTC4281_12V_POWER, "W", 0, 255, signed=False),
+    *_bits(53, "LTC4281_GPU_5V_STATUS"),
+    *_pair(54, "LTC4281_GPU_5V_VOLTAGE", LTC4281_5V_VOLTAGE, "V", 4.5, 5.5, signed=False),
+    *_pair(56, "LTC4281_GPU_5V_CURRENT", LTC4281_CURRENT, "A", max=2, signed=False),
+    *_pair(58, "LTC4281_GPU_5V_POWER", LTC4281_5V_POWER, "W", 0, 255, signed=False),
+    *_bits(60, "LTC4281_GPU_3V3_STATUS"),
+    *_pair(61, "LTC4281_GPU_3V3_VOLTAGE", LTC4281_3V3_VOLTAGE, "V", 2.97, 3.63, signed=False),
+    *_pair(63, "LTC4281_GPU_3V3_CURRENT", LTC4281_CURRENT, "A", max=2, signed=False),
+    *_pair(65, "LTC4281_GPU_3V3_POWER", LTC4281_3V3_POWER, "W", 0, 255, signed=False),
+    *_pair(67, "INA260_PWR_BOARD_27V_VOLTAGE", INA260_VOLTAGE, "V", 21.6, 26.4),
+    *_pair(69, "INA260_PWR_BOARD_27V_CURRENT", INA260_CURRENT, "A", 0, 255),
+    *_pair(71, "INA260_PWR_BOARD_27V_POWER", INA260_POWER, "W", 0, 255),
+    *_pair(73, "INA260_CPLD_3V3_VOLTAGE", INA260_VOLTAGE, "V", 2.97, 3.63),
+    *_pair(75, "INA260_CPLD_3V3_CURRENT", INA260_CURRENT, "A", max=1),
+    *_pair(77, "INA260_CPLD_3V3_POWER", INA260_POWER, "W", 0, 255),
+    *_temp(79, "TMP100_CPLD_TEMP"),
+    *_temp(80, "TMP100_GPU_TEMP"),
+    *_temp(81, "TMP100_CARRIER_TEMP"),
+    *_temp(82, "TMP100_PWR_REG_TEMP"),
+    *_temp(83, "TMP100_PWR_BOARD_TEMP"),
+    *_temp(84, "TMP100_IGLOO2_TEMP"),
+    *_temp(85, "GPU_TEMP"),
+    *(Signal(i, f"HSN_TRANS_DATA_{i - 85}") for i in range(86, 94)),
+    *(Signal(i, "RESERVED") for i in range(94, 128)),
+    *(Signal(i, "UART_LOOPBACK") for i in range(128, 132)),
+]
+
+
+class CompiledSchema:
+    """Per-index lookup arrays built from a list of Signal definitions"""
+
+    def __init__(self, signals, size=DATA_SIZE):
+        self.size = size
+        self.names = [f"DATA_{i}" for i in range(size)]
+        self.kind = [RAW] * size
+        self.signed = [False] * size
+        self.scale = [1.0] * size
+        self.unit = [""] * size
+        self.lo = [math.nan] * size   # NaN means "no limit"
+        self.hi = [math.nan] * size
+        self.error_mask = [0] * size
+        self.min_text = ["N/A"] * size
+        self.max_text = ["N/A"] * size
+        self.pair_partners = {}       # second byte index -> first byte index
+
+        for sig in signals:
+            i = sig.index
+            if not 0 <= i < size:
+                raise ValueError(f"Signal {sig.name} index {i} is outside the frame")
+            if sig.width == 2 and i + 1 >= size:
+                raise ValueError(f"Signal {sig.name} needs two bytes at index {i}")
+            self.names[i] = sig.name
+            self.kind[i] = sig.kind
+            self.signed[i] = sig.signed
+            self.scale[i] = sig.scale
+            self.unit[i] = sig.unit
+            self.error_mask[i] = sig.error_mask
+            if sig.min is not None:
+                self.lo[i] = sig.min
+                self.min_text[i] = f"0x{sig.min:02X}" if sig.hex_limits else str(sig.min)
+            if sig.max is not None:
+                self.hi[i] = sig.max
+                self.max_text[i] = f"0x{sig.max:02X}" if sig.hex_limits else str(sig.max)
+            if sig.width == 2:
+                self.pair_partners[i + 1] = i
+
+        self.measurement_indices = [i for i in range(size) if self.kind[i] == MEASUREMENT]
+        self.temperature_indices = [i for i in range(size) if self.kind[i] == TEMPERATURE]
+        self.bitfield_indices = [i for i in range(size) if self.kind[i] == BITFIELD]
+
+        # 256-entry error flag tables for bitfield bytes, shared by equal masks
+        self.bitfield_error = [None] * size
+        error_tables = {}
+        for i in self.bitfield_indices:
+            mask = self.error_mask[i]
+            if mask not in error_tables:
+                error_tables[mask] = tuple((value & mask) != 0 for value in range(256))
+            self.bitfield_error[i] = error_tables[mask]
+
+    def decode(self, index, frame):
+        """
+        Decode one index of a frame.
+        Returns (number, meaning text, is_error); number is what the limits apply to.
+        """
+        kind = self.kind[index]
+        value = frame[index]
+
+        if kind == MEASUREMENT:
+            raw = (value << 8) | frame[index + 1]
+            if self.signed[index] and raw > 32767:
+                raw -= 65536
+            number = raw * self.scale[index]
+            return number, f"{number:.3f} {self.unit[index]}", False
+
+        if kind == TEMPERATURE:
+            number = value - 256 if value > 127 else value
+            return number, f"{number}{self.unit[index]}", False
+
+        if kind == BITFIELD:
+            return value, BINARY_TEXT[value], self.bitfield_error[index][value]
+
+        return value, "N/A", False
+
+    def decode_frame(self, frame):
+        """Decode every index of a frame in one pass"""
+        decode = self.decode
+        return [decode(i, frame) for i in range(self.size)]
+
+    def limit_state(self, index, number):
+        """True if number is within the limits, False if outside, None if the index has no limits"""
+        lo = self.lo[index]
+        hi = self.hi[index]
+        has_lo = not math.isnan(lo)
+        has_hi = not math.isnan(hi)
+        if not has_lo and not has_hi:
+            return None
+        if has_lo and number < lo:
+            return False
+        if has_hi and number > hi:
+            return False
+        return True
+
+
+def compile_schema(signals=None):
+    """Compile a signal list (the built-in SIGNALS by default) into lookup arrays"""
+    return CompiledSchema(SIGNALS if signals is None else signals)
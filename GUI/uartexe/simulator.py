@@ -0,0 +1,289 @@
+"""
+Virtual FPGA telemetry simulator
+Opens a pseudo-terminal pair and streams valid telemetry frames on it with
+slowly varying V/I/P/temperature values, so the GUI and the headless tools
+can be exercised without hardware. Command packets written to the port are
+applied: DISC_OUT shows up in DISC_OUT_BIT_STATUS, SATA zeroize clears the
+SATA power status and the UART_LOOPBACK bytes echo the last command.
+
+    python -m uartexe.simulator --rate 50 --link /tmp/ttyUARTEXE
+"""
+
+import argparse
+import errno
+import math
+import os
+import random
+import select
+import signal
+import sys
+import time
+
+from . import protocol
+from .schema import compile_schema
+
+# Bits per byte on the wire with 8E1 framing: start, 8 data, parity, stop
+BITS_PER_BYTE = 11
+
+FPGA_VERSION = (0x03, 0x00)
+POWER_OK = 0x80
+# Power status bytes that report bit 7 set when the rail is up
+POWER_STATUS_INDICES = (25, 32, 39, 46, 53, 60)
+SATA0_STATUS = 32
+SATA1_STATUS = 39
+DISC_OUT_BIT_STATUS = 22
+LOOPBACK_START = 128
+
+# Nominal current for rails whose limit is only a placeholder
+DEFAULT_CURRENT_A = 1.0
+
+
+def link_frame_rate(baud):
+    """Highest frame rate the UART link can carry"""
+    return baud / BITS_PER_BYTE / protocol.PACKET_SIZE
+
+
+class CommandParser:
+    """Extracts valid 37-byte command packets from the bytes written to the port"""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self.invalid_packets = 0
+
+    def feed(self, data):
+        """Return the complete, valid command packets found so far"""
+        buf = self._buffer
+        buf += data
+        packets = []
+        while True:
+            start = buf.find(protocol.HEADER)
+            if start < 0:
+                del buf[:max(len(buf) - 1, 0)]
+                break
+            del buf[:start]
+            if len(buf) < protocol.COMMAND_SIZE:
+                break
+            packet = bytes(buf[:protocol.COMMAND_SIZE])
+            if (packet[2] == protocol.COMMAND_SIZE and packet[3] == protocol.COMMAND_ID
+                    and sum(packet) & 0xFF == 0):
+                packets.append(packet)
+                del buf[:protocol.COMMAND_SIZE]
+            else:
+                self.invalid_packets += 1
+                del buf[:1]
+        return packets
+
+
+class FrameGenerator:
+    """Builds realistic telemetry frames and tracks the commanded state"""
+
+    def __init__(self, schema=None, seed=None):
+        self.schema = schema or compile_schema()
+        self._random = random.Random(seed)
+        self.sense_select = protocol.SENSE_OPEN_GND
+        self.disc_out = 0
+        self.led = 0
+        self.commands_received = 0
+        self.zeroized = set()
+
+        self._template = bytearray(protocol.PACKET_SIZE)
+        self._template[0:4] = (protocol.HEADER_1, protocol.HEADER_2,
+                               protocol.PACKET_LENGTH, protocol.PACKET_ID)
+        self._template[4:6] = FPGA_VERSION
+        for i in POWER_STATUS_INDICES:
+            self._template[i] = POWER_OK
+
+        # Per measurement: (index, nominal value, relative variation, phase, period s)
+        self._channels = []
+        rails = {}
+        for i in self.schema.measurement_indices:
+            name = self.schema.names[i]
+            rail, quantity = name.rsplit("_", 2)[0], name.rsplit("_", 2)[1]
+            rails.setdefault(rail, {})[quantity] = i
+        for quantities in rails.values():
+            volts = self._nominal(quantities.get("VOLTAGE"), 0.5)
+            amps = self._nominal(quantities.get("CURRENT"), 0.4)
+            for quantity, nominal, variation in (("VOLTAGE", volts, 0.01),
+                                                 ("CURRENT", amps, 0.15),
+                                                 ("POWER", volts * amps, 0.15)):
+                if quantity in quantities:
+                    self._channels.append((quantities[quantity], nominal, variation,
+                                           self._random.uniform(0, 2 * math.pi),
+                                           self._random.uniform(20, 120)))
+        self._temperatures = [(i, self._random.uniform(35, 55), self._random.uniform(0, 2 * math.pi))
+                              for i in self.schema.temperature_indices]
+
+    def _nominal(self, index, fraction):
+        """Typical value of a measurement: inside its limits, fraction of the way up"""
+        if index is None:
+            return 0.0
+        lo, hi = self.schema.lo[index], self.schema.hi[index]
+        lo = 0.0 if math.isnan(lo) else lo
+        if math.isnan(hi) or hi > 100:
+            return DEFAULT_CURRENT_A if lo == 0 else lo
+        return lo + (hi - lo) * fraction
+
+    def apply_command(self, packet):
+        """Reflect a command packet in the following frames"""
+        self.commands_received += 1
+        self.sense_select = packet[4]
+        self.disc_out = packet[5]
+        self.led = packet[9]
+        sata = (packet[6], packet[7])
+        if sata == protocol.SATA_ZEROIZE_SATA1:
+            self.zeroized.add(SATA1_STATUS)
+        elif sata == protocol.SATA_ZEROIZE_BOTH:
+            self.zeroized.update((SATA0_STATUS, SATA1_STATUS))
+
+    def frame(self, t):
+        """Telemetry frame for time t in seconds"""
+        frame = bytearray(self._template)
+        gauss = self._random.gauss
+        schema = self.schema
+
+        for index, nominal, variation, phase, period in self._channels:
+            value = nominal * (1 + variation * math.sin(2 * math.pi * t / period + phase)
+                               + gauss(0, variation / 10))
+            # Register value as the ADC would report it; decoding is left to the schema
+            raw = max(-32768, min(65535, round(value / schema.scale[index])))
+            frame[index:index + 2] = (raw & 0xFFFF).to_bytes(2, "big")
+
+        for index, nominal, phase in self._temperatures:
+            value = round(nominal + 3 * math.sin(2 * math.pi * t / 600 + phase) + gauss(0, 0.3))
+            frame[index] = value & 0xFF
+
+        for index in self.zeroized:
+            frame[index] &= ~POWER_OK & 0xFF
+        frame[DISC_OUT_BIT_STATUS] = self.disc_out & 0x0F
+        frame[LOOPBACK_START:LOOPBACK_START + 4] = (self.sense_select, self.disc_out, self.led,
+                                                    self.commands_received & 0xFF)
+        frame[protocol.PACKET_SIZE - 1] = protocol.checksum(frame[:protocol.PACKET_SIZE - 1])
+        return frame
+
+
+class PtySimulator:
+    """Streams generated frames on the master side of a pseudo-terminal"""
+
+    # Frames allowed to queue up while nobody reads the port
+    MAX_BACKLOG_FRAMES = 64
+
+    def __init__(self, rate, generator=None, link=None):
+        import tty  # POSIX only, like os.openpty
+
+        self.rate = rate
+        self.generator = generator or FrameGenerator()
+        self.parser = CommandParser()
+        self.master, self._slave = os.openpty()
+        tty.setraw(self._slave)
+        os.set_blocking(self.master, False)
+        self.port = os.ttyname(self._slave)
+        self.link = link
+        if link:
+            if os.path.islink(link):
+                os.unlink(link)
+            os.symlink(self.port, link)
+
+        self._backlog = bytearray()
+        self._running = False
+        self.frames_sent = 0
+        self.frames_dropped = 0
+
+    def stop(self):
+        self._running = False
+
+    def close(self):
+        if self.link and os.path.islink(self.link):
+            os.unlink(self.link)
+        os.close(self.master)
+        os.close(self._slave)
+
+    def run(self, duration=None):
+        """Emit frames at the configured rate until stopped or duration seconds pass"""
+        period = 1.0 / self.rate
+        started = time.monotonic()
+        next_frame = started
+        self._running = True
+
+        while self._running:
+            now = time.monotonic()
+            if duration is not None and now - started >= duration:
+                break
+            if now >= next_frame:
+                self._send(self.generator.frame(now - started))
+                next_frame += period
+                if now - next_frame > period:
+                    next_frame = now  # fell behind; do not burst to catch up
+                continue
+
+            wait_write = [self.master] if self._backlog else []
+            readable, writable, _ = select.select([self.master], wait_write, [], next_frame - now)
+            if readable:
+                self._receive()
+            if writable:
+                self._flush()
+
+    def _send(self, frame):
+        if len(self._backlog) >= self.MAX_BACKLOG_FRAMES * protocol.PACKET_SIZE:
+            self.frames_dropped += 1
+            return
+        self._backlog += frame
+        self.frames_sent += 1
+        self._flush()
+
+    def _flush(self):
+        try:
+            written = os.write(self.master, self._backlog)
+        except BlockingIOError:
+            return
+        del self._backlog[:written]
+
+    def _receive(self):
+        try:
+            data = os.read(self.master, 4096)
+        except OSError as e:
+            if e.errno in (errno.EAGAIN, errno.EIO):
+                return
+            raise
+        for packet in self.parser.feed(data):
+            self.generator.apply_command(packet)
+            print(f"Command: {packet.hex(' ').upper()}", file=sys.stderr)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m uartexe.simulator",
+        description="Stream simulated UARTEXE telemetry on a pseudo-terminal.")
+    parser.add_argument("--rate", default="20",
+                        help="frames per second, or 'max' for the link limit (default 20)")
+    parser.add_argument("--baud", type=int, default=115200,
+                        help="link baud rate used by --rate max (default 115200)")
+    parser.add_argument("--link", help="create a symlink to the pty at this path")
+    parser.add_argument("--duration", type=float, help="stop after this many seconds")
+    parser.add_argument("--seed", type=int, help="random seed for repeatable values")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    rate = link_frame_rate(args.baud) if args.rate == "max" else float(args.rate)
+    if rate <= 0:
+        print("uartexe: --rate must be positive", file=sys.stderr)
+        return 1
+
+    simulator = PtySimulator(rate, FrameGenerator(seed=args.seed), args.link)
+    print(f"uartexe: simulating on {args.link or simulator.port} at {rate:.1f} frames/s",
+          file=sys.stderr)
+    signal.signal(signal.SIGTERM, lambda signum, frame: simulator.stop())
+    try:
+        simulator.run(args.duration)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator.close()
+        print(f"uartexe: sent={simulator.frames_sent} dropped={simulator.frames_dropped} "
+              f"commands={simulator.generator.commands_received}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""
+Streaming per-signal statistics
+Keeps count, min, max, mean and standard deviation of every decoded
+V/I/P and temperature channel for the whole session and for sliding time
+windows. Each update takes a block of frames and works on all channels at
+once: the block's moments are computed with numpy and merged into the
+running Welford state, so the cost per frame does not grow with the session.
+
+Sliding windows are rings of fixed-width time buckets; a window's result is
+the merge of the buckets that are younger than the window.
+"""
+
+import csv
+import threading
+
+import numpy as np
+
+from .decode import ChannelDecoder, as_frames
+
+# Sliding windows as (label, seconds)
+WINDOWS = (("1 s", 1), ("1 min", 60), ("10 min", 600))
+SESSION = "SESSION"
+
+# Time buckets per sliding window; the window edge moves in steps of window / BUCKETS
+BUCKETS = 60
+
+STATS = ("count", "min", "max", "mean", "std")
+
+
+def _block_moments(values):
+    """count, mean, M2, min, max of an (N, channels) block"""
+    mean = values.mean(axis=0)
+    deviation = values - mean
+    return len(values), mean, np.einsum("ij,ij->j", deviation, deviation), values.min(axis=0), values.max(axis=0)
+
+
+def _merge(n_a, mean_a, m2_a, n_b, mean_b, m2_b):
+    """Chan et al. parallel Welford merge of two (count, mean, M2) states"""
+    n = n_a + n_b
+    delta = mean_b - mean_a
+    mean = mean_a + delta * (n_b / n)
+    m2 = m2_a + m2_b + delta * delta * (n_a * n_b / n)
+    return n, mean, m2
+
+
+def _result(n, mean, m2, low, high):
+    """Public statistics dict; std is the sample standard deviation, NaN below two samples"""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        std = np.sqrt(m2 / (n - 1)) if n > 1 else np.full_like(mean, np.nan)
+    return {"count": int(n), "min": low, "max": high, "mean": mean, "std": std}
+
+
+class RunningStats:
+    """Session count/mean/M2/min/max per channel"""
+
+    def __init__(self, channels):
+        self.channels = channels
+        self.clear()
+
+    def clear(self):
+        self.n = 0
+        self.mean = np.zeros(self.channels)
+        self.m2 = np.zeros(self.channels)
+        self.min = np.full(self.channels, np.nan)
+        self.max = np.full(self.channels, np.nan)
+
+    def add(self, n, mean, m2, low, high):
+        if not self.n:
+            self.n, self.mean, self.m2 = n, mean.copy(), m2.copy()
+            self.min, self.max = low.copy(), high.copy()
+            return
+        self.n, self.mean, self.m2 = _merge(self.n, self.mean, self.m2, n, mean, m2)
+        np.minimum(self.min, low, out=self.min)
+        np.maximum(self.max, high, out=self.max)
+
+    def result(self):
+        if not self.n:
+            return _result(0, np.full(self.channels, np.nan), self.m2, self.min, self.max)
+        return _result(self.n, self.mean, self.m2, self.min.copy(), self.max.copy())
+
+
+class WindowStats:
+    """Statistics of the last seconds, kept as a ring of time buckets"""
+
+    def __init__(self, seconds, channels, buckets=BUCKETS):
+        self.seconds = seconds
+        self.width_ns = int(seconds * 1e9) // buckets
+        self.buckets = buckets
+        self.n = np.zeros(buckets, dtype=np.int64)
+        self.bucket = np.full(buckets, -1, dtype=np.int64)  # absolute bucket number per slot
+        self.mean = np.zeros((buckets, channels))
+        self.m2 = np.zeros((buckets, channels))
+        self.min = np.full((buckets, channels), np.nan)
+        self.max = np.full((buckets, channels), np.nan)
+
+    def clear(self):
+        self.n[:] = 0
+        self.bucket[:] = -1
+
+    def add(self, timestamp_ns, n, mean, m2, low, high):
+        number = timestamp_ns // self.width_ns
+        slot = number % self.buckets
+        if self.bucket[slot] != number:
+            self.bucket[slot] = number
+            self.n[slot] = n
+            self.mean[slot], self.m2[slot] = mean, m2
+            self.min[slot], self.max[slot] = low, high
+            return
+        self.n[slot], self.mean[slot], self.m2[slot] = _merge(
+            self.n[slot], self.mean[slot], self.m2[slot], n, mean, m2)
+        np.minimum(self.min[slot], low, out=self.min[slot])
+        np.maximum(self.max[slot], high, out=self.max[slot])
+
+    def result(self, now_ns):
+        """Merge of every bucket inside the window ending at now_ns"""
+        live = (self.bucket > now_ns // self.width_ns - self.buckets) & (self.n > 0)
+        n = int(self.n[live].sum())
+        channels = self.mean.shape[1]
+        if not n:
+            empty = np.full(channels, np.nan)
+            return _result(0, empty, empty, empty, empty)
+        weights = self.n[live, None]
+        means = self.mean[live]
+        mean = (weights * means).sum(axis=0) / n
+        m2 = self.m2[live].sum(axis=0) + (weights * (means - mean) ** 2).sum(axis=0)
+        return _result(n, mean, m2, self.min[live].min(axis=0), self.max[live].max(axis=0))
+
+
+class SignalStatistics:
+    """Session and sliding-window statistics of every V/I/P and temperature channel
+
+    update() is called by the reader thread and snapshot() by the GUI, so
+    state is guarded by a lock.
+    """
+
+    def __init__(self, schema, windows=WINDOWS):
+        self.decoder = ChannelDecoder(schema)
+        self.names = self.decoder.names
+        self.units = self.decoder.units
+        channels = len(self.names)
+
+        self._lock = threading.Lock()
+        self.session = RunningStats(channels)
+        self.windows = {label: WindowStats(seconds, channels) for label, seconds in windows}
+        self.last_ns = None
+
+    @property
+    def scopes(self):
+        return [SESSION, *self.windows]
+
+    def values(self, frames):
+        """(N, channels) physical values: V/I/P measurements then temperatures in °C"""
+        frames = as_frames(frames)
+        return self.decoder.decode(frames.reshape(-1, frames.shape[-1]))
+
+    def update(self, frames, timestamp_ns):
+        """Add a block of frames received at timestamp_ns"""
+        values = self.values(frames)
+        if not len(values):
+            return
+        moments = _block_moments(values)
+        with self._lock:
+            self.last_ns = timestamp_ns
+            self.session.add(*moments)
+            for window in self.windows.values():
+                window.add(timestamp_ns, *moments)
+
+    def reset(self):
+        with self._lock:
+            self.session.clear()
+            for window in self.windows.values():
+                window.clear()
+            self.last_ns = None
+
+    def snapshot(self, now_ns=None):
+        """{scope: {"count", "min", "max", "mean", "std"}}, arrays in channel order"""
+        with self._lock:
+            now_ns = self.last_ns if now_ns is None else now_ns
+            snapshot = {SESSION: self.session.result()}
+            for label, window in self.windows.items():
+                snapshot[label] = window.result(now_ns if now_ns is not None else 0)
+            return snapshot
+
+    def export_csv(self, path, now_ns=None):
+        """One row per channel and scope: signal, unit, scope, count, min, max, mean, std"""
+        snapshot = self.snapshot(now_ns)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["signal", "unit", "scope", *STATS])
+            for scope, result in snapshot.items():
+                for channel, (name, unit) in enumerate(zip(self.names, self.units)):
+                    writer.writerow([name, unit, scope, result["count"],
+                                     *(f"{result[stat][channel]:.6g}" for stat in STATS[1:])])
@@ -0,0 +1,206 @@
+"""
+Frame timing
+Every frame is stamped with time.monotonic_ns() right after the read that
+delivered its last byte, moved back by the line time of the bytes that
+followed it in the same read. FrameTiming turns those stamps into a streaming
+inter-arrival histogram with log-spaced bins, exact min/mean/max, and gap
+detection for frames the board should have sent but did not.
+"""
+
+import json
+import math
+import threading
+import time
+from collections import deque
+
+# Log-spaced histogram: BINS_PER_DECADE bins from MIN_INTERVAL_NS to MAX_INTERVAL_NS,
+# plus an underflow bin (frames completed by the same read) and an overflow bin
+BINS_PER_DECADE = 100  # about 2.3 % per bin
+MIN_INTERVAL_NS = 10_000  # 10 µs
+MAX_INTERVAL_NS = 10_000_000_000  # 10 s
+
+# An interval longer than GAP_FACTOR nominal periods opens a gap; the frames
+# missed are settled GAP_SETTLE intervals later, after bunched frames have paid it back
+GAP_FACTOR = 1.5
+GAP_SETTLE = 8
+
+# Intervals needed before the nominal period is estimated from the histogram
+MIN_PERIOD_SAMPLES = 16
+PERIOD_UPDATE_INTERVAL = 256
+
+
+def byte_time_ns(port):
+    """Line time of one byte on port: start, data, parity and stop bits at its baud rate; 0 if unknown"""
+    baudrate = getattr(port, "baudrate", None)
+    if not baudrate:
+        return 0
+    parity = 0 if getattr(port, "parity", "N") == "N" else 1
+    bits = 1 + getattr(port, "bytesize", 8) + parity + getattr(port, "stopbits", 1)
+    return int(bits * 1e9 / baudrate)
+
+
+class FrameTiming:
+    """Streaming inter-arrival statistics of frame timestamps
+
+    add() is called by the reader thread and snapshot()/report() by the GUI,
+    so state is guarded by a lock. Without expected_period_ns the nominal
+    period is the mean interval, re-estimated every few hundred frames; unlike
+    the histogram median it is not thrown off by reads that bunch frames.
+
+    A late read delivers a long interval followed by short ones, so a long
+    interval only opens a gap: the intervals after it pay it back, and if half
+    a period or more is still unpaid GAP_SETTLE intervals later, the unpaid
+    time in periods, rounded half up, is counted as missed frames.
+    """
+
+    def __init__(self, expected_period_ns=None, gap_factor=GAP_FACTOR, gaps=256):
+        self.expected_period_ns = expected_period_ns
+        self.gap_factor = gap_factor
+        self._lock = threading.Lock()
+
+        decades = math.log10(MAX_INTERVAL_NS / MIN_INTERVAL_NS)
+        self._bins = int(round(decades * BINS_PER_DECADE))
+        # edges[k] is the upper edge of bin k; bin 0 is the underflow bin
+        self.edges_ns = [MIN_INTERVAL_NS * 10 ** (k / BINS_PER_DECADE) for k in range(self._bins + 1)]
+        self.gaps = deque(maxlen=gaps)  # (timestamp_ns, interval_ns, missed frames)
+        self.reset()
+
+    def reset(self):
+        """Forget every timestamp"""
+        with self._lock:
+            self.histogram = [0] * (self._bins + 2)
+            self.first_ns = None
+            self.last_ns = None
+            self.frames = 0
+            self.intervals = 0
+            self.min_ns = None
+            self.max_ns = 0
+            self.total_ns = 0
+            self.total_sq = 0.0
+            self.gap_count = 0
+            self.missed_frames = 0
+            self.gaps.clear()
+            self._gap = None  # open gap: [timestamp_ns, interval_ns, unpaid ns, intervals since]
+            self._period_ns = self.expected_period_ns
+            self._next_period_update = MIN_PERIOD_SAMPLES
+
+    def add(self, timestamp_ns):
+        """Account one frame stamped at timestamp_ns"""
+        with self._lock:
+            self.frames += 1
+            last, self.last_ns = self.last_ns, timestamp_ns
+            if last is None:
+                self.first_ns = timestamp_ns
+                return
+            interval = timestamp_ns - last
+            self.intervals += 1
+            self.histogram[self._bin(interval)] += 1
+            self.total_ns += interval
+            self.total_sq += interval * interval
+            if self.min_ns is None or interval < self.min_ns:
+                self.min_ns = interval
+            if interval > self.max_ns:
+                self.max_ns = interval
+
+            if self.expected_period_ns is None and self.intervals >= self._next_period_update:
+                self._period_ns = self.total_ns / self.intervals
+                self._next_period_update = self.intervals + PERIOD_UPDATE_INTERVAL
+            period = self._period_ns
+            if not period:
+                return
+            gap = self._gap
+            if gap is not None:
+                if interval <= self.gap_factor * period:
+                    gap[2] += interval - period
+                    gap[3] += 1
+                    if gap[2] < period / 2:
+                        self._gap = None  # paid back: the frames were late, not lost
+                    elif gap[3] >= GAP_SETTLE:
+                        self._settle_gap(period)
+                    return
+                self._settle_gap(period)
+            if interval > self.gap_factor * period:
+                self._gap = [timestamp_ns, interval, interval - period, 0]
+
+    def _settle_gap(self, period):
+        """Count the open gap with the frames the intervals after it did not make up for"""
+        timestamp_ns, interval, unpaid, _ = self._gap
+        self._gap = None
+        # Rounded half up, matching the payback check that drops a gap under half a period
+        missed = int(unpaid / period + 0.5)
+        if missed >= 1:
+            self.gap_count += 1
+            self.missed_frames += missed
+            self.gaps.append((timestamp_ns, interval, missed))
+
+    def _bin(self, interval):
+        if interval < MIN_INTERVAL_NS:
+            return 0
+        if interval >= MAX_INTERVAL_NS:
+            return self._bins + 1
+        return 1 + int(math.log10(interval / MIN_INTERVAL_NS) * BINS_PER_DECADE)
+
+    def _bin_range(self, k):
+        """(low, high) interval in ns covered by histogram bin k"""
+        if k == 0:
+            return 0, MIN_INTERVAL_NS
+        if k > self._bins:
+            return MAX_INTERVAL_NS, math.inf
+        return self.edges_ns[k - 1], self.edges_ns[k]
+
+    def _percentile_ns(self, p):
+        """Nearest-rank percentile, reported as the geometric centre of its bin and clamped to min/max"""
+        if not self.intervals:
+            return 0
+        rank = max(1, math.ceil(p / 100 * self.intervals))
+        seen = 0
+        for k, count in enumerate(self.histogram):
+            seen += count
+            if seen >= rank:
+                low, high = self._bin_range(k)
+                centre = math.sqrt(low * high) if low and high != math.inf else (low or high)
+                return min(max(centre, self.min_ns), self.max_ns)
+        return self.max_ns
+
+    def snapshot(self):
+        """Summary in ms: min/mean/std/p50/p99/max interval, nominal period and gap counts"""
+        with self._lock:
+            n = self.intervals
+            mean = self.total_ns / n if n else 0.0
+            variance = max(0.0, self.total_sq / n - mean * mean) if n else 0.0
+            return {
+                "frames": self.frames,
+                "intervals": n,
+                "min_ms": (self.min_ns or 0) / 1e6,
+                "mean_ms": mean / 1e6,
+                "std_ms": math.sqrt(variance) / 1e6,
+                "p50_ms": self._percentile_ns(50) / 1e6,
+                "p99_ms": self._percentile_ns(99) / 1e6,
+                "max_ms": self.max_ns / 1e6,
+                "period_ms": (self._period_ns or 0) / 1e6,
+                "gaps": self.gap_count,
+                "missed_frames": self.missed_frames,
+                "duration_s": (self.last_ns - self.first_ns) / 1e9 if n else 0.0,
+            }
+
+    def histogram_bins(self):
+        """Non-empty bins as (low ms, high ms, count)"""
+        with self._lock:
+            return [(*(edge / 1e6 for edge in self._bin_range(k)), count)
+                    for k, count in enumerate(self.histogram) if count]
+
+    def report(self):
+        """Snapshot, histogram and recent gaps, ready for JSON"""
+        report = self.snapshot()
+        report["histogram"] = [{"low_ms": low, "high_ms": None if high == math.inf else high, "count": count}
+                               for low, high, count in self.histogram_bins()]
+        with self._lock:
+            report["recent_gaps"] = [{"timestamp_ns": ts, "interval_ms": interval / 1e6, "missed": missed}
+                                     for ts, interval, missed in self.gaps]
+        report["exported"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+        return report
+
+    def export(self, path):
+        """Write report() to path as JSON"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
@@ -0,0 +1,133 @@
+"""
+Background command transmitter
+Control changes (sense select, DISC_OUT, LED) made within a short window
+are coalesced into one command packet carrying the latest state. One-shot
+SATA zeroize commands are queued in order and each gets its own packet.
+All writes happen on a worker thread, so a slow port never blocks the caller.
+"""
+
+import threading
+import time
+from collections import deque
+
+from . import protocol
+from .metrics import LatencyWindow
+
+
+class CommandTransmitter:
+    """Worker thread that builds and writes command packets
+
+    on_sent(packet, timestamp_ns) and on_error(message) are called on the
+    worker thread after each write.
+    """
+
+    COALESCE_WINDOW = 0.05  # seconds
+
+    def __init__(self, port, coalesce_window=COALESCE_WINDOW, on_sent=None, on_error=None):
+        self.port = port
+        self.coalesce_window = coalesce_window
+        self.on_sent = on_sent
+        self.on_error = on_error
+
+        self._cond = threading.Condition()
+        self._controls = (protocol.SENSE_OPEN_GND, 0, 0)
+        self._dirty = False
+        self._due = 0.0
+        self._zeroizes = deque()
+        self._closed = False
+
+        self.changes_submitted = 0
+        self.changes_coalesced = 0
+        self.packets_sent = 0
+        self.zeroizes_sent = 0
+        self.write_errors = 0
+        self.max_depth = 0
+        self.write_times = LatencyWindow()  # µs per write
+        self.max_write_us = 0.0
+
+        self._thread = threading.Thread(target=self._run, name="CommandTransmitter", daemon=True)
+        self._thread.start()
+
+    @property
+    def depth(self):
+        """Packets waiting to be written"""
+        with self._cond:
+            return len(self._zeroizes) + (1 if self._dirty else 0)
+
+    def set_controls(self, sense_select, disc_out, led):
+        """Request the given control state; sent once the coalescing window closes"""
+        with self._cond:
+            if self._closed:
+                return
+            self.changes_submitted += 1
+            self._controls = (sense_select, disc_out, led)
+            if self._dirty:
+                self.changes_coalesced += 1
+            else:
+                self._dirty = True
+                self._due = time.monotonic() + self.coalesce_window
+            self._update_depth()
+            self._cond.notify()
+
+    def zeroize(self, sata_command):
+        """Queue a one-shot SATA zeroize command; it is sent right away in its own packet"""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Transmitter is closed")
+            self._zeroizes.append(sata_command)
+            self._update_depth()
+            self._cond.notify()
+
+    def close(self, timeout=1.0):
+        """Stop the worker after any queued zeroize commands; pending control changes are dropped"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    def _update_depth(self):
+        self.max_depth = max(self.max_depth, len(self._zeroizes) + (1 if self._dirty else 0))
+
+    def _next_packet(self):
+        """Wait for the next packet to send; None once closed and drained"""
+        with self._cond:
+            while True:
+                if self._zeroizes:
+                    sata = self._zeroizes.popleft()
+                    self.zeroizes_sent += 1
+                    break
+                if self._closed:
+                    return None
+                if self._dirty:
+                    remaining = self._due - time.monotonic()
+                    if remaining <= 0:
+                        sata = protocol.SATA_NONE
+                        break
+                    self._cond.wait(remaining)
+                else:
+                    self._cond.wait()
+            # Every packet carries the latest control state, so it satisfies a pending change
+            self._dirty = False
+            sense_select, disc_out, led = self._controls
+            return protocol.build_command_packet(sense_select, disc_out, sata, led)
+
+    def _run(self):
+        while True:
+            packet = self._next_packet()
+            if packet is None:
+                return
+            started = time.perf_counter_ns()
+            try:
+                self.port.write(packet)
+            except Exception as e:
+                self.write_errors += 1
+                if self.on_error is not None:
+                    self.on_error(str(e))
+                continue
+            sent_ns = time.monotonic_ns()
+            write_us = (time.perf_counter_ns() - started) / 1000
+            self.write_times.add(write_us)
+            self.max_write_us = max(self.max_write_us, write_us)
+            self.packets_sent += 1
+            if self.on_sent is not None:
+                self.on_sent(packet, sent_ns)
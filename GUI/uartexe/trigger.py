@@ -0,0 +1,333 @@
+"""
+Triggered captures
+Keeps the last frames in a preallocated ring of PACKET_SIZE-byte rows with
+their receive timestamps, like the pre-trigger memory of an oscilloscope.
+A trigger (a status bit edge, a raised limit alarm or a burst of checksum
+failures) freezes the frames from pre_s before it to post_s after it and
+writes them to a capture file, with a JSON sidecar describing the trigger.
+
+Memory is fixed at construction: blocks of frames are copied straight into
+the ring, and a finished window is copied once into a second buffer of the
+same size that a writer thread saves from.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from .alarms import RAISE
+from .capture import CaptureWriter
+from .protocol import PACKET_SIZE
+
+# Edge directions of the status bit (bit 7 of the status byte)
+RISING = "RISING"
+FALLING = "FALLING"
+STATUS_BIT = 0x80
+
+# (label, telemetry index, edge); PMON bit 7 clears on POWER FAIL
+STATUS_TRIGGERS = (("PMON POWER FAIL", 25, FALLING),)
+
+# Trigger sources
+STATUS = "STATUS"
+ALARM = "ALARM"
+CHECKSUM = "CHECKSUM"
+
+CAPACITY = 8192  # frames; 10 s at about 800 frames/s (921600 baud)
+PRE_S = 5.0
+POST_S = 2.0
+
+# Checksum failures within the window that count as a burst
+CHECKSUM_BURST = 5
+CHECKSUM_WINDOW_S = 1.0
+
+# Triggers kept per capture in the sidecar, captures kept for the GUI
+TRIGGERS_PER_CAPTURE = 64
+CAPTURES = 100
+
+
+class TriggerCapture:
+    """Pre/post-trigger ring buffer that writes a capture around every trigger
+
+    update() is called by the reader thread with each block of frames; the GUI
+    calls snapshot(), poll() and flush(), so every public method holds the lock. The
+    writer thread only takes the job condition, which is always acquired after
+    the lock. A finished window is copied into a second preallocated buffer and
+    written by a writer thread, so the reader never waits on the disk; a window
+    finished while the previous one is still being written is dropped and counted.
+    Triggers arriving while a capture is still collecting its post-trigger
+    frames are listed in that capture instead of starting a new one.
+    """
+
+    def __init__(self, directory, pre_s=PRE_S, post_s=POST_S, capacity=CAPACITY,
+                 status_triggers=STATUS_TRIGGERS, on_alarm=True,
+                 checksum_burst=CHECKSUM_BURST, checksum_window_s=CHECKSUM_WINDOW_S):
+        self.directory = directory
+        self.pre_ns = int(pre_s * 1e9)
+        self.post_ns = int(post_s * 1e9)
+        self.capacity = capacity
+        self.on_alarm = on_alarm
+        self.checksum_burst = checksum_burst
+        self.checksum_window_ns = int(checksum_window_s * 1e9)
+
+        self.status_labels = [label for label, _, _ in status_triggers]
+        self.status_indices = np.array([index for _, index, _ in status_triggers], dtype=np.intp)
+        self.status_rising = np.array([edge == RISING for _, _, edge in status_triggers], dtype=bool)
+
+        self._buffer = bytearray(capacity * PACKET_SIZE)
+        self._view = memoryview(self._buffer)
+        self._ring = np.frombuffer(self._buffer, dtype=np.uint8).reshape(capacity, PACKET_SIZE)
+        self._timestamps = np.zeros(capacity, dtype=np.int64)
+        # Frozen copy of a finished window, written out by the writer thread
+        self._frozen_buffer = bytearray(capacity * PACKET_SIZE)
+        self._frozen_view = memoryview(self._frozen_buffer)
+        self._frozen = np.frombuffer(self._frozen_buffer, dtype=np.uint8).reshape(capacity, PACKET_SIZE)
+        self._frozen_timestamps = np.zeros(capacity, dtype=np.int64)
+        self._lock = threading.Lock()
+        self.captures = deque(maxlen=CAPTURES)
+        self.reset()
+
+        self._job_ready = threading.Condition()
+        self._job = None  # capture being written from the frozen copy
+        self._closed = False
+        self._thread = threading.Thread(target=self._write_loop, name="trigger-writer", daemon=True)
+        self._thread.start()
+
+    def reset(self):
+        """Empty the ring and drop a capture in progress; written captures are kept"""
+        with self._lock:
+            self.sequence = 0  # frames ever stored; the newest is at (sequence - 1) % capacity
+            self._status = None  # status bits of the last frame
+            self._checksum_failures = None
+            self._burst_start_ns = 0
+            self._burst_count = 0
+            self._pending = None  # capture collecting post-trigger frames
+            self.triggers = 0
+            self.write_errors = 0
+            self.captures_dropped = 0
+
+    def update(self, frames, timestamp_ns, checksum_failures=None, alarm_events=()):
+        """Store a block of frames received at timestamp_ns and check the triggers
+
+        checksum_failures is the framer's running failure count and
+        alarm_events the events AlarmEngine.update() returned for this block.
+        """
+        with self._lock:
+            if not self._closed:
+                self._update(frames, timestamp_ns, checksum_failures, alarm_events)
+
+    def poll(self, timestamp_ns):
+        """Write a capture whose post-trigger window ended before timestamp_ns
+
+        A POWER FAIL is often followed by a silent link, so the owner calls this
+        periodically instead of waiting for the next update().
+        """
+        with self._lock:
+            if not self._closed:
+                self._expire(timestamp_ns)
+
+    def _expire(self, timestamp_ns):
+        pending = self._pending
+        if pending is not None and timestamp_ns > pending["trigger_ns"] + self.post_ns:
+            self._finish()
+
+    def _update(self, frames, timestamp_ns, checksum_failures, alarm_events):
+        self._expire(timestamp_ns)
+
+        data = np.frombuffer(frames, dtype=np.uint8)
+        count = min(len(data) // PACKET_SIZE, self.capacity)
+        if count:
+            self._store(data, timestamp_ns)
+            if len(self.status_indices):
+                self._check_status(self.sequence - count, count, timestamp_ns)
+        if self.on_alarm:
+            for event in alarm_events:
+                if event.kind == RAISE:
+                    self._trigger(ALARM, f"{event.name} {event.side}", timestamp_ns, self.sequence - 1)
+        if self.checksum_burst and checksum_failures is not None:
+            self._check_checksums(checksum_failures, timestamp_ns)
+
+    def _store(self, data, timestamp_ns):
+        """Copy a block of frames into the ring, keeping only the newest capacity of them"""
+        count = len(data) // PACKET_SIZE
+        if count > self.capacity:
+            data = data[(count - self.capacity) * PACKET_SIZE:]
+            self.sequence += count - self.capacity
+            count = self.capacity
+        rows = data.reshape(count, PACKET_SIZE)
+        start = self.sequence % self.capacity
+        head = min(count, self.capacity - start)
+        self._ring[start:start + head] = rows[:head]
+        self._timestamps[start:start + head] = timestamp_ns
+        if head < count:
+            self._ring[:count - head] = rows[head:]
+            self._timestamps[:count - head] = timestamp_ns
+        self.sequence += count
+
+    def _check_status(self, first, count, timestamp_ns):
+        """Trigger on every configured status bit edge in the newest count frames"""
+        start = first % self.capacity
+        if start + count <= self.capacity:
+            bits = self._ring[start:start + count, self.status_indices] & STATUS_BIT != 0
+        else:
+            rows = np.arange(first, first + count) % self.capacity
+            bits = self._ring[np.ix_(rows, self.status_indices)] & STATUS_BIT != 0
+        previous = self._status
+        self._status = bits[-1].copy()
+        if previous is None:
+            if count == 1:
+                return
+            previous, bits, first = bits[0], bits[1:], first + 1
+        before = np.vstack((previous, bits[:-1]))
+        edges = np.where(self.status_rising, bits & ~before, before & ~bits)
+        if not edges.any():
+            return
+        for row, column in zip(*np.nonzero(edges)):
+            self._trigger(STATUS, self.status_labels[column], timestamp_ns, first + int(row))
+
+    def _check_checksums(self, failures, timestamp_ns):
+        last, self._checksum_failures = self._checksum_failures, failures
+        if last is None or failures <= last:
+            return
+        if timestamp_ns - self._burst_start_ns > self.checksum_window_ns:
+            self._burst_start_ns = timestamp_ns
+            self._burst_count = 0
+        self._burst_count += failures - last
+        if self._burst_count >= self.checksum_burst:
+            self._trigger(CHECKSUM, f"{self._burst_count} checksum failures", timestamp_ns,
+                          self.sequence - 1)
+            self._burst_count = 0
+            self._burst_start_ns = timestamp_ns
+
+    def _trigger(self, source, label, timestamp_ns, frame):
+        self.triggers += 1
+        pending = self._pending
+        if pending is not None:
+            if len(pending["triggers"]) < TRIGGERS_PER_CAPTURE:
+                pending["triggers"].append((source, label, timestamp_ns, frame))
+            return
+        self._pending = {
+            "source": source,
+            "label": label,
+            "trigger_ns": timestamp_ns,
+            "trigger_frame": frame,
+            "start": self._first_since(timestamp_ns - self.pre_ns),
+            "triggers": [(source, label, timestamp_ns, frame)],
+        }
+
+    def _first_since(self, timestamp_ns):
+        """Sequence number of the oldest stored frame received at or after timestamp_ns"""
+        oldest = max(0, self.sequence - self.capacity)
+        start = oldest % self.capacity
+        # The ring holds [start:] then [:start] in arrival order, both sorted by time
+        if self.sequence <= self.capacity:
+            return int(np.searchsorted(self._timestamps[:self.sequence], timestamp_ns))
+        older = self._timestamps[start:]
+        position = int(np.searchsorted(older, timestamp_ns))
+        if position < len(older):
+            return oldest + position
+        return oldest + len(older) + int(np.searchsorted(self._timestamps[:start], timestamp_ns))
+
+    def flush(self):
+        """Write a capture in progress now, with whatever post-trigger frames it has, and wait for it"""
+        with self._lock:
+            if self._pending is not None:
+                with self._job_ready:
+                    self._job_ready.wait_for(lambda: self._job is None)
+                self._finish()
+        with self._job_ready:
+            self._job_ready.wait_for(lambda: self._job is None)
+
+    def close(self):
+        """Flush and stop the writer thread"""
+        self.flush()
+        with self._job_ready:
+            self._closed = True
+            self._job_ready.notify_all()
+        self._thread.join()
+
+    def _finish(self):
+        """Freeze the window of the pending capture and hand it to the writer thread"""
+        pending, self._pending = self._pending, None
+        end = self.sequence
+        start = max(pending["start"], end - self.capacity, 0)
+        with self._job_ready:
+            if self._job is not None:
+                # The writer is still busy with the previous capture; the frozen copy is in use
+                self.captures_dropped += 1
+                print(f"Triggered capture dropped ({pending['label']}): previous capture still being written")
+                return
+            count = end - start
+            first = start % self.capacity
+            head = min(count, self.capacity - first)
+            self._frozen[:head] = self._ring[first:first + head]
+            self._frozen_timestamps[:head] = self._timestamps[first:first + head]
+            if head < count:
+                self._frozen[head:count] = self._ring[:count - head]
+                self._frozen_timestamps[head:count] = self._timestamps[:count - head]
+
+            label = re.sub(r"[^A-Za-z0-9]+", "_", pending["label"]).strip("_")
+            now = time.time()
+            name = time.strftime("trigger_%Y%m%d_%H%M%S", time.localtime(now)) + f"{int(now * 1000) % 1000:03d}_{label}"
+            self._job = {
+                "path": os.path.join(self.directory, name + ".uxcap"),
+                "source": pending["source"],
+                "label": pending["label"],
+                "trigger_ns": pending["trigger_ns"],
+                # The trigger frame may be gone already when the ring overran the window
+                "trigger_frame": max(pending["trigger_frame"] - start, 0),
+                "frames": count,
+                "truncated": start > pending["start"],
+                "triggers": [{"source": source, "label": label, "timestamp_ns": ts, "frame": max(frame - start, 0)}
+                             for source, label, ts, frame in pending["triggers"]],
+            }
+            self._job_ready.notify_all()
+
+    def _write_loop(self):
+        """Writer thread: write each frozen window and its sidecar off the reader thread"""
+        while True:
+            with self._job_ready:
+                self._job_ready.wait_for(lambda: self._job is not None or self._closed)
+                if self._job is None:
+                    return
+                capture = self._job
+            self._write(capture)
+            with self._job_ready:
+                self._job = None
+                self._job_ready.notify_all()
+
+    def _write(self, capture):
+        path = capture["path"]
+        try:
+            with CaptureWriter(path) as writer:
+                for row in range(capture["frames"]):
+                    offset = row * PACKET_SIZE
+                    writer.write_frame(self._frozen_view[offset:offset + PACKET_SIZE],
+                                       int(self._frozen_timestamps[row]))
+            with open(os.path.splitext(path)[0] + ".json", "w", encoding="utf-8") as f:
+                json.dump(capture, f, indent=2)
+        except OSError as e:
+            with self._job_ready:
+                self.write_errors += 1
+            print(f"Triggered capture error: {e}")
+            return
+        with self._job_ready:
+            self.captures.append(capture)
+        print(f"Triggered capture ({capture['label']}): {capture['frames']} frames to {path}")
+
+    def snapshot(self):
+        """Trigger counts, ring fill and the finished captures, newest last"""
+        with self._lock, self._job_ready:
+            return {
+                "triggers": self.triggers,
+                "stored": min(self.sequence, self.capacity),
+                "capacity": self.capacity,
+                "collecting": self._pending is not None,
+                "write_errors": self.write_errors,
+                "captures_dropped": self.captures_dropped,
+                "captures": list(self.captures),
+            }